@@ -41,6 +41,7 @@ logger = logging.getLogger(__name__)
 def create_app(
     superset_config_module: Optional[str] = None,
     superset_app_root: Optional[str] = None,
+    worker: bool = False,
 ) -> Flask:
     app = SupersetApp(__name__)
 
@@ -66,6 +67,7 @@ def create_app(
                 app.config["APPLICATION_ROOT"] = app_root
 
         app_initializer = app.config.get("APP_INITIALIZER", SupersetAppInitializer)(app)
+        app_initializer.worker = worker
         app_initializer.init_app()
 
         return app
@@ -30,12 +30,15 @@ from typing import Any, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
+from flask import current_app
 from flask_babel import gettext as __
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.extensions import event_logger
+from superset.utils import csv, excel
 from superset.utils.core import (
     extract_dataframe_dtypes,
+    GenericDataType,
     get_column_names,
     get_metric_names,
 )
@@ -61,6 +64,169 @@ def get_column_key(label: tuple[str, ...], metrics: list[str]) -> tuple[Any, ...
     return tuple(parts)
 
 
+def get_rollup_groups(index: pd.MultiIndex) -> list[np.ndarray]:
+    """
+    Group the labels of an index by each of their prefixes.
+
+    Returns, for each level ``n``, the group of every label when grouping them by
+    their first ``n`` levels. Groups are numbered in order, and are made of
+    consecutive labels sharing the same prefix.
+    """
+    codes = np.array(index.codes)
+    starts = np.zeros(len(index) - 1, dtype=bool)
+    groups = []
+    for level in range(index.nlevels):
+        if level > 0:
+            starts |= codes[level - 1, 1:] != codes[level - 1, :-1]
+        groups.append(np.concatenate([[0], np.cumsum(starts)]))
+    return groups
+
+
+def get_subtotal_labels(
+    index: pd.MultiIndex,
+    groups: list[np.ndarray],
+    metric_name: str,
+) -> tuple[list[tuple[Any, ...]], np.ndarray]:
+    """
+    Compute the labels and positions of the subtotals of every group.
+
+    Each subtotal goes after the last label of its group, and subtotals of deeper
+    groups go before the ones of their parents. Returns the subtotal labels, in
+    the order of ``groups``, and the order in which the original labels followed by
+    the subtotals should be arranged.
+    """
+    labels: list[tuple[Any, ...]] = []
+    positions = [np.arange(len(index))]
+    ranks = [np.zeros(len(index), dtype=int)]
+    for level, group in enumerate(groups):
+        last = np.flatnonzero(np.append(group[1:] != group[:-1], True))
+        total = metric_name if level == 0 else __("Subtotal")
+        depth = index.nlevels - level - 1
+        labels.extend((*label[:level], total, *([""] * depth)) for label in index[last])
+        positions.append(last)
+        ranks.append(np.full(len(last), index.nlevels - level))
+
+    order = np.lexsort((np.concatenate(ranks), np.concatenate(positions)))
+    return labels, order
+
+
+def add_column_subtotals(
+    df: pd.DataFrame,
+    aggfunc: str,
+    metric_name: str,
+) -> pd.DataFrame:
+    """
+    Add a subtotal column for each group of columns, and a column with the total.
+
+    When possible, the subtotals of each level are computed in a single grouped
+    aggregation instead of aggregating every group separately.
+    """
+    if df.columns.empty:
+        return df
+
+    groups = get_rollup_groups(df.columns)
+    labels, order = get_subtotal_labels(df.columns, groups, metric_name)
+
+    method = pivot_v2_groupby_aggfunc_map.get(aggfunc)
+    is_integer = np.array([dtype.kind == "i" for dtype in df.dtypes])
+    vectorize = method is not None and all(dtype.kind in "iuf" for dtype in df.dtypes)
+
+    subtotals = []
+    for group in groups:
+        if vectorize:
+            subtotal = df.T.groupby(group).agg(method).T
+            if method in {"sum", "min", "max"}:
+                # aggregating integer columns should not produce floats, which
+                # happens when the transposed dataframe has mixed types
+                all_integer = pd.Series(is_integer).groupby(group).all()
+                for i in np.flatnonzero(all_integer):
+                    subtotal[i] = subtotal[i].astype(np.int64)
+        else:
+            subtotal = pd.concat(
+                [
+                    pivot_v2_aggfunc_map[aggfunc](df.iloc[:, group == i], axis=1)
+                    for i in range(group[-1] + 1)
+                ],
+                axis=1,
+            )
+        subtotals.append(subtotal)
+
+    subtotals_df = pd.concat(subtotals, axis=1)
+    subtotals_df.columns = pd.MultiIndex.from_tuples(labels, names=df.columns.names)
+    return pd.concat([df, subtotals_df], axis=1).iloc[:, order]
+
+
+def coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the object columns of a dataframe to numbers, invalid values become NaN.
+
+    All the object columns are converted at once, instead of one by one.
+    """
+    is_object = np.array([dtype.kind == "O" for dtype in df.dtypes], dtype=bool)
+    if not is_object.any():
+        return df
+
+    objects = np.flatnonzero(is_object)
+    others = np.flatnonzero(~is_object)
+    values = pd.to_numeric(df.iloc[:, objects].to_numpy().ravel(), errors="coerce")
+    numeric_df = pd.concat(
+        [
+            df.iloc[:, others],
+            pd.DataFrame(
+                values.reshape(len(df.index), len(objects)),
+                index=df.index,
+                columns=df.columns[objects],
+            ),
+        ],
+        axis=1,
+    )
+    return numeric_df.iloc[:, np.argsort(np.concatenate([others, objects]))]
+
+
+def add_row_subtotals(
+    df: pd.DataFrame,
+    aggfunc: str,
+    metric_name: str,
+) -> pd.DataFrame:
+    """
+    Add a subtotal row for each group of rows, and a row with the total.
+
+    Values are converted to numbers before being aggregated. When possible, the
+    subtotals of each level are computed in a single grouped aggregation instead of
+    aggregating every group separately.
+    """
+    if df.index.empty:
+        return df
+
+    groups = get_rollup_groups(df.index)
+    labels, order = get_subtotal_labels(df.index, groups, metric_name)
+
+    numeric_df = coerce_numeric(df)
+    method = pivot_v2_groupby_aggfunc_map.get(aggfunc)
+
+    subtotals = []
+    for group in groups:
+        if method is not None:
+            subtotals.append(numeric_df.groupby(group).agg(method).to_numpy())
+        else:
+            subtotals.append(
+                np.array(
+                    [
+                        pivot_v2_aggfunc_map[aggfunc](numeric_df[group == i], axis=0)
+                        for i in range(group[-1] + 1)
+                    ]
+                )
+            )
+
+    # like the rows of the dataframe, every subtotal row has a single type
+    subtotals_df = pd.DataFrame(
+        np.concatenate(subtotals),
+        index=pd.MultiIndex.from_tuples(labels),
+        columns=df.columns,
+    )
+    return pd.concat([df, subtotals_df]).iloc[order]
+
+
 def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches  # noqa: C901
     df: pd.DataFrame,
     rows: list[str],
@@ -96,7 +262,11 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
             index=rows,
             columns=columns,
             values=metrics,
-            aggfunc=pivot_v2_aggfunc_map[aggfunc],
+            # prefer the name of the aggregation, so pandas doesn't call the
+            # function for every group
+            aggfunc=pivot_v2_groupby_aggfunc_map.get(
+                aggfunc, pivot_v2_aggfunc_map[aggfunc]
+            ),
             margins=False,
         )
     else:
@@ -153,59 +323,20 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
         df.columns = pd.MultiIndex.from_tuples([(str(i),) for i in df.columns])
 
     if show_rows_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.columns
+        # add subtotal for each group and overall total
         if not apply_metrics_on_rows:
-            for col in df.columns:
-                # we need to replace the temporary placeholder with either a string
-                # or np.nan, depending on the column type so that they can sum correctly
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    df[col].replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-                else:
-                    df[col].replace("SUPERSET_PANDAS_NAN", "nan", inplace=True)
+            # we need to replace the temporary placeholder in non-numeric columns
+            # with a string so that they can sum correctly
+            df.replace("SUPERSET_PANDAS_NAN", "nan", inplace=True)
         else:
             # when we applied metrics on rows, we switched the columns and rows
             # so checking column type doesn't apply. Replace everything with np.nan
             df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-        for level in range(df.columns.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.columns.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
-                depth = df.columns.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal_name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert column after subgroup
-                df.insert(int(slice_.stop), subtotal_name, subtotal)
+        df = add_column_subtotals(df, aggfunc, metric_name)
 
     if rows and show_columns_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.index
-        for level in range(df.index.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                try:
-                    slice_ = df.index.get_loc(subgroup)
-                except Exception:  # pylint: disable=broad-except
-                    logger.exception(
-                        "Error getting location for subgroup %s from %s",
-                        subgroup,
-                        groups,
-                    )
-                    raise
-
-                subtotal = pivot_v2_aggfunc_map[aggfunc](
-                    df.iloc[slice_, :].apply(pd.to_numeric, errors="coerce"), axis=0
-                )
-                depth = groups.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal.name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert row after subgroup
-                df = pd.concat(
-                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
-                )
+        # add subtotal for each group and overall total
+        df = add_row_subtotals(df, aggfunc, metric_name)
 
     # if we want to apply the metrics on the rows we need to pivot the
     # dataframe back
@@ -253,6 +384,22 @@ pivot_v2_aggfunc_map = {
     "Count as Fraction of Columns": pd.Series.count,
 }
 
+# aggregations with a vectorized groupby implementation in pandas
+pivot_v2_groupby_aggfunc_map = {
+    "Count": "count",
+    "Sum": "sum",
+    "Average": "mean",
+    "Median": "median",
+    "Minimum": "min",
+    "Maximum": "max",
+    "Sum as Fraction of Total": "sum",
+    "Sum as Fraction of Rows": "sum",
+    "Sum as Fraction of Columns": "sum",
+    "Count as Fraction of Total": "count",
+    "Count as Fraction of Rows": "count",
+    "Count as Fraction of Columns": "count",
+}
+
 
 def pivot_table_v2(
     df: pd.DataFrame,
@@ -308,6 +455,60 @@ post_processors = {
 }
 
 
+def format_csv_datetimes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Format the temporal columns of a dataframe as strings, the way they are written
+    to CSV, so that the dimension labels match the ones of CSV reports parsed back
+    from the query results (e.g. ``2020-01-01`` rather than ``2020-01-01 00:00:00``).
+    """
+    date_format = current_app.config["CSV_EXPORT"].get("date_format")
+    for column in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        values = df[column]
+        formatted = (
+            values.dt.strftime(date_format) if date_format else values.astype(str)
+        )
+        df[column] = formatted.where(values.notna())
+    return df
+
+
+def format_processed_df(
+    df: pd.DataFrame,
+    result_format: ChartDataResultFormat,
+    coltypes: list[GenericDataType],
+    index: bool = False,
+) -> Any:
+    """
+    Format a post-processed dataframe into the requested result format.
+    """
+    if result_format == ChartDataResultFormat.JSON:
+        return df.to_dict()
+    if result_format == ChartDataResultFormat.CSV:
+        # the index labels are made from dimension values, so they need to be
+        # escaped like the headers and the values
+        if index:
+            df.index = [
+                csv.escape_value(label) if isinstance(label, str) else label
+                for label in df.index
+            ]
+        return csv.df_to_escaped_csv(
+            df, index=index, **current_app.config["CSV_EXPORT"]
+        )
+    excel.apply_column_types(df, coltypes)
+    return excel.df_to_excel(df, index=index, **current_app.config["EXCEL_EXPORT"])
+
+
+def format_deferred_results(result: dict[Any, Any]) -> dict[Any, Any]:
+    """
+    Format queries whose dataframe was kept for post-processing, as is.
+    """
+    for query in result.get("queries", []):
+        if "df" in query:
+            df = query.pop("df")
+            query["data"] = result["query_context"].get_data(df, query["coltypes"])
+
+    return result
+
+
 @event_logger.log_this
 def apply_client_processing(  # noqa: C901
     result: dict[Any, Any],
@@ -318,7 +519,7 @@ def apply_client_processing(  # noqa: C901
 
     viz_type = form_data.get("viz_type")
     if viz_type not in post_processors:
-        return result
+        return format_deferred_results(result)
 
     post_processor = post_processors[viz_type]
 
@@ -328,19 +529,29 @@ def apply_client_processing(  # noqa: C901
                 f"Result format {query['result_format']} not supported"
             )
 
-        data = query["data"]
+        if "df" in query:
+            # the results were not formatted yet, so operate on the dataframe
+            # directly instead of parsing it back from the serialized data
+            df = query.pop("df")
+            if df.empty:
+                query["data"] = result["query_context"].get_data(df, query["coltypes"])
+                continue
+            if query["result_format"] == ChartDataResultFormat.CSV:
+                df = format_csv_datetimes(df)
+        else:
+            data = query["data"]
 
-        if isinstance(data, str):
-            data = data.strip()
+            if isinstance(data, str):
+                data = data.strip()
 
-        if not data:
-            # do not try to process empty data
-            continue
+            if not data:
+                # do not try to process empty data
+                continue
 
-        if query["result_format"] == ChartDataResultFormat.JSON:
-            df = pd.DataFrame.from_dict(data)
-        elif query["result_format"] == ChartDataResultFormat.CSV:
-            df = pd.read_csv(StringIO(data))
+            if query["result_format"] == ChartDataResultFormat.JSON:
+                df = pd.DataFrame.from_dict(data)
+            elif query["result_format"] == ChartDataResultFormat.CSV:
+                df = pd.read_csv(StringIO(data))
 
         # convert all columns to verbose (label) name
         if datasource:
@@ -376,12 +587,11 @@ def apply_client_processing(  # noqa: C901
             for index in processed_df.index
         ]
 
-        if query["result_format"] == ChartDataResultFormat.JSON:
-            query["data"] = processed_df.to_dict()
-        elif query["result_format"] == ChartDataResultFormat.CSV:
-            buf = StringIO()
-            processed_df.to_csv(buf, index=show_default_index)
-            buf.seek(0)
-            query["data"] = buf.getvalue()
+        query["data"] = format_processed_df(
+            processed_df,
+            query["result_format"],
+            query["coltypes"],
+            index=show_default_index,
+        )
 
     return result
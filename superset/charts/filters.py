@@ -26,6 +26,10 @@ from superset.connectors.sqla import models
 from superset.connectors.sqla.models import SqlaTable
 from superset.models.core import FavStar
 from superset.models.slice import Slice
+from superset.security.access_index import (
+    can_use_dataset_access_index,
+    get_accessible_dataset_ids,
+)
 from superset.tags.filters import BaseTagIdFilter, BaseTagNameFilter
 from superset.utils.core import get_user_id
 from superset.utils.filters import get_dataset_access_filters
@@ -104,6 +108,11 @@ class ChartFilter(BaseFilter):  # pylint: disable=too-few-public-methods
         if security_manager.can_access_all_datasources():
             return query
 
+        if can_use_dataset_access_index() and (
+            dataset_ids := get_accessible_dataset_ids()
+        ) is not None:
+            return query.filter(self.model.datasource_id.in_(dataset_ids))
+
         table_alias = aliased(SqlaTable)
         query = query.join(table_alias, self.model.datasource_id == table_alias.id)
         query = query.join(
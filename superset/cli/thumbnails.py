@@ -15,10 +15,16 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Optional, Union
 
 import click
+from celery.backends.base import DisabledBackend
 from celery.utils.abstract import CallableTask
+from flask import current_app
 from flask.cli import with_appcontext
 
 from superset.extensions import db
@@ -26,6 +32,128 @@ from superset.extensions import db
 logger = logging.getLogger(__name__)
 
 
+def _load_state(state_file: Optional[str]) -> set[str]:
+    """
+    Return the thumbnails processed by a previous run of an interrupted backfill.
+    """
+    if not state_file or not Path(state_file).exists():
+        return set()
+    return set(Path(state_file).read_text().split())
+
+
+def _save_state(state_file: Optional[str], processed: list[str]) -> None:
+    if state_file:
+        with open(state_file, "a") as state:
+            state.write("".join(f"{key}\n" for key in processed))
+
+
+def _is_fresh(friendly_type: str, model: Any) -> bool:
+    """
+    Return whether the thumbnail of a chart or dashboard is cached for its current
+    digest, computing the digest as the thumbnail task does.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset import security_manager
+    from superset.tasks.exceptions import ExecutorNotFoundError
+    from superset.tasks.utils import get_executor
+    from superset.utils.core import override_user
+    from superset.utils.screenshots import (
+        ChartScreenshot,
+        DashboardScreenshot,
+        StatusValues,
+    )
+    from superset.utils.urls import get_url_path
+
+    try:
+        _, username = get_executor(
+            executors=current_app.config["THUMBNAIL_EXECUTORS"],
+            model=model,
+            current_user=None,
+        )
+    except ExecutorNotFoundError:
+        return False
+
+    with override_user(security_manager.find_user(username)):
+        if friendly_type == "chart":
+            url = get_url_path("Superset.slice", slice_id=model.id)
+            screenshot = ChartScreenshot(url, model.digest)
+        else:
+            url = get_url_path("Superset.dashboard", dashboard_id_or_slug=model.id)
+            screenshot = DashboardScreenshot(url, model.digest)
+
+    if screenshot.digest is None:
+        return False
+    payload = screenshot.get_from_cache_key(screenshot.get_cache_key())
+    return payload is not None and payload.status == StatusValues.UPDATED
+
+
+class _Progress:
+    """
+    Report the throughput and ETA of a backfill, holding it to a rate limit.
+    """
+
+    def __init__(self, friendly_type: str, count: int, rate_limit: float) -> None:
+        self.friendly_type = friendly_type
+        self.count = count
+        self.rate_limit = rate_limit
+        self.start = time.monotonic()
+        self.done = 0
+        self.skipped = 0
+
+    def update(self, done: int) -> None:
+        self.done += done
+        elapsed = time.monotonic() - self.start
+        if (
+            done
+            and self.rate_limit
+            and (delay := self.done * 60 / self.rate_limit - elapsed) > 0
+        ):
+            time.sleep(delay)
+            elapsed += delay
+
+        remaining = self.count - self.done - self.skipped
+        throughput = self.done / elapsed if elapsed else 0
+        eta = timedelta(seconds=round(remaining / throughput)) if throughput else None
+        click.secho(
+            f"{self.done + self.skipped}/{self.count} {self.friendly_type}s, "
+            f"{self.skipped} up to date, {throughput * 60:.1f} per minute, "
+            f"ETA {eta or 'unknown'}",
+            fg="blue",
+        )
+
+
+def _run_wave(
+    compute_func: CallableTask,
+    model_ids: list[int],
+    asynchronous: bool,
+    kwargs: dict[str, Any],
+) -> None:
+    """
+    Compute the thumbnails of a wave of charts or dashboards, returning once they are
+    all computed.
+    """
+    if asynchronous:
+        results = [compute_func.delay(None, id_, **kwargs) for id_ in model_ids]
+        # without a result backend the tasks can't be awaited, so waves are only
+        # spaced out by the rate limit
+        if not isinstance(compute_func.backend, DisabledBackend):
+            for result in results:
+                result.get(propagate=False)
+        return
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+
+    def compute(id_: int) -> None:
+        with app.app_context():
+            compute_func(None, id_, **kwargs)
+
+    if len(model_ids) == 1:
+        compute_func(None, model_ids[0], **kwargs)
+        return
+    with ThreadPoolExecutor(max_workers=len(model_ids)) as executor:
+        list(executor.map(compute, model_ids))
+
+
 @click.command()
 @with_appcontext
 @click.option(
@@ -56,12 +184,43 @@ logger = logging.getLogger(__name__)
     default=False,
     help="Force refresh, even if previously cached",
 )
+@click.option(
+    "--if_data_changed",
+    "-u",
+    is_flag=True,
+    default=False,
+    help="Refresh thumbnails whose query results changed since they were cached",
+)
+@click.option(
+    "--concurrency",
+    "-n",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of thumbnails computed at the same time",
+)
+@click.option(
+    "--rate_limit",
+    "-r",
+    default=0.0,
+    type=click.FloatRange(min=0),
+    help="Maximum number of thumbnails computed per minute, 0 for no limit",
+)
+@click.option(
+    "--state_file",
+    "-s",
+    type=click.Path(dir_okay=False),
+    help="File keeping track of the processed thumbnails, to resume interrupted runs",
+)
 @click.option("--model_id", "-i", multiple=True)
-def compute_thumbnails(
+def compute_thumbnails(  # pylint: disable=too-many-arguments
     asynchronous: bool,
     dashboards_only: bool,
     charts_only: bool,
     force: bool,
+    if_data_changed: bool,
+    concurrency: int,
+    rate_limit: float,
+    state_file: Optional[str],
     model_id: list[int],
 ) -> None:
     """Compute thumbnails"""
@@ -73,6 +232,11 @@ def compute_thumbnails(
         cache_dashboard_thumbnail,
     )
 
+    kwargs: dict[str, Any] = {"force": force or if_data_changed}
+    if if_data_changed:
+        kwargs["if_data_changed"] = True
+    processed = _load_state(state_file)
+
     def compute_generic_thumbnail(
         friendly_type: str,
         model_cls: Union[type[Dashboard], type[Slice]],
@@ -82,18 +246,33 @@ def compute_thumbnails(
         query = db.session.query(model_cls)
         if model_ids:
             query = query.filter(model_cls.id.in_(model_ids))
-        dashboards = query.all()
-        count = len(dashboards)
-        for i, model in enumerate(dashboards):
-            if asynchronous:
-                func = compute_func.delay
-                action = "Triggering"
-            else:
-                func = compute_func
-                action = "Processing"
-            msg = f'{action} {friendly_type} "{model}" ({i + 1}/{count})'
-            click.secho(msg, fg="green")
-            func(None, model.id, force=force)
+        models = [
+            model
+            for model in query.all()
+            if f"{friendly_type}:{model.id}" not in processed
+        ]
+        count = len(models)
+        action = "Triggering" if asynchronous else "Processing"
+        progress = _Progress(friendly_type, count, rate_limit)
+        for i in range(0, count, concurrency):
+            wave = []
+            for j, model in enumerate(models[i : i + concurrency], start=i + 1):
+                if not kwargs["force"] and _is_fresh(friendly_type, model):
+                    progress.skipped += 1
+                    continue
+                msg = f'{action} {friendly_type} "{model}" ({j}/{count})'
+                click.secho(msg, fg="green")
+                wave.append(model.id)
+            if wave:
+                _run_wave(compute_func, wave, asynchronous, kwargs)
+            _save_state(
+                state_file,
+                [
+                    f"{friendly_type}:{model.id}"
+                    for model in models[i : i + concurrency]
+                ],
+            )
+            progress.update(len(wave))
 
     if not charts_only:
         compute_generic_thumbnail(
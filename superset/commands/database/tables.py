@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from typing import Any, cast
 
 from sqlalchemy.orm import lazyload, load_only
@@ -29,6 +30,11 @@ from superset.commands.database.exceptions import (
 )
 from superset.connectors.sqla.models import SqlaTable
 from superset.daos.database import DatabaseDAO
+from superset.databases.catalog_index import (
+    CatalogIndexMatch,
+    get_catalog_index,
+    search_catalog_index,
+)
 from superset.exceptions import SupersetException
 from superset.extensions import db, security_manager
 from superset.models.core import Database
@@ -146,3 +152,67 @@ class TablesDatabaseCommand(BaseCommand):
         self._model = cast(Database, DatabaseDAO.find_by_id(self._db_id))
         if not self._model:
             raise DatabaseNotFoundError()
+
+
+class SearchTablesDatabaseCommand(BaseCommand):
+    """
+    Search tables and views by name across all the schemas of a database, using its
+    catalog index instead of inspecting the database.
+    """
+
+    _model: Database
+
+    def __init__(self, db_id: int, query: str, limit: int):
+        self._db_id = db_id
+        self._query = query
+        self._limit = limit
+
+    def run(self) -> dict[str, Any]:
+        self.validate()
+        index = get_catalog_index(self._model)
+        if index is None:
+            return {"count": 0, "result": [], "refreshed_at": None}
+
+        try:
+            matches = search_catalog_index(index, self._query)
+
+            matches_by_schema: dict[tuple[str | None, str], list[CatalogIndexMatch]] = (
+                defaultdict(list)
+            )
+            for match in matches:
+                matches_by_schema[(match["catalog"], match["schema"])].append(match)
+
+            accessible: set[DatasourceName] = set()
+            for (catalog, schema), schema_matches in matches_by_schema.items():
+                accessible.update(
+                    security_manager.get_datasources_accessible_by_user(
+                        database=self._model,
+                        catalog=catalog,
+                        schema=schema,
+                        datasource_names=[
+                            DatasourceName(match["name"], schema, catalog)
+                            for match in schema_matches
+                        ],
+                    )
+                )
+            result = [
+                match
+                for match in matches
+                if DatasourceName(match["name"], match["schema"], match["catalog"])
+                in accessible
+            ]
+        except SupersetException:
+            raise
+        except Exception as ex:
+            raise DatabaseTablesUnexpectedError(str(ex)) from ex
+
+        return {
+            "count": len(result),
+            "result": result[: self._limit],
+            "refreshed_at": index["refreshed_at"],
+        }
+
+    def validate(self) -> None:
+        self._model = cast(Database, DatabaseDAO.find_by_id(self._db_id))
+        if not self._model:
+            raise DatabaseNotFoundError()
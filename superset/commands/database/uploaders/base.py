@@ -16,11 +16,15 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from functools import partial
 from typing import Any, Optional, TypedDict
 
+import numpy as np
 import pandas as pd
 from flask_babel import lazy_gettext as _
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 from werkzeug.datastructures import FileStorage
 
 from superset import db
@@ -44,6 +48,8 @@ from superset.views.database.validators import schema_allows_file_upload
 logger = logging.getLogger(__name__)
 
 READ_CHUNK_SIZE = 1000
+# Number of rows read and written per chunk when streaming a file to the database
+STREAMING_CHUNK_SIZE = 100_000
 
 
 class UploadFileType(StrEnum):
@@ -74,6 +80,9 @@ class BaseDataReader:
     to read data from multiple file types (e.g. CSV, Excel, etc.)
     """
 
+    # whether `file_to_dataframe_chunks` reads the file in several chunks
+    supports_streaming = False
+
     def __init__(self, options: Optional[dict[str, Any]] = None) -> None:
         self._options = options or {}
 
@@ -83,6 +92,17 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file as a sequence of DataFrames, so that large files can be written
+        to the database while they are being read. Readers that can't stream their
+        file format yield the whole file as a single DataFrame.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
@@ -90,9 +110,32 @@ class BaseDataReader:
         table_name: str,
         schema_name: Optional[str],
     ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
-        )
+        if not (
+            self.supports_streaming
+            and database.db_engine_spec.supports_streaming_upload
+        ):
+            self._dataframe_to_database(
+                self.file_to_dataframe(file), database, table_name, schema_name
+            )
+            return
+
+        # chunks are typed independently, so a first pass over the file finds the
+        # dtypes the whole file would get when concatenated. This also validates
+        # the file before the table is touched.
+        dtypes = get_common_dtypes(self.file_to_dataframe_chunks(file))
+        file.stream.seek(0)
+        chunks = (cast_dtypes(df, dtypes) for df in self.file_to_dataframe_chunks(file))
+        self._dataframe_chunks_to_database(chunks, database, table_name, schema_name)
+
+    def _get_to_sql_kwargs(self) -> dict[str, Any]:
+        to_sql_kwargs = {
+            "chunksize": READ_CHUNK_SIZE,
+            "if_exists": self._options.get("already_exists", "fail"),
+            "index": self._options.get("dataframe_index", False),
+        }
+        if self._options.get("index_label") and self._options.get("dataframe_index"):
+            to_sql_kwargs["index_label"] = self._options.get("index_label")
+        return to_sql_kwargs
 
     def _dataframe_to_database(
         self,
@@ -107,33 +150,98 @@ class BaseDataReader:
         :param df:
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
-        try:
-            data_table = Table(table=table_name, schema=schema_name)
-            to_sql_kwargs = {
-                "chunksize": READ_CHUNK_SIZE,
-                "if_exists": self._options.get("already_exists", "fail"),
-                "index": self._options.get("dataframe_index", False),
-            }
-            if self._options.get("index_label") and self._options.get(
-                "dataframe_index"
-            ):
-                to_sql_kwargs["index_label"] = self._options.get("index_label")
+        with upload_errors():
             database.db_engine_spec.df_to_sql(
                 database,
-                data_table,
+                Table(table=table_name, schema=schema_name),
                 df,
-                to_sql_kwargs=to_sql_kwargs,
+                to_sql_kwargs=self._get_to_sql_kwargs(),
+            )
+
+    def _dataframe_chunks_to_database(
+        self,
+        chunks: Iterator[pd.DataFrame],
+        database: Database,
+        table_name: str,
+        schema_name: Optional[str],
+    ) -> None:
+        """
+        Upload a sequence of DataFrames to database in a single transaction
+
+        :param chunks:
+        :throws DatabaseUploadFailed: if there is an error uploading the DataFrames
+        """
+        with upload_errors():
+            database.db_engine_spec.df_chunks_to_sql(
+                database,
+                Table(table=table_name, schema=schema_name),
+                chunks,
+                to_sql_kwargs=self._get_to_sql_kwargs(),
+            )
+
+
+def get_common_dtypes(chunks: Iterable[pd.DataFrame]) -> dict[str, Any]:
+    """
+    Return the dtype of each column once all the chunks are concatenated.
+
+    Like `pd.concat`, numeric dtypes are promoted to a common numeric dtype (e.g.
+    an integer column with missing values in some chunk becomes a float column) and
+    other mixed dtypes fall back to `object`.
+    """
+    dtypes: dict[str, set[Any]] = {}
+    for df in chunks:
+        for column, dtype in df.dtypes.items():
+            dtypes.setdefault(column, set()).add(dtype)
+
+    common_dtypes = {}
+    for column, column_dtypes in dtypes.items():
+        if len(column_dtypes) == 1:
+            common_dtypes[column] = column_dtypes.pop()
+            continue
+        if all(
+            is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+            for dtype in column_dtypes
+        ):
+            try:
+                common_dtypes[column] = np.result_type(*column_dtypes)
+                continue
+            except TypeError:
+                pass
+        common_dtypes[column] = np.dtype(object)
+    return common_dtypes
+
+
+def cast_dtypes(df: pd.DataFrame, dtypes: dict[str, Any]) -> pd.DataFrame:
+    """
+    Cast the columns of a chunk whose dtype differs from the common one.
+    """
+    changed = {
+        column: dtype
+        for column, dtype in dtypes.items()
+        if column in df.columns and df[column].dtype != dtype
+    }
+    return df.astype(changed) if changed else df
+
+
+@contextmanager
+def upload_errors() -> Iterator[None]:
+    """
+    Raise errors writing to the database as `DatabaseUploadFailed`.
+    """
+    try:
+        yield
+    except DatabaseUploadFailed:
+        raise
+    except ValueError as ex:
+        raise DatabaseUploadFailed(
+            message=_(
+                "Table already exists. You can change your "
+                "'if table already exists' strategy to append or "
+                "replace or provide a different Table Name to use."
             )
-        except ValueError as ex:
-            raise DatabaseUploadFailed(
-                message=_(
-                    "Table already exists. You can change your "
-                    "'if table already exists' strategy to append or "
-                    "replace or provide a different Table Name to use."
-                )
-            ) from ex
-        except Exception as ex:
-            raise DatabaseUploadFailed(exception=ex) from ex
+        ) from ex
+    except Exception as ex:
+        raise DatabaseUploadFailed(exception=ex) from ex
 
 
 class UploadCommand(BaseCommand):
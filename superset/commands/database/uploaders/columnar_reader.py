@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from io import BytesIO
 from pathlib import Path
 from typing import Any, IO, Optional
@@ -32,6 +32,7 @@ from superset.commands.database.uploaders.base import (
     BaseDataReader,
     FileMetadata,
     ReaderOptions,
+    STREAMING_CHUNK_SIZE,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,8 @@ class ColumnarReaderOptions(ReaderOptions, total=False):
 
 
 class ColumnarReader(BaseDataReader):
+    supports_streaming = True
+
     def __init__(
         self,
         options: Optional[ColumnarReaderOptions] = None,
@@ -71,6 +74,23 @@ class ColumnarReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading Columnar file")) from ex
 
+    def _read_buffer_to_dataframe_chunks(
+        self, buffer: IO[bytes]
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            parquet_file = pq.ParquetFile(buffer)
+            for batch in parquet_file.iter_batches(
+                batch_size=STREAMING_CHUNK_SIZE,
+                columns=self._options.get("columns_read") or None,
+            ):
+                yield batch.to_pandas()
+        except (ArrowException, ValueError) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading Columnar file")) from ex
+
     @staticmethod
     def _yield_files(file: FileStorage) -> Generator[IO[bytes], None, None]:
         """
@@ -114,6 +134,17 @@ class ColumnarReader(BaseDataReader):
             self._read_buffer_to_dataframe(buffer) for buffer in self._yield_files(file)
         )
 
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read Columnar file as a sequence of DataFrames, one per record batch of
+        `STREAMING_CHUNK_SIZE` rows, without loading whole files in memory
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        for buffer in self._yield_files(file):
+            yield from self._read_buffer_to_dataframe_chunks(buffer)
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         column_names = set()
         try:
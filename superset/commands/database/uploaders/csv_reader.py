@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from typing import Any, Optional
 
 import pandas as pd
@@ -26,6 +27,7 @@ from superset.commands.database.uploaders.base import (
     BaseDataReader,
     FileMetadata,
     ReaderOptions,
+    STREAMING_CHUNK_SIZE,
 )
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,8 @@ class CSVReaderOptions(ReaderOptions, total=False):
 
 
 class CSVReader(BaseDataReader):
+    supports_streaming = True
+
     def __init__(
         self,
         options: Optional[CSVReaderOptions] = None,
@@ -86,14 +90,27 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
-    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
-        """
-        Read CSV file into a DataFrame
+    @staticmethod
+    def _read_csv_chunks(
+        file: FileStorage, kwargs: dict[str, Any]
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            with pd.read_csv(filepath_or_buffer=file.stream, **kwargs) as reader:
+                yield from reader
+        except (
+            pd.errors.ParserError,
+            pd.errors.EmptyDataError,
+            UnicodeDecodeError,
+            ValueError,
+        ) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
-        :return: pandas DataFrame
-        :throws DatabaseUploadFailed: if there is an error reading the file
-        """
-        kwargs = {
+    def _get_read_kwargs(self) -> dict[str, Any]:
+        return {
             "chunksize": READ_CSV_CHUNK_SIZE,
             "encoding": "utf-8",
             "header": self._options.get("header_row", 0),
@@ -118,7 +135,29 @@ class CSVReader(BaseDataReader):
             if self._options.get("column_data_types")
             else None,
         }
-        return self._read_csv(file, kwargs)
+
+    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
+        """
+        Read CSV file into a DataFrame
+
+        :return: pandas DataFrame
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        return self._read_csv(file, self._get_read_kwargs())
+
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file as a sequence of DataFrames of `STREAMING_CHUNK_SIZE` rows.
+
+        Column types are inferred per chunk, so `column_data_types` should be set
+        for columns whose inferred type may differ across the file.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        kwargs = self._get_read_kwargs()
+        kwargs["chunksize"] = STREAMING_CHUNK_SIZE
+        return self._read_csv_chunks(file, kwargs)
 
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
@@ -0,0 +1,53 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+
+from superset.commands.base import BaseCommand
+from superset.daos.key_value import KeyValueDAO
+from superset.key_value.types import KeyValueResource
+from superset.utils.decorators import transaction
+
+logger = logging.getLogger(__name__)
+
+
+class KeyValuePruneCommand(BaseCommand):
+    """
+    Command to delete the expired entries of the key-value store.
+
+    Expired entries are never returned, but are only deleted by this command and
+    periodically when adding entries to the metastore cache.
+    """
+
+    def __init__(self, resource: KeyValueResource | None = None):
+        """
+        :param resource: Only prune the entries of this resource
+        """
+        self.resource = resource
+
+    @transaction()
+    def run(self) -> int:
+        """
+        Executes the prune command
+
+        :returns: The number of deleted entries
+        """
+        deleted = KeyValueDAO.delete_expired_entries(self.resource)
+        logger.info("Pruned %s expired key-value entries", f"{deleted:,}")
+        return deleted
+
+    def validate(self) -> None:
+        pass
@@ -104,9 +104,14 @@ def _get_full(
         payload["colnames"] = list(df.columns)
         payload["indexnames"] = list(df.index)
         payload["coltypes"] = extract_dataframe_dtypes(df, datasource)
-        payload["data"] = query_context.get_data(df, payload["coltypes"])
         payload["result_format"] = query_context.result_format
-    del payload["df"]
+        # post-processed results keep the DataFrame so that the client
+        # post-processing can operate on it directly (see `apply_client_processing`)
+        # and the data is only formatted once it has been applied
+        if result_type != ChartDataResultType.POST_PROCESSED:
+            payload["data"] = query_context.get_data(df, payload["coltypes"])
+    if "data" in payload or status == QueryStatus.FAILED:
+        del payload["df"]
 
     applied_time_columns, rejected_time_columns = get_time_filter_status(
         datasource, query_obj.applied_time_extras
@@ -218,7 +223,8 @@ def get_query_results(
     :param query_obj: query object for which to retrieve the results
     :param force_cached: should results be forcefully retrieved from cache
     :raises QueryObjectValidationError: if an unsupported result type is requested
-    :return: JSON serializable result payload
+    :return: JSON serializable result payload, except for post-processed results
+        which keep the unformatted dataframe under ``df``
     """
     if result_func := _result_type_functions.get(result_type):
         return result_func(query_context, query_obj, force_cached)
@@ -19,7 +19,7 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
@@ -36,6 +36,9 @@ from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
+    get_time_buckets,
+    TIME_BUCKET_PERIODS,
+    TimeBucket,
 )
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import CacheRegion, TimeGrain
@@ -60,8 +63,10 @@ from superset.utils.core import (
     FilterOperator,
     GenericDataType,
     get_base_axis_labels,
+    get_column_name,
     get_column_names_from_columns,
     get_column_names_from_metrics,
+    get_metric_name,
     get_metric_names,
     get_x_axis_label,
     is_adhoc_column,
@@ -276,7 +281,9 @@ class QueryContextProcessor:
             # todo(hugh): add logic to manage all sip68 models here
             result = query_context.datasource.exc_query(query_object.to_dict())
         else:
-            result = query_context.datasource.query(query_object.to_dict())
+            result = self.get_incremental_query_result(
+                query_object
+            ) or query_context.datasource.query(query_object.to_dict())
             query = result.query + ";\n\n"
 
         df = result.df
@@ -308,6 +315,232 @@ class QueryContextProcessor:
         result.to_dttm = query_object.to_dttm
         return result
 
+    def can_query_incrementally(self, query_object: QueryObject) -> bool:
+        """
+        Whether the results of the query object can be stitched together from the
+        results of its time buckets, which only holds for time-series queries
+        bounded in time, aggregated by a time grain of `TIME_BUCKET_PERIODS` and
+        not limited by series nor offset.
+        """
+        return bool(
+            feature_flag_manager.is_feature_enabled("INCREMENTAL_TIME_SERIES_CACHE")
+            and not isinstance(self._qc_datasource, Query)
+            and not self._qc_datasource.offset
+            and query_object.from_dttm
+            and query_object.to_dttm
+            and (
+                query_object.is_timeseries or get_base_axis_labels(query_object.columns)
+            )
+            and self.get_time_grain(query_object) in TIME_BUCKET_PERIODS
+            and not query_object.time_offsets
+            and not query_object.time_shift
+            and not query_object.series_limit
+            and not query_object.row_offset
+            and not query_object.is_rowcount
+            and len(
+                [
+                    flt
+                    for flt in query_object.filter
+                    if flt.get("op") == FilterOperator.TEMPORAL_RANGE
+                ]
+            )
+            <= 1
+        )
+
+    def get_incremental_query_result(
+        self, query_object: QueryObject
+    ) -> QueryResult | None:
+        """
+        Returns the results of a time-series query stitched together from the results
+        of its time buckets, only querying the buckets that are missing from the cache
+        or still open to late-arriving data, or None when the query has to be run
+        as a whole.
+
+        The results of the buckets are cached as returned by the database, so that
+        the stitched results go through the same normalization and post-processing
+        as the results of the whole query.
+        """
+        if not self.can_query_incrementally(query_object):
+            return None
+
+        buckets = get_time_buckets(
+            cast(datetime, query_object.from_dttm),
+            cast(datetime, query_object.to_dttm),
+            self.get_time_grain(query_object),
+            closed_before=datetime.now()
+            - current_app.config["INCREMENTAL_TIME_SERIES_CACHE_LATE_DATA_WINDOW"],
+        )
+        cache_keys = self.time_bucket_cache_keys(query_object, buckets)
+        values: list[dict[str, Any] | None] = [None] * len(buckets)
+        force_query = self._query_context.force or self.get_cache_timeout() == -1
+        if not force_query and any(cache_keys):
+            cached_values = cache_manager.data_cache.get_many(
+                *[key for key in cache_keys if key]
+            )
+            cached = dict(
+                zip([key for key in cache_keys if key], cached_values, strict=True)
+            )
+            values = [cached.get(key) if key else None for key in cache_keys]
+
+        duration = timedelta()
+        start = 0
+        while start < len(buckets):
+            if values[start] is not None:
+                start += 1
+                continue
+            end = start + 1
+            while end < len(buckets) and values[end] is None:
+                end += 1
+            result = self.query_time_buckets(query_object, buckets[start:end])
+            if not isinstance(result, list):
+                return result
+            values[start:end] = result
+            duration += result[0]["duration"]
+            for key, value in zip(cache_keys[start:end], result, strict=True):
+                QueryCacheManager.set(
+                    key=key,
+                    value=value,
+                    timeout=self.get_cache_timeout(),
+                    datasource_uid=self._qc_datasource.uid,
+                    region=CacheRegion.DATA,
+                )
+            start = end
+
+        return self.stitch_time_buckets(
+            query_object, cast(list[dict[str, Any]], values), duration
+        )
+
+    def time_bucket_cache_keys(
+        self, query_object: QueryObject, buckets: list[TimeBucket]
+    ) -> list[str | None]:
+        """
+        Returns the cache keys of the results of the closed time buckets of the query
+        object, which are independent of the time range, row limit and
+        post-processing of the query, so that charts of overlapping time ranges share
+        the results of their buckets.
+        """
+        query_object_clone = copy.copy(query_object)
+        query_object_clone.filter = [
+            {**flt, "val": None}
+            if flt.get("op") == FilterOperator.TEMPORAL_RANGE
+            else flt
+            for flt in query_object.filter
+        ]
+        query_object_clone.time_range = None
+        query_object_clone.inner_from_dttm = None
+        query_object_clone.inner_to_dttm = None
+        query_object_clone.row_limit = None
+        query_object_clone.post_processing = []
+        query_object_clone.annotation_layers = []
+        cache_key = self.query_cache_key(
+            query_object_clone,
+            time_grain=self.get_time_grain(query_object),
+        )
+        return [
+            generate_cache_key(
+                {
+                    "cache_key": cache_key,
+                    "time_bucket_start": bucket.start,
+                    "time_bucket_end": bucket.end,
+                }
+            )
+            if cache_key and bucket.closed
+            else None
+            for bucket in buckets
+        ]
+
+    def query_time_buckets(
+        self, query_object: QueryObject, buckets: list[TimeBucket]
+    ) -> list[dict[str, Any]] | QueryResult | None:
+        """
+        Queries a contiguous run of time buckets at once and splits the results by
+        bucket. Returns the result of the query when it failed, or None when its
+        rows can't be told apart by bucket or may have been cut by the row limit.
+        """
+        from_dttm, to_dttm = buckets[0].start, buckets[-1].end
+        query_object_clone = copy.copy(query_object)
+        query_object_clone.from_dttm = from_dttm
+        query_object_clone.to_dttm = to_dttm
+        query_object_clone.inner_from_dttm = None
+        query_object_clone.inner_to_dttm = None
+        query_object_clone.filter = [
+            {**flt, "val": f"{from_dttm} : {to_dttm}"}
+            if flt.get("op") == FilterOperator.TEMPORAL_RANGE
+            else flt
+            for flt in query_object.filter
+        ]
+        result = self._qc_datasource.query(query_object_clone.to_dict())
+        if result.status != QueryStatus.SUCCESS:
+            return result
+
+        df = result.df
+        if query_object.row_limit and len(df.index) >= query_object.row_limit:
+            return None
+
+        positions = np.zeros(len(df.index), dtype=int)
+        if not df.empty:
+            label = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+            dttm = self.normalize_df(df.copy(), query_object).get(label)
+            if dttm is None or not pd.api.types.is_datetime64_dtype(dttm):
+                return None
+            starts = np.array([bucket.start for bucket in buckets], "datetime64[ns]")
+            positions = np.searchsorted(starts, dttm.to_numpy(), side="right") - 1
+            positions = np.clip(positions, 0, len(buckets) - 1)
+
+        return [
+            {
+                "df": df[positions == idx].reset_index(drop=True),
+                "query": result.query,
+                "duration": result.duration,
+                "applied_template_filters": result.applied_template_filters,
+                "applied_filter_columns": result.applied_filter_columns,
+                "rejected_filter_columns": result.rejected_filter_columns,
+            }
+            for idx in range(len(buckets))
+        ]
+
+    @staticmethod
+    def stitch_time_buckets(
+        query_object: QueryObject,
+        values: list[dict[str, Any]],
+        duration: timedelta,
+    ) -> QueryResult | None:
+        """
+        Concatenates the results of the time buckets into the results of the query,
+        sorted as the query would have sorted them. Returns None when that can't be
+        done faithfully because of the row limit or the sort order.
+        """
+        dfs = [value["df"] for value in values if not value["df"].empty]
+        df = pd.concat(dfs, ignore_index=True) if dfs else values[0]["df"]
+        if query_object.row_limit and len(df.index) > query_object.row_limit:
+            return None
+
+        if query_object.orderby:
+            labels = [
+                get_metric_name(column)
+                if is_adhoc_metric(column)
+                else get_column_name(column)
+                for column, _ascending in query_object.orderby
+            ]
+            if not set(labels).issubset(df.columns):
+                return None
+            df = df.sort_values(
+                labels,
+                ascending=[ascending for _column, ascending in query_object.orderby],
+                kind="stable",
+                ignore_index=True,
+            )
+
+        last = values[-1]
+        return QueryResult(
+            df=df,
+            query=";\n\n".join(dict.fromkeys(value["query"] for value in values)),
+            duration=duration,
+            applied_template_filters=last["applied_template_filters"],
+            applied_filter_columns=last["applied_filter_columns"],
+            rejected_filter_columns=last["rejected_filter_columns"],
+        )
+
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         # todo: should support "python_date_format" and "get_column" in each datasource
         def _get_timestamp_format(
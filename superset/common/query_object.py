@@ -37,7 +37,7 @@ from superset.exceptions import (
 from superset.extensions import event_logger
 from superset.sql.parse import sanitize_clause
 from superset.superset_typing import Column, Metric, OrderBy
-from superset.utils import json, pandas_postprocessing
+from superset.utils import json
 from superset.utils.core import (
     DTTM_ALIAS,
     find_duplicates,
@@ -48,6 +48,7 @@ from superset.utils.core import (
 )
 from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.json import json_int_dttm_ser
+from superset.utils.pandas_postprocessing.pipeline import PostProcessingPipeline
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource
@@ -284,6 +285,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             self._validate_there_are_no_missing_series()
             self._validate_no_have_duplicate_labels()
             self._validate_time_offsets()
+            self._validate_post_processing()
             self._sanitize_filters()
             return None
         except QueryObjectValidationError as ex:
@@ -303,6 +305,13 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                 )
             )
 
+    def _validate_post_processing(self) -> None:
+        """Validate the post processing chain before the query is run"""
+        try:
+            PostProcessingPipeline(self.post_processing)
+        except InvalidPostProcessingError as ex:
+            raise QueryObjectValidationError(ex.message) from ex
+
     def _validate_time_offsets(self) -> None:
         """Validate time_offsets configuration"""
         if not self.time_offsets:
@@ -486,20 +495,15 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                  is incorrect
         """
         logger.debug("post_processing: \n %s", pformat(self.post_processing))
-        with event_logger.log_context(f"{self.__class__.__name__}.post_processing"):
-            for post_process in self.post_processing:
-                operation = post_process.get("operation")
-                if not operation:
-                    raise InvalidPostProcessingError(
-                        _("`operation` property of post processing object undefined")
-                    )
-                if not hasattr(pandas_postprocessing, operation):
-                    raise InvalidPostProcessingError(
-                        _(
-                            "Unsupported post processing operation: %(operation)s",
-                            type=operation,
-                        )
-                    )
-                options = post_process.get("options", {})
-                df = getattr(pandas_postprocessing, operation)(df, **options)
+        with event_logger.log_context(
+            f"{self.__class__.__name__}.post_processing"
+        ) as log:
+            pipeline = PostProcessingPipeline(self.post_processing)
+            df = pipeline(df)
+            log(
+                post_processing_durations=[
+                    {"operation": operation, "duration": round(duration, 4)}
+                    for operation, duration in pipeline.durations
+                ]
+            )
             return df
@@ -17,14 +17,46 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, cast
+from typing import Any, cast, NamedTuple
 
+import pandas as pd
 from flask import current_app
 
 from superset.common.query_object import QueryObject
+from superset.constants import TimeGrain
 from superset.utils.core import FilterOperator
 from superset.utils.date_parser import get_since_until
 
+# Periods of the buckets in which results are cached by time grain, for the grains
+# whose truncation lines up with the boundaries of these periods in every engine.
+# Weekly grains are left out as engines disagree on the first day of the week.
+TIME_BUCKET_PERIODS: dict[str, str] = {
+    TimeGrain.SECOND: "D",
+    TimeGrain.FIVE_SECONDS: "D",
+    TimeGrain.THIRTY_SECONDS: "D",
+    TimeGrain.MINUTE: "D",
+    TimeGrain.FIVE_MINUTES: "D",
+    TimeGrain.TEN_MINUTES: "D",
+    TimeGrain.FIFTEEN_MINUTES: "D",
+    TimeGrain.THIRTY_MINUTES: "D",
+    TimeGrain.HALF_HOUR: "D",
+    TimeGrain.HOUR: "D",
+    TimeGrain.SIX_HOURS: "D",
+    TimeGrain.DAY: "M",
+    TimeGrain.MONTH: "Y",
+    TimeGrain.QUARTER: "Y",
+    TimeGrain.QUARTER_YEAR: "Y",
+    TimeGrain.YEAR: "Y",
+}
+
+
+class TimeBucket(NamedTuple):
+    start: datetime
+    end: datetime
+    # whether the bucket ended before any late-arriving data is expected, so that its
+    # results can be cached
+    closed: bool
+
 
 def get_since_until_from_time_range(
     time_range: str | None = None,
@@ -77,3 +109,37 @@ def get_since_until_from_query_object(
         time_shift=query_object.time_shift,
         extras=query_object.extras,
     )
+
+
+def get_time_buckets(
+    from_dttm: datetime,
+    to_dttm: datetime,
+    time_grain: str,
+    closed_before: datetime,
+) -> list[TimeBucket]:
+    """
+    Split the time range into buckets of the period of the time grain.
+
+    The first and last buckets are clipped to the time range.
+
+    :param from_dttm: the inclusive start of the time range
+    :param to_dttm: the exclusive end of the time range
+    :param time_grain: a time grain of `TIME_BUCKET_PERIODS`
+    :param closed_before: the time before which buckets must end to be closed
+    :return: the buckets, in time order
+    """
+    period = TIME_BUCKET_PERIODS[time_grain]
+    buckets = []
+    start = pd.Timestamp(from_dttm).to_period(period).start_time
+    while start < to_dttm:
+        end = (start.to_period(period) + 1).start_time
+        bucket_end = min(end.to_pydatetime(), to_dttm)
+        buckets.append(
+            TimeBucket(
+                start=max(start.to_pydatetime(), from_dttm),
+                end=bucket_end,
+                closed=bucket_end <= closed_before,
+            )
+        )
+        start = end
+    return buckets
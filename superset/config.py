@@ -82,6 +82,9 @@ STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that `BufferedDBEventLogger` writes the logs in batches from a background
+# thread instead of during the request, e.g.
+# EVENT_LOGGER = BufferedDBEventLogger(batch_size=500, flush_interval=5.0)
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -166,6 +169,9 @@ SAMPLES_ROW_LIMIT = 1000
 NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
+# time the values retrieved by filter select auto complete are cached for, when the
+# COLUMN_VALUES_CACHE feature flag is enabled
+FILTER_SELECT_CACHE_TIMEOUT = int(timedelta(minutes=10).total_seconds())
 
 # SupersetClient HTTP retry configuration
 # Controls retry behavior for all HTTP requests made through SupersetClient
@@ -294,6 +300,15 @@ FLASK_USE_RELOAD = True
 # to the page to see the call stack.
 PROFILING = False
 
+# Log how long each step of the app initialization takes, and the modules which are
+# the slowest to import, when the app starts.
+STARTUP_PROFILING = False
+
+# Celery workers don't serve requests, so they can skip registering the views and
+# APIs when starting. They are registered the first time a worker builds the URL of
+# one of them instead, e.g. the URL of a chart to take a screenshot of.
+WORKER_LAZY_VIEWS = False
+
 # Superset allows server-side python stacktraces to be surfaced to the
 # user when this feature is on. This may have security implications
 # and it's more secure to turn it off in production settings.
@@ -619,6 +634,18 @@ DEFAULT_FEATURE_FLAGS: dict[str, bool] = {
     # Enable support for date range timeshifts (e.g., "2015-01-03 : 2015-01-04")
     # in addition to relative timeshifts (e.g., "1 day ago")
     "DATE_RANGE_TIMESHIFTS_ENABLED": False,
+    # Cache the results of time-series queries per time bucket, so that refreshing
+    # a chart only queries the buckets that aren't cached or are still open to
+    # late-arriving data, see INCREMENTAL_TIME_SERIES_CACHE_LATE_DATA_WINDOW
+    "INCREMENTAL_TIME_SERIES_CACHE": False,
+    # Filter dashboard, chart and dataset lists by an index of the datasets the roles
+    # of users give access to, kept in the cache and invalidated when roles, datasets
+    # or databases change, instead of evaluating the permissions on every request.
+    # Requires a CACHE_CONFIG shared by all processes, see DATASET_ACCESS_INDEX_MAX_IDS
+    "DATASET_ACCESS_INDEX": False,
+    # Cache the distinct values of columns loaded by filter dropdowns, keyed on the
+    # query fetching them (which includes RLS filters), for FILTER_SELECT_CACHE_TIMEOUT
+    "COLUMN_VALUES_CACHE": False,
 }
 
 # ------------------------------
@@ -840,6 +867,10 @@ THUMBNAIL_CACHE_CONFIG: CacheConfig = {
     "CACHE_NO_NULL_WARNING": True,
 }
 THUMBNAIL_ERROR_CACHE_TTL = int(timedelta(days=1).total_seconds())
+# Time a worker holds the lease to compute a screenshot, during which other workers
+# leave it to it instead of computing the same screenshot. A screenshot still
+# computing after this time is considered abandoned and is computed again.
+THUMBNAIL_COMPUTE_LEASE_TTL = int(timedelta(minutes=5).total_seconds())
 
 # Time before selenium times out after trying to locate an element on the page and wait
 # for that element to load for a screenshot.
@@ -888,6 +919,44 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Any of the cache configs can keep recently read entries in process memory, in
+# front of the configured backend, by adding a `NEAR_CACHE_CONFIG`. Entries are kept
+# for `CACHE_DEFAULT_TIMEOUT` seconds at most, and writes from other processes are
+# picked up within `GENERATION_CHECK_INTERVAL` seconds. Keys are hashed into
+# `GENERATION_BUCKETS` buckets, and a write only evicts the entries of its bucket
+# from the other processes, e.g.
+# CACHE_CONFIG = {
+#     "CACHE_TYPE": "RedisCache",
+#     "CACHE_REDIS_URL": "redis://localhost:6379/0",
+#     "NEAR_CACHE_CONFIG": {
+#         "CACHE_THRESHOLD": 500,
+#         "CACHE_DEFAULT_TIMEOUT": 10,
+#         "GENERATION_CHECK_INTERVAL": 1,
+#         "GENERATION_BUCKETS": 64,
+#     },
+# }
+
+# Fitted Prophet models of forecasts are kept in the data cache, keyed by the series
+# they were fitted on and the model options, so that re-rendering a forecast of
+# unchanged data only needs to predict.
+PROPHET_MODEL_CACHE_TIMEOUT = int(timedelta(days=7).total_seconds())
+
+# Number of processes used to fit the models of the series of forecasts in parallel.
+# The pool of processes is spawned on first use and shared by all the forecasts of a
+# web server process. The default of 1 fits them one after the other in the calling
+# process.
+PROPHET_MAX_WORKERS = 1
+
+# With the INCREMENTAL_TIME_SERIES_CACHE feature flag, time buckets ending less than
+# this long ago are queried again on every refresh instead of being cached, to pick
+# up rows that arrive late. Forcing a refresh of a chart queries all of its buckets.
+INCREMENTAL_TIME_SERIES_CACHE_LATE_DATA_WINDOW = timedelta(hours=1)
+
+# With the DATASET_ACCESS_INDEX feature flag, lists are filtered on the ids of the
+# datasets users can access. Users who can access more datasets than this have their
+# permissions evaluated instead, to keep the list queries small.
+DATASET_ACCESS_INDEX_MAX_IDS = 1000
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -897,9 +966,12 @@ FILTER_STATE_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=90).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # How often, in seconds, should expired entries be deleted when adding entries?
+    # Can be `None` if the `prune_key_value` Celery task is scheduled.
+    "PRUNE_INTERVAL": 300,
 }
 
 # Cache for explore form data state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
@@ -911,9 +983,12 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=7).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # How often, in seconds, should expired entries be deleted when adding entries?
+    # Can be `None` if the `prune_key_value` Celery task is scheduled.
+    "PRUNE_INTERVAL": 300,
 }
 
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
@@ -1130,6 +1205,8 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
         "superset.tasks.slack",
+        "superset.tasks.datasets",
+        "superset.tasks.databases",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1149,6 +1226,11 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "reports.prune_log",
             "schedule": crontab(minute=0, hour=0),
         },
+        # Deletes expired entries of the key-value store, e.g. from the metastore cache
+        "prune_key_value": {
+            "task": "prune_key_value",
+            "schedule": crontab(minute=0, hour="*"),
+        },
         # Uncomment to enable pruning of the query table
         # "prune_query": {
         #     "task": "prune_query",
@@ -1166,6 +1248,13 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "task": "slack.cache_channels",
         #     "schedule": crontab(minute="0", hour="*"),
         # },
+        # Uncomment to enable the catalog index used to search tables across
+        # schemas, re-inspecting schemas indexed more than a day ago
+        # "databases.refresh_catalog_index": {
+        #     "task": "databases.refresh_catalog_index",
+        #     "schedule": crontab(minute="0", hour="*"),
+        #     "kwargs": {"max_age_seconds": 86400},
+        # },
     }
 
 
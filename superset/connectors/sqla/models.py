@@ -1673,14 +1673,14 @@ class SqlaTable(
         old_columns_by_name: dict[str, TableColumn] = {
             col.column_name: col for col in old_columns
         }
+        new_column_names = {col["column_name"] for col in new_columns}
         results = MetadataResult(
-            removed=[
-                col
-                for col in old_columns_by_name
-                if col not in {col["column_name"] for col in new_columns}
-            ]
+            removed=[col for col in old_columns_by_name if col not in new_column_names]
         )
 
+        # resolve the database extra once, instead of once per column
+        db_extra = self.database.get_extra()
+
         # clear old columns before adding modified columns back
         columns = []
         for col in new_columns:
@@ -1690,9 +1690,15 @@ class SqlaTable(
                 new_column = TableColumn(
                     column_name=col["column_name"],
                     type=col["type"],
-                    table=self,
                 )
-                new_column.is_dttm = new_column.is_temporal
+                column_spec = db_engine_spec.get_column_spec(
+                    col["type"],
+                    db_extra=db_extra,
+                )
+                new_column.is_dttm = bool(
+                    column_spec
+                    and column_spec.generic_type == utils.GenericDataType.TEMPORAL
+                )
                 # Set description from comment field if available
                 if col.get("comment"):
                     new_column.description = col["comment"]
@@ -41,6 +41,9 @@ QUERY_EARLY_CANCEL_KEY = "early_cancel_query"
 
 LRU_CACHE_MAX_SIZE = 256
 
+# Number of compiled query templates kept per process
+COMPILED_QUERY_CACHE_MAX_SIZE = 1024
+
 
 # Used when calculating the time shift for time comparison
 class InstantTimeComparison(StrEnum):
@@ -131,6 +134,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "related": "read",
     "related_objects": "read",
     "tables": "read",
+    "table_search": "read",
     "schemas": "read",
     "catalogs": "read",
     "select_star": "read",
@@ -21,8 +21,6 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_
-
 from superset import db
 from superset.daos.base import BaseDAO
 from superset.key_value.exceptions import (
@@ -68,17 +66,135 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         return False
 
     @staticmethod
-    def delete_expired_entries(resource: KeyValueResource) -> None:
-        (
-            db.session.query(KeyValueEntry)
-            .filter(
-                and_(
-                    KeyValueEntry.resource == resource.value,
-                    KeyValueEntry.expires_on <= datetime.now(),
-                )
+    def delete_expired_entries(resource: KeyValueResource | None = None) -> int:
+        """
+        Delete the expired entries of a resource, or of all resources if no resource
+        is given.
+
+        :param resource: The resource of the entries
+        :returns: The number of deleted entries
+        """
+        query = db.session.query(KeyValueEntry).filter(
+            KeyValueEntry.expires_on <= datetime.now()
+        )
+        if resource is not None:
+            query = query.filter(KeyValueEntry.resource == resource.value)
+        return query.delete()
+
+    @staticmethod
+    def get_values(
+        resource: KeyValueResource,
+        keys: list[UUID],
+        codec: KeyValueCodec,
+    ) -> dict[UUID, Any]:
+        """
+        Get the values of several entries with a single query.
+
+        :param resource: The resource of the entries
+        :param keys: The UUID keys of the entries
+        :param codec: The codec used to decode the values
+        :returns: The decoded values of the entries that exist and haven't expired
+        """
+        if not keys:
+            return {}
+
+        rows = db.session.query(
+            KeyValueEntry.uuid,
+            KeyValueEntry.value,
+            KeyValueEntry.expires_on,
+        ).filter(
+            KeyValueEntry.resource == resource.value,
+            KeyValueEntry.uuid.in_(keys),
+        )
+        now = datetime.now()
+        return {
+            uuid: codec.decode(value)
+            for uuid, value, expires_on in rows
+            if expires_on is None or expires_on > now
+        }
+
+    @staticmethod
+    def upsert_entries(
+        resource: KeyValueResource,
+        values: dict[UUID, Any],
+        codec: KeyValueCodec,
+        expires_on: datetime | None = None,
+    ) -> None:
+        """
+        Create or update several entries, with a single query to find the existing
+        entries and bulk inserts and updates.
+
+        :param resource: The resource of the entries
+        :param values: The values keyed by the UUID of their entry
+        :param codec: The codec used to encode the values
+        :param expires_on: When the entries expire
+        """
+        if not values:
+            return
+
+        try:
+            encoded_values = {key: codec.encode(value) for key, value in values.items()}
+        except Exception as ex:
+            raise KeyValueCreateFailedError("Unable to encode value") from ex
+
+        existing = dict(
+            db.session.query(KeyValueEntry.uuid, KeyValueEntry.id).filter(
+                KeyValueEntry.resource == resource.value,
+                KeyValueEntry.uuid.in_(list(encoded_values)),
             )
-            .delete()
         )
+        now = datetime.now()
+        user_id = get_user_id()
+        db.session.bulk_update_mappings(
+            KeyValueEntry,
+            [
+                {
+                    "id": existing[key],
+                    "value": value,
+                    "expires_on": expires_on,
+                    "changed_on": now,
+                    "changed_by_fk": user_id,
+                }
+                for key, value in encoded_values.items()
+                if key in existing
+            ],
+        )
+        db.session.bulk_insert_mappings(
+            KeyValueEntry,
+            [
+                {
+                    "uuid": key,
+                    "resource": resource.value,
+                    "value": value,
+                    "expires_on": expires_on,
+                    "created_on": now,
+                    "created_by_fk": user_id,
+                }
+                for key, value in encoded_values.items()
+                if key not in existing
+            ],
+        )
+
+    @staticmethod
+    def delete_entries(resource: KeyValueResource, keys: list[UUID]) -> list[UUID]:
+        """
+        Delete several entries with a single delete statement.
+
+        :param resource: The resource of the entries
+        :param keys: The UUID keys of the entries
+        :returns: The keys of the deleted entries
+        """
+        if not keys:
+            return []
+
+        query = db.session.query(KeyValueEntry).filter(
+            KeyValueEntry.resource == resource.value,
+            KeyValueEntry.uuid.in_(keys),
+        )
+        deleted = [uuid for (uuid,) in query.with_entities(KeyValueEntry.uuid)]
+        if deleted:
+            query.delete()
+        return deleted
 
     @staticmethod
     def create_entry(
@@ -28,6 +28,10 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard, is_uuid
 from superset.models.embedded_dashboard import EmbeddedDashboard
 from superset.models.slice import Slice
+from superset.security.access_index import (
+    can_use_dataset_access_index,
+    get_accessible_dataset_ids,
+)
 from superset.security.guest_token import GuestTokenResourceType, GuestUser
 from superset.tags.filters import BaseTagIdFilter, BaseTagNameFilter
 from superset.utils.core import get_user_id
@@ -122,22 +126,41 @@ class DashboardAccessFilter(BaseFilter):  # pylint: disable=too-few-public-metho
         if is_feature_enabled("DASHBOARD_RBAC"):
             is_rbac_disabled_filter.append(~dashboard_has_roles)
 
-        datasource_perm_query = (
-            db.session.query(Dashboard.id)
-            .join(Dashboard.slices, isouter=True)
-            .join(SqlaTable, Slice.datasource_id == SqlaTable.id)
-            .join(Database, SqlaTable.database_id == Database.id)
-            .filter(
-                and_(
-                    Dashboard.published.is_(True),
-                    *is_rbac_disabled_filter,
-                    get_dataset_access_filters(
-                        Slice,
-                        security_manager.can_access_all_datasources(),
-                    ),
+        dataset_ids = (
+            get_accessible_dataset_ids()
+            if can_use_dataset_access_index()
+            and not security_manager.can_access_all_datasources()
+            else None
+        )
+        if dataset_ids is not None:
+            datasource_perm_query = (
+                db.session.query(Dashboard.id)
+                .join(Dashboard.slices)
+                .filter(
+                    and_(
+                        Dashboard.published.is_(True),
+                        *is_rbac_disabled_filter,
+                        Slice.datasource_id.in_(dataset_ids),
+                    )
+                )
+            )
+        else:
+            datasource_perm_query = (
+                db.session.query(Dashboard.id)
+                .join(Dashboard.slices, isouter=True)
+                .join(SqlaTable, Slice.datasource_id == SqlaTable.id)
+                .join(Database, SqlaTable.database_id == Database.id)
+                .filter(
+                    and_(
+                        Dashboard.published.is_(True),
+                        *is_rbac_disabled_filter,
+                        get_dataset_access_filters(
+                            Slice,
+                            security_manager.can_access_all_datasources(),
+                        ),
+                    )
                 )
             )
-        )
 
         owner_ids_query = (
             db.session.query(Dashboard.id)
@@ -61,7 +61,10 @@ from superset.commands.database.ssh_tunnel.exceptions import (
     SSHTunnelingNotEnabledError,
 )
 from superset.commands.database.sync_permissions import SyncPermissionsCommand
-from superset.commands.database.tables import TablesDatabaseCommand
+from superset.commands.database.tables import (
+    SearchTablesDatabaseCommand,
+    TablesDatabaseCommand,
+)
 from superset.commands.database.test_connection import TestConnectionDatabaseCommand
 from superset.commands.database.update import UpdateDatabaseCommand
 from superset.commands.database.uploaders.base import (
@@ -87,6 +90,7 @@ from superset.databases.schemas import (
     CatalogsResponseSchema,
     database_catalogs_query_schema,
     database_schemas_query_schema,
+    database_table_search_query_schema,
     database_tables_query_schema,
     DatabaseConnectionSchema,
     DatabaseFunctionNamesResponse,
@@ -94,6 +98,7 @@ from superset.databases.schemas import (
     DatabasePutSchema,
     DatabaseRelatedObjectsResponse,
     DatabaseSchemaAccessForFileUploadResponse,
+    DatabaseTableSearchResponse,
     DatabaseTablesResponse,
     DatabaseTestConnectionSchema,
     DatabaseValidateParametersSchema,
@@ -158,6 +163,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         RouteMethod.IMPORT,
         RouteMethod.RELATED,
         "tables",
+        "table_search",
         "table_metadata",
         "table_metadata_deprecated",
         "table_extra_metadata",
@@ -285,6 +291,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         "database_catalogs_query_schema": database_catalogs_query_schema,
         "database_schemas_query_schema": database_schemas_query_schema,
         "database_tables_query_schema": database_tables_query_schema,
+        "database_table_search_query_schema": database_table_search_query_schema,
         "get_export_ids_schema": get_export_ids_schema,
     }
 
@@ -295,6 +302,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         DatabaseFunctionNamesResponse,
         DatabaseSchemaAccessForFileUploadResponse,
         DatabaseRelatedObjectsResponse,
+        DatabaseTableSearchResponse,
         DatabaseTablesResponse,
         DatabaseTestConnectionSchema,
         DatabaseValidateParametersSchema,
@@ -883,6 +891,73 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         payload = command.run()
         return self.response(200, **payload)
 
+    @expose("/<int:pk>/table_search/")
+    @protect()
+    @rison(database_table_search_query_schema)
+    @statsd_metrics
+    @handle_api_exception
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".table_search",
+        log_to_statsd=False,
+    )
+    def table_search(self, pk: int, **kwargs: Any) -> FlaskResponse:
+        """Search tables and views across all the schemas of a database.
+        ---
+        get:
+          summary: Search tables and views across all the schemas of a database
+          description: >-
+            Searches the catalog index of the database, which is built in the
+            background by the `databases.refresh_catalog_index` task. Names starting
+            with the query are returned first, followed by names containing it.
+          parameters:
+          - in: path
+            schema:
+              type: integer
+            name: pk
+            description: The database id
+          - in: query
+            name: q
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/database_table_search_query_schema'
+          responses:
+            200:
+              description: Matching tables and views
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      count:
+                        type: integer
+                      refreshed_at:
+                        description: >-
+                          Timestamp of the last refresh of the index, null if the
+                          database hasn't been indexed yet
+                        type: number
+                        nullable: true
+                      result:
+                        type: array
+                        items:
+                          $ref: '#/components/schemas/DatabaseTableSearchResponse'
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        query = kwargs["rison"]["query"]
+        limit = kwargs["rison"].get("limit", 100)
+
+        command = SearchTablesDatabaseCommand(pk, query, limit)
+        payload = command.run()
+        return self.response(200, **payload)
+
     @expose("/<int:pk>/table/<path:table_name>/<schema_name>/", methods=("GET",))
     @protect()
     @check_table_access
@@ -0,0 +1,196 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A searchable index of the catalogs, schemas, tables and views of a database.
+
+The index is persisted in the key-value store, so tables can be searched across all
+the schemas of a database without inspecting it. It's built by the
+``databases.refresh_catalog_index`` Celery task, which only re-inspects the schemas
+whose entries are older than a given age.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, TypedDict
+from uuid import UUID
+
+from superset.daos.key_value import KeyValueDAO
+from superset.key_value.types import JsonKeyValueCodec, KeyValueResource
+from superset.key_value.utils import get_deterministic_uuid
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+RESOURCE = KeyValueResource.CATALOG_INDEX
+CODEC = JsonKeyValueCodec()
+
+
+class CatalogIndexSchema(TypedDict):
+    catalog: str | None
+    schema: str
+    refreshed_at: float
+    tables: list[str]
+    views: list[str]
+
+
+class CatalogIndex(TypedDict):
+    refreshed_at: float
+    schemas: list[CatalogIndexSchema]
+
+
+class CatalogIndexMatch(TypedDict):
+    catalog: str | None
+    schema: str
+    name: str
+    type: str
+
+
+def get_catalog_index_key(database: Database) -> UUID:
+    return get_deterministic_uuid(RESOURCE, {"database_id": database.id})
+
+
+def get_catalog_index(database: Database) -> CatalogIndex | None:
+    """
+    Return the persisted catalog index of a database, if it has been built.
+    """
+    return KeyValueDAO.get_value(RESOURCE, get_catalog_index_key(database), CODEC)
+
+
+def refresh_catalog_index(
+    database: Database,
+    max_age: timedelta | None = None,
+) -> CatalogIndex:
+    """
+    Refresh and persist the catalog index of a database.
+
+    Schemas that were refreshed less than ``max_age`` ago are kept as they are, so
+    only new and stale schemas are inspected; schemas that no longer exist are
+    dropped from the index. Schemas that fail to be inspected keep their previous
+    entry, if any.
+
+    :param database: The database to index
+    :param max_age: How long a schema entry is considered fresh, by default all
+        schemas are refreshed
+    :return: The refreshed catalog index
+    """
+    now = datetime.now()
+    previous_schemas = {
+        (schema["catalog"], schema["schema"]): schema
+        for schema in (get_catalog_index(database) or {}).get("schemas", [])
+    }
+
+    catalogs = (
+        database.get_all_catalog_names(force=True)
+        if database.allow_multi_catalog
+        else {database.get_default_catalog()}
+    )
+
+    schemas: list[CatalogIndexSchema] = []
+    for catalog in sorted(catalogs, key=lambda name: name or ""):
+        for schema in sorted(
+            database.get_all_schema_names(catalog=catalog, force=True)
+        ):
+            previous = previous_schemas.get((catalog, schema))
+            if (
+                previous
+                and max_age is not None
+                and now - datetime.fromtimestamp(previous["refreshed_at"]) < max_age
+            ):
+                schemas.append(previous)
+                continue
+
+            try:
+                tables = database.get_all_table_names_in_schema(
+                    catalog=catalog,
+                    schema=schema,
+                    force=True,
+                )
+                views = database.get_all_view_names_in_schema(
+                    catalog=catalog,
+                    schema=schema,
+                    force=True,
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Unable to index schema %s of database %s",
+                    schema,
+                    database.id,
+                    exc_info=True,
+                )
+                if previous:
+                    schemas.append(previous)
+                continue
+
+            schemas.append(
+                {
+                    "catalog": catalog,
+                    "schema": schema,
+                    "refreshed_at": now.timestamp(),
+                    "tables": sorted(table for table, _, _ in tables),
+                    "views": sorted(view for view, _, _ in views),
+                }
+            )
+
+    index: CatalogIndex = {"refreshed_at": now.timestamp(), "schemas": schemas}
+    KeyValueDAO.upsert_entry(RESOURCE, index, CODEC, get_catalog_index_key(database))
+    return index
+
+
+def search_catalog_index(
+    index: CatalogIndex,
+    query: str,
+) -> list[CatalogIndexMatch]:
+    """
+    Search tables and views by name in a catalog index.
+
+    The search is case insensitive; names starting with the query are returned
+    first, followed by the names containing it, each group sorted by name.
+
+    :param index: The catalog index to search
+    :param query: The prefix or substring to look for
+    :return: The matching tables and views
+    """
+    query = query.lower()
+    prefix_matches: list[CatalogIndexMatch] = []
+    substring_matches: list[CatalogIndexMatch] = []
+    for schema in index["schemas"]:
+        for type_, names in (("table", schema["tables"]), ("view", schema["views"])):
+            for name in names:
+                position = name.lower().find(query)
+                if position == -1:
+                    continue
+                match: CatalogIndexMatch = {
+                    "catalog": schema["catalog"],
+                    "schema": schema["schema"],
+                    "name": name,
+                    "type": type_,
+                }
+                if position == 0:
+                    prefix_matches.append(match)
+                else:
+                    substring_matches.append(match)
+
+    def sort_key(match: CatalogIndexMatch) -> tuple[str, str, str]:
+        return (match["name"].lower(), match["catalog"] or "", match["schema"])
+
+    return sorted(prefix_matches, key=sort_key) + sorted(
+        substring_matches, key=sort_key
+    )
@@ -84,6 +84,15 @@ database_tables_query_schema = {
     "required": ["schema_name"],
 }
 
+database_table_search_query_schema = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "minLength": 1},
+        "limit": {"type": "integer", "minimum": 1, "maximum": 1000},
+    },
+    "required": ["query"],
+}
+
 database_name_description = "A database name to identify this connection."
 port_description = "Port number for the database connection."
 cache_timeout_description = (
@@ -740,6 +749,15 @@ class DatabaseTablesResponse(Schema):
     value = fields.String(metadata={"description": "The table or view name"})
 
 
+class DatabaseTableSearchResponse(Schema):
+    catalog = fields.String(
+        allow_none=True, metadata={"description": "The catalog of the table or view"}
+    )
+    schema = fields.String(metadata={"description": "The schema of the table or view"})
+    name = fields.String(metadata={"description": "The table or view name"})
+    type = fields.String(metadata={"description": "table or view"})
+
+
 class ValidateSQLRequest(Schema):
     sql = fields.String(
         required=True, metadata={"description": "SQL statement to validate"}
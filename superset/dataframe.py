@@ -19,6 +19,7 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from superset.utils.core import JS_MAX_INTEGER
@@ -37,10 +38,50 @@ def _convert_big_integers(val: Any) -> Any:
     return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
 
 
+# ``pd.api.types.infer_dtype`` results of object columns that may hold integers
+_INTEGER_INFERRED_TYPES = {"integer", "mixed-integer", "mixed-integer-float", "mixed"}
+
+
+def _big_integer_mask(series: pd.Series) -> np.ndarray | None:
+    """
+    Flag the values of a series that are integers larger than ``JS_MAX_INTEGER``.
+
+    Integer columns are checked with vectorized comparisons, object columns that may
+    hold integers value by value; other columns can't hold integers and are skipped.
+
+    :param series: the series to check
+    :returns: a boolean array, or ``None`` if the series holds no big integers
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return None
+    if pd.api.types.is_integer_dtype(series.dtype):
+        mask = ((series > JS_MAX_INTEGER) | (series < -JS_MAX_INTEGER)).to_numpy(
+            dtype=bool,
+            na_value=False,
+        )
+    elif pd.api.types.is_object_dtype(series.dtype):
+        if pd.api.types.infer_dtype(series, skipna=True) not in _INTEGER_INFERRED_TYPES:
+            return None
+        mask = np.fromiter(
+            (
+                isinstance(val, (int, np.integer)) and abs(int(val)) > JS_MAX_INTEGER
+                for val in series.array
+            ),
+            dtype=bool,
+            count=len(series),
+        )
+    else:
+        return None
+    return mask if mask.any() else None
+
+
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
 
+    Integers larger than ``JS_MAX_INTEGER`` are cast to strings; only the cells
+    flagged by ``_big_integer_mask`` are visited after building the records.
+
     :param dframe: the DataFrame to convert
     :returns: a list of dictionaries reflecting each single row of the DataFrame
     """
@@ -50,8 +91,13 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         )
     records = dframe.to_dict(orient="records")
 
-    for record in records:
-        for key in record:
-            record[key] = _convert_big_integers(record[key])
+    # with duplicate names the records hold the value of the last column
+    positions = {key: position for position, key in enumerate(dframe.columns)}
+    for key, position in positions.items():
+        mask = _big_integer_mask(dframe.iloc[:, position])
+        if mask is None:
+            continue
+        for index in np.flatnonzero(mask):
+            records[index][key] = _convert_big_integers(records[index][key])
 
     return records
@@ -15,13 +15,16 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from typing import Any
 
 from flask import current_app as app
-from flask_appbuilder.api import expose, protect, safe
+from flask_appbuilder.api import expose, permission_name, protect, rison, safe
 
 from superset import event_logger
 from superset.daos.datasource import DatasourceDAO
 from superset.daos.exceptions import DatasourceNotFound, DatasourceTypeNotSupportedError
+from superset.datasource.column_values import get_column_values
+from superset.datasource.schemas import column_values_schema, columns_values_schema
 from superset.exceptions import SupersetSecurityException
 from superset.superset_typing import FlaskResponse
 from superset.utils.core import apply_max_row_limit, DatasourceType
@@ -35,6 +38,10 @@ class DatasourceRestApi(BaseSupersetApi):
     class_permission_name = "Datasource"
     resource_name = "datasource"
     openapi_spec_tag = "Datasources"
+    apispec_parameter_schemas = {
+        "column_values_schema": column_values_schema,
+        "columns_values_schema": columns_values_schema,
+    }
 
     @expose(
         "/<datasource_type>/<int:datasource_id>/column/<column_name>/values/",
@@ -48,8 +55,13 @@ class DatasourceRestApi(BaseSupersetApi):
         f".get_column_values",
         log_to_statsd=False,
     )
+    @rison(column_values_schema)
     def get_column_values(
-        self, datasource_type: str, datasource_id: int, column_name: str
+        self,
+        datasource_type: str,
+        datasource_id: int,
+        column_name: str,
+        **kwargs: Any,
     ) -> FlaskResponse:
         """Get possible values for a datasource column.
         ---
@@ -71,6 +83,12 @@ class DatasourceRestApi(BaseSupersetApi):
               type: string
             name: column_name
             description: The name of the column to get values for
+          - in: query
+            name: q
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/column_values_schema'
           responses:
             200:
               description: A List of distinct values for the column
@@ -118,12 +136,15 @@ class DatasourceRestApi(BaseSupersetApi):
         row_limit = apply_max_row_limit(app.config["FILTER_SELECT_ROW_LIMIT"])
         denormalize_column = not datasource.normalize_columns
         try:
-            payload = datasource.values_for_column(
-                column_name=column_name,
+            payload = get_column_values(
+                datasource,
+                [column_name],
                 limit=row_limit,
                 denormalize_column=denormalize_column,
+                search=kwargs["rison"].get("search"),
+                force=kwargs["rison"].get("force", False),
             )
-            return self.response(200, result=payload)
+            return self.response(200, result=payload[column_name])
         except KeyError:
             return self.response(
                 400, message=f"Column name {column_name} does not exist"
@@ -136,3 +157,115 @@ class DatasourceRestApi(BaseSupersetApi):
                     f"datasource type: {datasource_type}"
                 ),
             )
+
+    @expose(
+        "/<datasource_type>/<int:datasource_id>/column_values/",
+        methods=("GET",),
+    )
+    @protect()
+    @safe
+    @statsd_metrics
+    @permission_name("get_column_values")
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".get_columns_values",
+        log_to_statsd=False,
+    )
+    @rison(columns_values_schema)
+    def get_columns_values(
+        self, datasource_type: str, datasource_id: int, **kwargs: Any
+    ) -> FlaskResponse:
+        """Get possible values for multiple columns of a datasource.
+        ---
+        get:
+          summary: Get possible values for multiple columns of a datasource
+          description: >-
+            Returns the distinct values of each column. The values of all columns
+            are fetched in a single query when the database supports it.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: datasource_type
+            description: The type of datasource
+          - in: path
+            schema:
+              type: integer
+            name: datasource_id
+            description: The id of the datasource
+          - in: query
+            name: q
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/columns_values_schema'
+          responses:
+            200:
+              description: The distinct values of each column
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: object
+                        additionalProperties:
+                          type: array
+                          items:
+                            oneOf:
+                              - type: string
+                              - type: integer
+                              - type: number
+                              - type: boolean
+                              - type: object
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            datasource = DatasourceDAO.get_datasource(
+                DatasourceType(datasource_type), datasource_id
+            )
+            datasource.raise_for_access()
+        except ValueError:
+            return self.response(
+                400, message=f"Invalid datasource type: {datasource_type}"
+            )
+        except DatasourceTypeNotSupportedError as ex:
+            return self.response(400, message=ex.message)
+        except DatasourceNotFound as ex:
+            return self.response(404, message=ex.message)
+        except SupersetSecurityException as ex:
+            return self.response(403, message=ex.message)
+
+        row_limit = apply_max_row_limit(app.config["FILTER_SELECT_ROW_LIMIT"])
+        denormalize_column = not datasource.normalize_columns
+        try:
+            payload = get_column_values(
+                datasource,
+                kwargs["rison"]["columns"],
+                limit=row_limit,
+                denormalize_column=denormalize_column,
+                search=kwargs["rison"].get("search"),
+                force=kwargs["rison"].get("force", False),
+            )
+            return self.response(200, result=payload)
+        except KeyError as ex:
+            return self.response(
+                400, message=f"Column name {ex.args[0]} does not exist"
+            )
+        except NotImplementedError:
+            return self.response(
+                400,
+                message=(
+                    "Unable to get column values for "
+                    f"datasource type: {datasource_type}"
+                ),
+            )
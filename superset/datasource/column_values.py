@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Distinct values of datasource columns, as loaded by filter dropdowns.
+"""
+
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app as app
+
+from superset import is_feature_enabled
+from superset.extensions import cache_manager
+from superset.utils.cache import generate_cache_key, set_and_log_cache
+
+if TYPE_CHECKING:
+    from superset.models.helpers import ExploreMixin
+
+
+def get_column_values(
+    datasource: ExploreMixin,
+    column_names: list[str],
+    limit: int,
+    denormalize_column: bool = False,
+    search: str | None = None,
+    force: bool = False,
+) -> dict[str, list[Any]]:
+    """
+    Return the distinct values of columns of a datasource.
+
+    With the ``COLUMN_VALUES_CACHE`` feature flag the values of each column are
+    cached, keyed on the SQL fetching them: RLS filters, the fetch values predicate
+    and Jinja templating are part of the key. The columns missing from the cache are
+    fetched together, in a single query if the database supports it.
+
+    :param datasource: the datasource the columns belong to
+    :param column_names: names of the columns to return values for
+    :param limit: maximum number of values per column
+    :param denormalize_column: denormalize column names before querying
+    :param search: only return the values starting with this prefix, ignoring case
+    :param force: bypass the cache
+    :raises KeyError: if a column does not exist in the datasource
+    """
+    column_names = list(dict.fromkeys(column_names))
+    values: dict[str, list[Any]] = {}
+
+    cache_keys: dict[str, str] = {}
+    if is_feature_enabled("COLUMN_VALUES_CACHE"):
+        for column_name in column_names:
+            sql = datasource.get_values_for_columns_sql(
+                [column_name],
+                limit,
+                denormalize_column,
+            )
+            cache_keys[column_name] = generate_cache_key(
+                {"datasource": datasource.uid, "sql": sql},
+                key_prefix="column_values_",
+            )
+            if not force and (
+                cached := cache_manager.data_cache.get(cache_keys[column_name])
+            ):
+                values[column_name] = cached["values"]
+
+    if missing := [name for name in column_names if name not in values]:
+        for column_name, column_values in datasource.values_for_columns(
+            missing,
+            limit=limit,
+            denormalize_column=denormalize_column,
+        ).items():
+            values[column_name] = column_values
+            if column_name in cache_keys:
+                set_and_log_cache(
+                    cache_manager.data_cache,
+                    cache_keys[column_name],
+                    {"values": column_values},
+                    cache_timeout=app.config["FILTER_SELECT_CACHE_TIMEOUT"],
+                    datasource_uid=datasource.uid,
+                )
+
+    if search:
+        prefix = search.lower()
+        values = {
+            column_name: [
+                value
+                for value in column_values
+                if value is not None and str(value).lower().startswith(prefix)
+            ]
+            for column_name, column_values in values.items()
+        }
+
+    return {column_name: values[column_name] for column_name in column_names}
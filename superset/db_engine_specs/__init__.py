@@ -32,6 +32,7 @@ import inspect
 import logging
 import pkgutil
 from collections import defaultdict
+from collections.abc import Iterable
 from importlib import import_module
 from importlib.metadata import entry_points
 from pathlib import Path
@@ -86,6 +87,62 @@ def load_engine_specs() -> list[type[BaseEngineSpec]]:
     return engine_specs
 
 
+class EngineSpecRegistry:
+    """
+    An index of DB engine specs by backend and driver.
+
+    Engine specs are indexed by their engine and engine aliases, keeping the order in
+    which they were loaded, and the spec resolved for each backend and driver is kept,
+    since Superset only ever connects to a handful of them.
+    """
+
+    def __init__(self, engine_specs: Iterable[type[BaseEngineSpec]]) -> None:
+        self.engine_specs = list(engine_specs)
+        self.backends: dict[str, list[type[BaseEngineSpec]]] = defaultdict(list)
+        for engine_spec in self.engine_specs:
+            for backend in dict.fromkeys(
+                [engine_spec.engine, *engine_spec.engine_aliases]
+            ):
+                self.backends[backend].append(engine_spec)
+        self._resolved: dict[tuple[str, Optional[str]], type[BaseEngineSpec]] = {}
+
+    def get(self, backend: str, driver: Optional[str] = None) -> type[BaseEngineSpec]:
+        key = (backend, driver)
+        if (engine_spec := self._resolved.get(key)) is None:
+            engine_spec = self._resolved[key] = self._resolve(backend, driver)
+        return engine_spec
+
+    def _resolve(self, backend: str, driver: Optional[str]) -> type[BaseEngineSpec]:
+        engine_specs = self.backends.get(backend, [])
+
+        if driver is not None:
+            for engine_spec in engine_specs:
+                if engine_spec.supports_backend(backend, driver):
+                    return engine_spec
+
+        # check ignoring the driver, in order to support new drivers; this will return a
+        # random DB engine spec that supports the engine
+        for engine_spec in engine_specs:
+            if engine_spec.supports_backend(backend):
+                return engine_spec
+
+        # default to the generic DB engine spec
+        return BaseEngineSpec
+
+
+_registry: Optional[EngineSpecRegistry] = None
+
+
+def get_engine_spec_registry() -> EngineSpecRegistry:
+    """
+    Return the registry of engine specs, loading them on first use.
+    """
+    global _registry  # pylint: disable=global-statement
+    if _registry is None:
+        _registry = EngineSpecRegistry(load_engine_specs())
+    return _registry
+
+
 def get_engine_spec(backend: str, driver: Optional[str] = None) -> type[BaseEngineSpec]:
     """
     Return the DB engine spec associated with a given SQLAlchemy URL.
@@ -96,21 +153,7 @@ def get_engine_spec(backend: str, driver: Optional[str] = None) -> type[BaseEngi
     drivers to work with Superset even if they are not listed in the DB engine spec
     drivers.
     """  # noqa: E501
-    engine_specs = load_engine_specs()
-
-    if driver is not None:
-        for engine_spec in engine_specs:
-            if engine_spec.supports_backend(backend, driver):
-                return engine_spec
-
-    # check ignoring the driver, in order to support new drivers; this will return a
-    # random DB engine spec that supports the engine
-    for engine_spec in engine_specs:
-        if engine_spec.supports_backend(backend):
-            return engine_spec
-
-    # default to the generic DB engine spec
-    return BaseEngineSpec
+    return get_engine_spec_registry().get(backend, driver)
 
 
 # there's a mismatch between the dialect name reported by the driver in these
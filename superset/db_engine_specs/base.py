@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterable
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
@@ -38,6 +39,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -55,6 +57,7 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import literal_column, quoted_name, text
 from sqlalchemy.sql.expression import BinaryExpression, ColumnClause, Select, TextClause
+from sqlalchemy.sql.visitors import InternalTraversal
 from sqlalchemy.types import TypeEngine
 
 from superset import db
@@ -71,6 +74,7 @@ from superset.sql.parse import (
     Table,
 )
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -144,6 +148,14 @@ builtin_time_grains: dict[str | None, str] = {
 
 
 class TimestampExpression(ColumnClause):  # pylint: disable=abstract-method, too-many-ancestors
+    # the target column is part of the cache key of the expression, so that statements
+    # with expressions on different columns aren't compiled to the same SQL
+    _traverse_internals = ColumnClause._traverse_internals + [
+        ("col", InternalTraversal.dp_clauseelement)
+    ]
+    _cache_key_traversal = _traverse_internals
+    inherit_cache = True
+
     def __init__(self, expr: str, col: ColumnClause, **kwargs: Any) -> None:
         """Sqlalchemy class that can be used to render native column elements respecting
         engine-specific quoting rules as part of a string-based expression.
@@ -342,6 +354,13 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # Needed on certain databases that return values in an unexpected format
     column_type_mutators: dict[TypeEngine, Callable[[Any], Any]] = {}
 
+    # vectorized equivalents of ``column_type_mutators``, applied to whole columns
+    # of results fetched as Arrow (see ``fetch_arrow``). Columns with a mutator in
+    # ``column_type_mutators`` but not here are mutated value by value.
+    arrow_column_type_mutators: dict[
+        TypeEngine, Callable[[pa.ChunkedArray], pa.ChunkedArray | pa.Array]
+    ] = {}
+
     # Does database support join-free timeslot grouping
     time_groupby_inline = False
     limit_method = LimitMethod.FORCE_LIMIT
@@ -367,6 +386,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # But for backward compatibility, False by default
     allows_hidden_cc_in_orderby = False
 
+    # Whether ``GROUP BY GROUPING SETS`` and the ``GROUPING`` function are supported,
+    # allowing the distinct values of multiple columns to be fetched in a single scan
+    supports_grouping_sets = False
+
     # Whether allow CTE as subquery or regular CTE
     # If True, then it will allow  in subquery ,
     # if False it will allow as regular CTE
@@ -401,6 +424,11 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Whether uploaded files can be written to the database in chunks, as they are
+    # read, with `df_chunks_to_sql`. Engine specs overriding `df_to_sql` should
+    # disable it, or override `df_chunks_to_sql` as well.
+    supports_streaming_upload = True
+
     # Is the DB engine spec able to change the default schema? This requires implementing  # noqa: E501
     # a custom `adjust_engine_params` method.
     supports_dynamic_schema = False
@@ -983,18 +1011,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
             description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
+            column_mutators = cls.get_column_mutators(
+                description,
+                cls.column_type_mutators,
+            )
             if column_mutators:
                 indexes = {row[0]: idx for idx, row in enumerate(description)}
                 for row_idx, row in enumerate(data):
@@ -1008,6 +1028,109 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def get_column_mutators(
+        cls,
+        description: DbapiDescription,
+        mutators: dict[TypeEngine, Callable[..., Any]],
+    ) -> dict[str, Callable[..., Any]]:
+        """
+        Map the columns of a cursor description to the mutator of their type.
+
+        The first two items in the description row are the column name and type.
+
+        :param description: The cursor description
+        :param mutators: Mutator functions keyed by SQLAlchemy type
+        :return: Mutator functions keyed by column name
+        """
+        if not mutators:
+            return {}
+
+        return {
+            row[0]: func
+            for row in description
+            if (
+                func := mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch the results of a cursor as an Arrow table, for drivers that can return
+        Arrow natively.
+
+        This skips building a Python tuple per row, and applies column mutators to
+        whole columns. When the driver can't return Arrow ``None`` is returned
+        without consuming the cursor, and results should be fetched with
+        ``fetch_data`` instead.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or ``None`` if Arrow is not supported
+        """
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        try:
+            table = cls.fetch_native_arrow(cursor, limit)
+            if table is None:
+                return None
+            if limit is not None and table.num_rows > limit:
+                table = table.slice(0, limit)
+            return cls.mutate_arrow_table(table, cursor.description or [])
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def fetch_native_arrow(
+        cls, cursor: Any, limit: int | None = None
+    ) -> pa.Table | None:
+        """
+        Fetch results from the driver as an Arrow table.
+
+        Engine specs whose driver exposes an Arrow API should override this method.
+        It must return ``None`` without consuming the cursor when the results can't be
+        fetched as Arrow.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be fetched, if the driver supports it
+        :return: Result of query, or ``None`` if Arrow is not supported
+        """
+        return None
+
+    @classmethod
+    def mutate_arrow_table(
+        cls,
+        table: pa.Table,
+        description: DbapiDescription,
+    ) -> pa.Table:
+        """
+        Apply the column type mutators to an Arrow table.
+
+        :param table: The results fetched as Arrow
+        :param description: The cursor description
+        :return: The mutated table
+        """
+        arrow_mutators = cls.get_column_mutators(
+            description,
+            cls.arrow_column_type_mutators,
+        )
+        value_mutators = cls.get_column_mutators(description, cls.column_type_mutators)
+        for idx, name in enumerate(table.column_names):
+            if func := arrow_mutators.get(name):
+                column = func(table.column(idx))
+            elif func := value_mutators.get(name):
+                column = pa.array(
+                    [func(value) for value in table.column(idx).to_pylist()]
+                )
+            else:
+                continue
+            table = table.set_column(idx, name, column)
+
+        return table
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1185,13 +1308,76 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
+            if method := cls.get_df_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from a sequence of Pandas DataFrames to a database table.
+
+        The first DataFrame honors the `if_exists` argument and the following ones
+        are appended to the table. All of them are written on a single connection in
+        a single transaction, which is rolled back if any of them fails, so that the
+        table isn't left partially loaded. A replaced table is only restored on
+        databases with transactional DDL.
+
+        Only used when `supports_streaming_upload` is set.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param dfs: The dataframes with data to be uploaded, with the same dtypes
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        to_sql_kwargs["name"] = table.table
+
+        if table.schema:
+            # Only add schema when it is preset and non-empty.
+            to_sql_kwargs["schema"] = table.schema
+
+        with cls.get_engine(
+            database,
+            catalog=table.catalog,
+            schema=table.schema,
+        ) as engine:
+            if method := cls.get_df_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
+            with engine.begin() as connection:
+                for df in dfs:
+                    df.to_sql(con=connection, **to_sql_kwargs)
+                    to_sql_kwargs["if_exists"] = "append"
+
+    @classmethod
+    def get_df_to_sql_method(
+        cls,
+        engine: Engine,
+    ) -> str | Callable[..., Any] | None:
+        """
+        Return the insertion method used by `pandas.DataFrame.to_sql` in `df_to_sql`.
+
+        Can be overridden by engines that have a native bulk loading mechanism, by
+        returning a callable with the `(pd_table, conn, keys, data_iter)` signature
+        expected by pandas. Returning `None` uses a plain `executemany` insert.
+
+        :param engine: The SQLAlchemy engine used for the upload
+        :return: The `method` argument for `pandas.DataFrame.to_sql`
+        """
+        if (
+            engine.dialect.supports_multivalues_insert
+            or cls.supports_multivalues_insert
+        ):
+            return "multi"
+        return None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -133,7 +133,12 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
     # same cursor, so we need to run all statements at once
     run_multiple_statements_as_one = True
 
+    # `df_to_sql` uploads with `pandas_gbq`, which can't write several DataFrames in
+    # a single transaction
+    supports_streaming_upload = False
+
     allows_hidden_cc_in_orderby = True
+    supports_grouping_sets = True
 
     supports_catalog = supports_dynamic_catalog = supports_cross_catalog_queries = True
 
@@ -38,6 +38,8 @@ from superset.utils.core import get_user_agent, QuerySource
 from superset.utils.network import is_hostname_valid, is_port_open
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.models.core import Database
 
 
@@ -266,6 +268,17 @@ class DatabricksDynamicBaseEngineSpec(BasicParametersMixin, DatabricksBaseEngine
 
         return extra
 
+    @classmethod
+    def fetch_native_arrow(
+        cls, cursor: Any, limit: int | None = None
+    ) -> pa.Table | None:
+        # only available in the cursor of ``databricks-sql-connector``
+        if not cursor.description or not hasattr(cursor, "fetchall_arrow"):
+            return None
+        if limit:
+            return cursor.fetchmany_arrow(limit)
+        return cursor.fetchall_arrow()
+
     @classmethod
     def get_table_names(
         cls,
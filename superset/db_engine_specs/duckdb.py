@@ -38,6 +38,8 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.utils.core import get_user_agent, QuerySource
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.models.core import Database
 
 
@@ -197,6 +199,8 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
 
     sqlalchemy_uri_placeholder = "duckdb:////path/to/duck.db"
 
+    supports_grouping_sets = True
+
     _time_grain_expressions = {
         None: "{col}",
         TimeGrain.SECOND: "DATE_TRUNC('second', {col})",
@@ -217,6 +221,15 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
         ),
     }
 
+    @classmethod
+    def fetch_native_arrow(
+        cls, cursor: Any, limit: int | None = None
+    ) -> pa.Table | None:
+        # the cursor of ``duckdb_engine`` proxies the DuckDB connection
+        if not cursor.description or not hasattr(cursor, "fetch_arrow_table"):
+            return None
+        return cursor.fetch_arrow_table()
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "datetime({col}, 'unixepoch')"
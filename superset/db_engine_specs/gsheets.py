@@ -120,6 +120,9 @@ class GSheetsEngineSpec(ShillelaghEngineSpec):
 
     supports_file_upload = True
 
+    # `df_to_sql` uploads each file to a new sheet
+    supports_streaming_upload = False
+
     # OAuth 2.0
     supports_oauth2 = True
     oauth2_scope = " ".join(SCOPES)
@@ -97,6 +97,9 @@ class HiveEngineSpec(PrestoEngineSpec):
     supports_dynamic_schema = True
     supports_cross_catalog_queries = False
 
+    # `df_to_sql` can't append to an existing table
+    supports_streaming_upload = False
+
     # When running `SHOW FUNCTIONS`, what is the name of the column with the
     # function names?
     _show_functions_column = "tab_name"
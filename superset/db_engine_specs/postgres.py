@@ -19,13 +19,16 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime
+from io import StringIO
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -94,6 +97,53 @@ def parse_options(connect_args: dict[str, Any]) -> dict[str, str]:
     return {token[0]: token[1] for token in tokens}
 
 
+def _copy_text_value(value: Any) -> str:
+    """
+    Serialize a value for the text format of ``COPY``.
+    """
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_from_stdin(
+    pd_table: Any,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert rows with ``COPY ... FROM STDIN``, for use as the ``method`` argument of
+    ``pandas.DataFrame.to_sql``.
+
+    Rows are streamed to the server in a single round trip instead of being sent as
+    (multi-row) ``INSERT`` statements.
+    """
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.quote(pd_table.name)
+    if pd_table.schema:
+        table_name = f"{preparer.quote_schema(pd_table.schema)}.{table_name}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+
+    buffer = StringIO()
+    rowcount = 0
+    for row in data_iter:
+        buffer.write("\t".join(_copy_text_value(value) for value in row))
+        buffer.write("\n")
+        rowcount += 1
+    buffer.seek(0)
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN", buffer)
+    return rowcount
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -206,6 +256,7 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
     supports_dynamic_schema = True
     supports_catalog = True
     supports_dynamic_catalog = True
+    supports_grouping_sets = True
 
     default_driver = "psycopg2"
     sqlalchemy_uri_placeholder = (
@@ -481,3 +532,12 @@ WHERE datistemplate = false;
             return False
 
         return True
+
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Use ``COPY FROM STDIN`` to upload data when the driver supports it.
+        """
+        if engine.dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_df_to_sql_method(engine)
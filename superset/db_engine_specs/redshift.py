@@ -18,6 +18,8 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
+from itertools import chain
 from re import Pattern
 from typing import Any
 
@@ -127,7 +129,44 @@ class RedshiftEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
         :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
         """
         to_sql_kwargs = to_sql_kwargs or {}
-        to_sql_kwargs["dtype"] = {
+        to_sql_kwargs["dtype"] = cls._get_nvarchar_dtypes(df)
+
+        super().df_to_sql(
+            df=df, database=database, table=table, to_sql_kwargs=to_sql_kwargs
+        )
+
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from a sequence of Pandas DataFrames to a database table.
+
+        Like `df_to_sql`, pandas string types are used as nvarchar(max) columns. The
+        DataFrames share the same dtypes, so the column types are taken from the first
+        one.
+        """
+        dfs = iter(dfs)
+        if (first := next(dfs, None)) is None:
+            return
+
+        to_sql_kwargs = to_sql_kwargs or {}
+        to_sql_kwargs["dtype"] = cls._get_nvarchar_dtypes(first)
+
+        super().df_chunks_to_sql(
+            database=database,
+            table=table,
+            dfs=chain([first], dfs),
+            to_sql_kwargs=to_sql_kwargs,
+        )
+
+    @staticmethod
+    def _get_nvarchar_dtypes(df: pd.DataFrame) -> dict[str, NVARCHAR]:
+        return {
             # uses the max size for redshift nvarchar(65335)
             # the default object and string types create a varchar(256)
             col_name: NVARCHAR(length=65535)
@@ -135,10 +174,6 @@ class RedshiftEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
             if isinstance(type, pd.StringDtype)
         }
 
-        super().df_to_sql(
-            df=df, database=database, table=table, to_sql_kwargs=to_sql_kwargs
-        )
-
     @staticmethod
     def _mutate_label(label: str) -> str:
         """
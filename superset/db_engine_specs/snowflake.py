@@ -44,6 +44,8 @@ from superset.utils import json
 from superset.utils.core import get_user_agent, QuerySource
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.models.core import Database
 
 # Regular expressions to catch custom errors
@@ -92,6 +94,7 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
     supports_dynamic_schema = True
     supports_catalog = supports_dynamic_catalog = supports_cross_catalog_queries = True
+    supports_grouping_sets = True
 
     # pylint: disable=invalid-name
     encrypted_extra_sensitive_fields = {
@@ -151,6 +154,26 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
         return extra
 
+    @classmethod
+    def fetch_native_arrow(
+        cls, cursor: Any, limit: int | None = None
+    ) -> pa.Table | None:
+        """
+        Fetch the results with the Arrow API of the Snowflake connector.
+
+        The connector only returns Arrow for results in the Arrow format, which is
+        checked before any rows are fetched.
+        """
+        # pylint: disable=import-outside-toplevel
+        from snowflake.connector.errors import NotSupportedError
+
+        if not cursor.description or not hasattr(cursor, "fetch_arrow_all"):
+            return None
+        try:
+            return cursor.fetch_arrow_all()
+        except NotSupportedError:
+            return None
+
     @classmethod
     def adjust_engine_params(
         cls,
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID, uuid3
@@ -44,10 +45,13 @@ class SupersetMetastoreCache(BaseCache):
         namespace: UUID,
         codec: KeyValueCodec,
         default_timeout: int = 300,
+        prune_interval: Optional[int] = 300,
     ) -> None:
         super().__init__(default_timeout)
         self.namespace = namespace
         self.codec = codec
+        self.prune_interval = prune_interval
+        self._pruned_at: Optional[float] = None
 
     @classmethod
     def factory(
@@ -66,6 +70,7 @@ class SupersetMetastoreCache(BaseCache):
                 "use at your own risk."
             )
         kwargs["codec"] = codec
+        kwargs["prune_interval"] = config.get("PRUNE_INTERVAL", 300)
         return cls(*args, **kwargs)
 
     def get_key(self, key: str) -> UUID:
@@ -77,6 +82,21 @@ class SupersetMetastoreCache(BaseCache):
             return datetime.now() + timedelta(seconds=timeout)
         return None
 
+    def _prune_expired_entries(self) -> None:
+        """
+        Delete expired entries at most every ``prune_interval`` seconds; they are
+        otherwise deleted by the ``prune_key_value`` Celery task.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        if self.prune_interval is None:
+            return
+        now = time.monotonic()
+        if self._pruned_at is None or now - self._pruned_at >= self.prune_interval:
+            KeyValueDAO.delete_expired_entries(RESOURCE)
+            self._pruned_at = now
+
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
@@ -91,17 +111,38 @@ class SupersetMetastoreCache(BaseCache):
         db.session.commit()  # pylint: disable=consider-using-transaction
         return True
 
+    def set_many(
+        self, mapping: dict[str, Any], timeout: Optional[int] = None
+    ) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        KeyValueDAO.upsert_entries(
+            resource=RESOURCE,
+            values={self.get_key(key): value for key, value in mapping.items()},
+            codec=self.codec,
+            expires_on=self._get_expiry(timeout),
+        )
+        db.session.commit()  # pylint: disable=consider-using-transaction
+        return list(mapping)
+
     def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
         try:
-            KeyValueDAO.delete_expired_entries(RESOURCE)
+            self._prune_expired_entries()
+            uuid_key = self.get_key(key)
+            if (entry := KeyValueDAO.get_entry(RESOURCE, uuid_key)) and (
+                entry.is_expired()
+            ):
+                db.session.delete(entry)
+                db.session.flush()
             KeyValueDAO.create_entry(
                 resource=RESOURCE,
                 value=value,
                 codec=self.codec,
-                key=self.get_key(key),
+                key=uuid_key,
                 expires_on=self._get_expiry(timeout),
             )
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -116,6 +157,14 @@ class SupersetMetastoreCache(BaseCache):
 
         return KeyValueDAO.get_value(RESOURCE, self.get_key(key), self.codec)
 
+    def get_many(self, *keys: str) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        uuid_keys = [self.get_key(key) for key in keys]
+        values = KeyValueDAO.get_values(RESOURCE, uuid_keys, self.codec)
+        return [values.get(uuid_key) for uuid_key in uuid_keys]
+
     def has(self, key: str) -> bool:
         entry = self.get(key)
         if entry:
@@ -128,3 +177,12 @@ class SupersetMetastoreCache(BaseCache):
         from superset.daos.key_value import KeyValueDAO
 
         return KeyValueDAO.delete_entry(RESOURCE, self.get_key(key))
+
+    @transaction()
+    def delete_many(self, *keys: str) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        uuid_keys = {self.get_key(key): key for key in keys}
+        deleted = KeyValueDAO.delete_entries(RESOURCE, list(uuid_keys))
+        return [uuid_keys[uuid_key] for uuid_key in deleted]
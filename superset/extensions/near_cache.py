@@ -0,0 +1,262 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import pickle
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from typing import Any, Optional
+from uuid import uuid4
+
+from flask_caching import BaseCache
+
+from superset.extensions import stats_logger_manager
+
+logger = logging.getLogger(__name__)
+
+# prefix of the keys of the shared cache holding the generation of each bucket of keys
+GENERATION_KEY = "superset_near_cache_generation"
+
+
+class SupersetNearCache(BaseCache):
+    """
+    Cache keeping the recently used entries of a shared cache in process memory.
+
+    Reads are served from a bounded LRU of pickled values (L1) before falling back
+    to the wrapped cache (L2). Entries expire from L1 after ``default_timeout``
+    seconds, or sooner if they were set with a shorter timeout.
+
+    Keys are hashed into ``generation_buckets`` buckets, each with a generation in
+    the shared cache which is replaced by a new random one on every write to a key
+    of the bucket. Values are set along with the generation of their bucket in a
+    single ``set_many``. Other processes check the generations at most every
+    ``generation_check_interval`` seconds and drop the entries of the buckets which
+    changed, which bounds how long they can serve stale entries while writes only
+    evict a fraction of their L1.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        cache: BaseCache,
+        name: str,
+        threshold: int = 500,
+        default_timeout: int = 10,
+        generation_check_interval: float = 1.0,
+        generation_buckets: int = 64,
+    ) -> None:
+        super().__init__(default_timeout)
+        self.cache = cache
+        self.name = name
+        self.threshold = threshold
+        self.generation_check_interval = generation_check_interval
+        self.generation_buckets = generation_buckets
+        self.stats: Counter[str] = Counter()
+        self._entries: OrderedDict[str, tuple[float, int, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generations: dict[int, Any] = {}
+        self._checked_at = 0.0
+
+    @classmethod
+    def from_config(
+        cls, cache: BaseCache, name: str, config: dict[str, Any]
+    ) -> "SupersetNearCache":
+        return cls(
+            cache,
+            name,
+            threshold=config.get("CACHE_THRESHOLD", 500),
+            default_timeout=config.get("CACHE_DEFAULT_TIMEOUT", 10),
+            generation_check_interval=config.get("GENERATION_CHECK_INTERVAL", 1.0),
+            generation_buckets=config.get("GENERATION_BUCKETS", 64),
+        )
+
+    def _incr(self, stat: str) -> None:
+        self.stats[stat] += 1
+        stats_logger_manager.instance.incr(f"near_cache.{self.name}.{stat}")
+
+    def _bucket(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % self.generation_buckets
+
+    @staticmethod
+    def _generation_key(bucket: int) -> str:
+        return f"{GENERATION_KEY}_{bucket}"
+
+    def _drop_buckets(self, buckets: set[int]) -> None:
+        # must be called with the lock held
+        for key in [k for k, e in self._entries.items() if e[1] in buckets]:
+            del self._entries[key]
+
+    def _check_generation(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.generation_check_interval:
+            return
+        self._checked_at = now
+        buckets = range(self.generation_buckets)
+        generations = self.cache.get_many(*map(self._generation_key, buckets))
+        with self._lock:
+            if changed := {
+                bucket
+                for bucket, generation in zip(buckets, generations, strict=True)
+                if generation != self._generations.get(bucket)
+            }:
+                self._drop_buckets(changed)
+                self._generations = dict(zip(buckets, generations, strict=True))
+
+    def _new_generations(self, keys: list[str]) -> dict[str, str]:
+        """
+        Return new generations of the buckets of the given keys, to be written to the
+        shared cache along with the keys.
+        """
+        generation = uuid4().hex
+        buckets = {self._bucket(key) for key in keys}
+        with self._lock:
+            # another process may have written to these buckets since the last
+            # check, so their entries may be stale
+            self._drop_buckets(buckets)
+            for bucket in buckets:
+                self._generations[bucket] = generation
+        return {self._generation_key(bucket): generation for bucket in buckets}
+
+    def _bump_generation(self, *keys: str) -> None:
+        self.cache.set_many(self._new_generations(list(keys)), timeout=0)
+
+    def _get_local(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _bucket, payload = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _set_local(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        ttl = self.default_timeout
+        timeout = self._normalize_timeout(timeout) if timeout is not None else None
+        if timeout is not None and timeout > 0:
+            ttl = min(ttl, timeout)
+        try:
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            self._delete_local(key)
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, self._bucket(key), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.threshold:
+                self._entries.popitem(last=False)
+
+    def _delete_local(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def get(self, key: str) -> Any:
+        self._check_generation()
+        if (payload := self._get_local(key)) is not None:
+            self._incr("l1_hit")
+            return pickle.loads(payload)  # noqa: S301
+        self._incr("l1_miss")
+
+        value = self.cache.get(key)
+        if value is None:
+            self._incr("l2_miss")
+        else:
+            self._incr("l2_hit")
+            self._set_local(key, value)
+        return value
+
+    def get_many(self, *keys: str) -> list[Any]:
+        self._check_generation()
+        values: dict[str, Any] = {}
+        missing = []
+        for key in keys:
+            if (payload := self._get_local(key)) is not None:
+                self._incr("l1_hit")
+                values[key] = pickle.loads(payload)  # noqa: S301
+            else:
+                self._incr("l1_miss")
+                missing.append(key)
+
+        if missing:
+            for key, value in zip(missing, self.cache.get_many(*missing), strict=True):
+                if value is None:
+                    self._incr("l2_miss")
+                else:
+                    self._incr("l2_hit")
+                    self._set_local(key, value)
+                values[key] = value
+
+        return [values[key] for key in keys]
+
+    def has(self, key: str) -> bool:
+        self._check_generation()
+        return self._get_local(key) is not None or self.cache.has(key)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> Any:
+        generations = self._new_generations([key])
+        result = key in self.cache.set_many({key: value, **generations}, timeout)
+        if result:
+            self._set_local(key, value, timeout)
+        return result
+
+    def set_many(self, mapping: dict[str, Any], timeout: Optional[int] = None) -> Any:
+        generations = self._new_generations(list(mapping))
+        result = self.cache.set_many({**mapping, **generations}, timeout)
+        for key, value in mapping.items():
+            self._set_local(key, value, timeout)
+        return [key for key in result if key not in generations]
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        result = self.cache.add(key, value, timeout)
+        if result:
+            self._bump_generation(key)
+            self._set_local(key, value, timeout)
+        return result
+
+    def delete(self, key: str) -> bool:
+        self._delete_local(key)
+        result = self.cache.delete(key)
+        self._bump_generation(key)
+        return result
+
+    def delete_many(self, *keys: str) -> Any:
+        self._delete_local(*keys)
+        result = self.cache.delete_many(*keys)
+        self._bump_generation(*keys)
+        return result
+
+    def inc(self, key: str, delta: int = 1) -> Optional[int]:
+        self._delete_local(key)
+        result = self.cache.inc(key, delta)
+        self._bump_generation(key)
+        return result
+
+    def dec(self, key: str, delta: int = 1) -> Optional[int]:
+        self._delete_local(key)
+        result = self.cache.dec(key, delta)
+        self._bump_generation(key)
+        return result
+
+    def clear(self) -> bool:
+        with self._lock:
+            self._entries.clear()
+            self._generations = {}
+        return self.cache.clear()
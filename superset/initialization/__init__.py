@@ -20,6 +20,7 @@ import contextlib
 import logging
 import os
 import sys
+import threading
 from typing import Any, Callable, TYPE_CHECKING
 
 import wtforms_json
@@ -37,6 +38,7 @@ from flask_compress import Compress
 from flask_session import Session
 from sqlalchemy import inspect
 from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.routing import BuildError
 
 from superset.constants import CHANGE_ME_SECRET_KEY
 from superset.databases.utils import make_url_safe
@@ -60,13 +62,14 @@ from superset.extensions import (
     stats_logger_manager,
     talisman,
 )
-from superset.security import SupersetSecurityManager
+from superset.security import access_index, SupersetSecurityManager
 from superset.sql.parse import SQLGLOT_DIALECTS
 from superset.superset_typing import FlaskResponse
 from superset.tags.core import register_sqla_event_listeners
 from superset.utils.core import is_test, pessimistic_connection_handling
 from superset.utils.decorators import transaction
 from superset.utils.log import DBEventLogger, get_event_logger_from_cfg_value
+from superset.utils.profiler import StartupProfiler
 
 if TYPE_CHECKING:
     from superset.app import SupersetApp
@@ -81,6 +84,12 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.superset_app = app
         self.config = app.config
         self.manifest: dict[Any, Any] = {}
+        self.startup_profiler: StartupProfiler | None = None
+        # whether the app is initialized for a worker which doesn't serve requests
+        self.worker = False
+        # guards registering the views lazily, see `_init_lazy_views`
+        self._lazy_views_lock = threading.Lock()
+        self._lazy_views_initialized = False
 
     @deprecated(details="use self.superset_app instead of self.flask_app")  # type: ignore
     @property
@@ -498,6 +507,16 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         if feature_flag_manager.is_feature_enabled("TAGGING_SYSTEM"):
             register_sqla_event_listeners()
 
+        # Register SQLA event listeners invalidating the dataset access index
+        if feature_flag_manager.is_feature_enabled("DATASET_ACCESS_INDEX"):
+            if access_index.is_cache_shared():
+                access_index.register_sqla_event_listeners()
+            else:
+                logger.error(
+                    "The DATASET_ACCESS_INDEX feature requires a CACHE_CONFIG shared "
+                    "by all the processes, like Redis or Memcached; it is disabled"
+                )
+
         # Seed system themes from configuration
         from superset.commands.theme.seed import SeedSystemThemesCommand
 
@@ -508,13 +527,13 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         """
         Runs init logic in the context of the app
         """
-        self.configure_fab()
-        self.configure_url_map_converters()
-        self.configure_data_sources()
-        self.configure_auth_provider()
-        self.configure_async_queries()
-        self.configure_ssh_manager()
-        self.configure_stats_manager()
+        self._run_step(self.configure_fab)
+        self._run_step(self.configure_url_map_converters)
+        self._run_step(self.configure_data_sources)
+        self._run_step(self.configure_auth_provider)
+        self._run_step(self.configure_async_queries)
+        self._run_step(self.configure_ssh_manager)
+        self._run_step(self.configure_stats_manager)
 
         # Hook that provides administrators a handle on the Flask APP
         # after initialization
@@ -522,9 +541,33 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
             flask_app_mutator(self.superset_app)
 
         # Initialize database-dependent features only if database is ready
-        self._init_database_dependent_features()
+        self._run_step(self._init_database_dependent_features)
+
+        if self.worker and self.config["WORKER_LAZY_VIEWS"]:
+            self.superset_app.url_build_error_handlers.append(self._init_lazy_views)
+        else:
+            self._run_step(self.init_views)
+
+    def _init_lazy_views(
+        self, error: BuildError, endpoint: str, values: dict[str, Any]
+    ) -> str:
+        """
+        Register the views the first time a URL can't be built, and build it again.
 
-        self.init_views()
+        Threads of a worker can build their first URL at the same time, so the views
+        are registered by the first one while the others wait for it. The handler is
+        only removed once the views are registered, so that no thread fails to build
+        a URL in the meantime.
+        """
+        with self._lazy_views_lock:
+            if not self._lazy_views_initialized:
+                self._lazy_views_initialized = True
+                logger.info("Registering views to build the URL of %s", endpoint)
+                self.init_views()
+                self.superset_app.url_build_error_handlers.remove(
+                    self._init_lazy_views
+                )
+        return url_for(endpoint, **values)
 
     def check_secret_key(self) -> None:
         def log_default_secret_key_warning() -> None:
@@ -612,35 +655,56 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         Main entry point which will delegate to other methods in
         order to fully init the app
         """
-        self.pre_init()
-        self.check_secret_key()
-        self.configure_session()
+        if self.config["STARTUP_PROFILING"]:
+            self.startup_profiler = StartupProfiler()
+
+        with self.startup_profiler or contextlib.nullcontext():
+            self._init_app()
+
+        if self.startup_profiler:
+            logger.info(self.startup_profiler.report())
+
+    def _init_app(self) -> None:
+        self._run_step(self.pre_init)
+        self._run_step(self.check_secret_key)
+        self._run_step(self.configure_session)
         # Configuration of logging must be done first to apply the formatter properly
-        self.configure_logging()
+        self._run_step(self.configure_logging)
         # Configuration of feature_flags must be done first to allow init features
         # conditionally
-        self.configure_feature_flags()
-        self.configure_db_encrypt()
-        self.setup_db()
+        self._run_step(self.configure_feature_flags)
+        self._run_step(self.configure_db_encrypt)
+        self._run_step(self.setup_db)
 
         # Check database connection and warn if unavailable
-        self.check_and_warn_database_connection()
-
-        self.configure_celery()
-        self.enable_profiling()
-        self.setup_event_logger()
-        self.setup_bundle_manifest()
-        self.register_blueprints()
-        self.configure_wtf()
-        self.configure_middlewares()
-        self.configure_cache()
-        self.set_db_default_isolation()
-        self.configure_sqlglot_dialects()
+        self._run_step(self.check_and_warn_database_connection)
+
+        self._run_step(self.configure_celery)
+        self._run_step(self.enable_profiling)
+        self._run_step(self.setup_event_logger)
+        self._run_step(self.setup_bundle_manifest)
+        self._run_step(self.register_blueprints)
+        self._run_step(self.configure_wtf)
+        self._run_step(self.configure_middlewares)
+        self._run_step(self.configure_cache)
+        self._run_step(self.set_db_default_isolation)
+        self._run_step(self.configure_sqlglot_dialects)
 
         with self.superset_app.app_context():
             self.init_app_in_ctx()
 
-        self.post_init()
+        self._run_step(self.post_init)
+
+    def _run_step(self, step: Callable[[], None]) -> None:
+        """
+        Run an initialization step, timing it when profiling the startup.
+        """
+        if self.startup_profiler is None:
+            step()
+            return
+
+        with self.startup_profiler.step(step.__name__):
+            step()
 
     def set_db_default_isolation(self) -> None:
         # This block sets the default isolation level for mysql to READ COMMITTED if not
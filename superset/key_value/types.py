@@ -41,6 +41,7 @@ class KeyValueFilter(TypedDict, total=False):
 
 class KeyValueResource(StrEnum):
     APP = "app"
+    CATALOG_INDEX = "catalog_index"
     DASHBOARD_PERMALINK = "dashboard_permalink"
     EXPLORE_PERMALINK = "explore_permalink"
     METASTORE_CACHE = "superset_metastore_cache"
@@ -24,6 +24,7 @@ from __future__ import annotations
 import builtins
 import logging
 import textwrap
+import weakref
 from ast import literal_eval
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
@@ -63,7 +64,11 @@ from sqlalchemy.sql import ColumnElement, expression, Select
 
 from superset import db, db_engine_specs, is_feature_enabled
 from superset.commands.database.exceptions import DatabaseInvalidError
-from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK
+from superset.constants import (
+    COMPILED_QUERY_CACHE_MAX_SIZE,
+    LRU_CACHE_MAX_SIZE,
+    PASSWORD_MASK,
+)
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
@@ -75,6 +80,7 @@ from superset.extensions import (
 )
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin, UUIDMixin
 from superset.result_set import SupersetResultSet
+from superset.sql.compiled import CompiledQueryCache
 from superset.sql.parse import SQLScript, Table
 from superset.superset_typing import (
     DbapiDescription,
@@ -93,7 +99,17 @@ from superset.utils.oauth2 import (
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 
+# templates of the SQL of the queries of charts, which only differ in their values
+compiled_query_cache = CompiledQueryCache(max_size=COMPILED_QUERY_CACHE_MAX_SIZE)
+
+# the URL of each database the DB engine spec is resolved from, by URI
+_db_engine_spec_urls: weakref.WeakKeyDictionary[Database, tuple[str, URL]] = (
+    weakref.WeakKeyDictionary()
+)
+
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.databases.ssh_tunnel.models import SSHTunnel
     from superset.models.sql_lab import Query
 
@@ -707,18 +723,23 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             return self.post_process_df(df)
 
     @event_logger.log_this
-    def fetch_rows(self, cursor: Any, last: bool) -> list[tuple[Any, ...]] | None:
+    def fetch_rows(
+        self, cursor: Any, last: bool
+    ) -> list[tuple[Any, ...]] | pa.Table | None:
         if not last:
             cursor.fetchall()
             return None
 
-        return self.db_engine_spec.fetch_data(cursor)
+        rows = self.db_engine_spec.fetch_arrow(cursor)
+        if rows is None:
+            rows = self.db_engine_spec.fetch_data(cursor)
+        return rows
 
     @event_logger.log_this
     def load_into_dataframe(
         self,
         description: DbapiDescription,
-        data: list[tuple[Any, ...]],
+        data: list[tuple[Any, ...]] | pa.Table,
     ) -> pd.DataFrame:
         result_set = SupersetResultSet(
             data,
@@ -735,7 +756,18 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         is_virtual: bool = False,
     ) -> str:
         with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
-            sql = str(qry.compile(engine, compile_kwargs={"literal_binds": True}))
+            sql = compiled_query_cache.compile(
+                qry,
+                engine.dialect,
+                scope=(
+                    self.id,
+                    self.sqlalchemy_uri,
+                    self.extra,
+                    catalog,
+                    schema,
+                    engine.dialect.server_version_info,
+                ),
+            )
 
             # pylint: disable=protected-access
             if engine.dialect.identifier_preparer._double_percents:  # noqa
@@ -926,7 +958,12 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
     @property
     def db_engine_spec(self) -> builtins.type[db_engine_specs.BaseEngineSpec]:
-        url = make_url_safe(self.sqlalchemy_uri_decrypted)
+        # decrypting and parsing the URI is costly and the property is read many times
+        # per query, so the URL is only parsed again when the URI changes
+        uri, url = _db_engine_spec_urls.get(self, (None, None))
+        if url is None or uri != self.sqlalchemy_uri:
+            url = make_url_safe(self.sqlalchemy_uri_decrypted)
+            _db_engine_spec_urls[self] = (self.sqlalchemy_uri, url)
         return self.get_db_engine_spec(url)
 
     @classmethod
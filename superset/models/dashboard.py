@@ -45,7 +45,11 @@ from sqlalchemy.sql.elements import BinaryExpression
 from superset import db, is_feature_enabled, security_manager
 from superset.connectors.sqla.models import BaseDatasource, SqlaTable
 from superset.daos.datasource import DatasourceDAO
-from superset.models.helpers import AuditMixinNullable, ImportExportMixin
+from superset.models.helpers import (
+    AuditMixinNullable,
+    ImportExportMixin,
+    memoized_json_loads,
+)
 from superset.models.slice import Slice
 from superset.models.user_attributes import UserAttribute
 from superset.tasks.thumbnails import cache_dashboard_thumbnail
@@ -252,7 +256,7 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
     def data(self) -> dict[str, Any]:
         positions = self.position_json
         if positions:
-            positions = json.loads(positions)
+            positions = self.position
         return {
             "id": self.id,
             "metadata": self.params_dict,
@@ -301,19 +305,20 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
     @property
     def position(self) -> dict[str, Any]:
         if self.position_json:
-            return json.loads(self.position_json)
+            return memoized_json_loads(self, "position_json")
         return {}
 
     @property
     def tabs(self) -> dict[str, Any]:
-        if self.position == {}:
+        position = self.position
+        if position == {}:
             return {}
 
         def get_node(node_id: str) -> dict[str, Any]:
             """
             Helper function for getting a node from the position_data
             """
-            return self.position[node_id]
+            return position[node_id]
 
         def build_tab_tree(
             node: dict[str, Any], children: list[dict[str, Any]]
@@ -22,8 +22,10 @@ from __future__ import annotations
 import builtins
 import dataclasses
 import logging
+import pickle
 import re
 import uuid
+import weakref
 from collections.abc import Hashable
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING, Union
@@ -89,6 +91,7 @@ from superset.utils.core import (
     remove_duplicates,
 )
 from superset.utils.dates import datetime_to_epoch
+from superset.utils.decorators import stats_timing
 from superset.utils.rls import apply_rls
 
 if TYPE_CHECKING:
@@ -145,6 +148,41 @@ def json_to_dict(json_str: str) -> dict[Any, Any]:
     return {}
 
 
+# the pickled parsed JSON of the attributes of models, keyed by the model and the name
+# of the attribute, along with the text it was parsed from
+_json_memo: weakref.WeakKeyDictionary[Any, dict[str, tuple[str, bytes]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def memoized_json_loads(
+    obj: Any, attribute: str, loads: Callable[[str], Any] = json.loads
+) -> Any:
+    """
+    Parse the JSON text of an attribute of a model, memoizing the parsed value for the
+    instance for as long as the text stays the same, so setting the attribute
+    invalidates it.
+
+    Models live for the session of a request, during which the same JSON columns
+    are parsed over and over again. The value is memoized pickled, which loads a few
+    times faster than parsing the JSON, so that every call still returns a copy the
+    caller can modify.
+
+    :param obj: the model instance
+    :param attribute: the name of the attribute holding the JSON text
+    :param loads: the function parsing the JSON text
+    :return: a copy of the parsed value
+    """
+    text = getattr(obj, attribute)
+    memo = _json_memo.setdefault(obj, {})
+    if (cached := memo.get(attribute)) is None or cached[0] != text:
+        cached = memo[attribute] = (
+            text,
+            pickle.dumps(loads(text), protocol=pickle.HIGHEST_PROTOCOL),
+        )
+    return pickle.loads(cached[1])  # noqa: S301
+
+
 def convert_uuids(obj: Any) -> Any:
     """
     Convert UUID objects to str so we can use yaml.safe_dump
@@ -457,7 +495,7 @@ class ImportExportMixin(UUIDMixin):
 
     @property
     def params_dict(self) -> dict[Any, Any]:
-        return json_to_dict(self.params)
+        return memoized_json_loads(self, "params", json_to_dict)
 
     @property
     def template_params_dict(self) -> dict[Any, Any]:
@@ -872,13 +910,16 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         query_obj: QueryObjectDict,
         mutate: bool = True,
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
-        sql = self.database.compile_sqla_query(
-            sqlaq.sqla_query,
-            catalog=self.catalog,
-            schema=self.schema,
-            is_virtual=bool(self.sql),
-        )
+        stats_logger = app.config["STATS_LOGGER"]
+        with stats_timing("sqla_query.build", stats_logger):
+            sqlaq = self.get_sqla_query(**query_obj)
+        with stats_timing("sqla_query.compile", stats_logger):
+            sql = self.database.compile_sqla_query(
+                sqlaq.sqla_query,
+                catalog=self.catalog,
+                schema=self.schema,
+                is_virtual=bool(self.sql),
+            )
         sql = self._apply_cte(sql, sqlaq.cte)
 
         if mutate:
@@ -1384,38 +1425,76 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             )
         return and_(*l)
 
-    def values_for_column(  # pylint: disable=too-many-locals
+    def get_values_for_columns_sql(  # pylint: disable=too-many-locals
         self,
-        column_name: str,
+        column_names: list[str],
         limit: int = 10000,
         denormalize_column: bool = False,
-    ) -> list[Any]:
+    ) -> str:
+        """
+        Return the SQL fetching the distinct values of one or more columns.
+
+        A single column is fetched with ``SELECT DISTINCT`` into ``column_values``.
+        Multiple columns are fetched in a single scan with ``GROUPING SETS``: each row
+        then holds the value of the i-th column in ``column_values_<i>`` with
+        ``grouping_<i>`` set to 0, and ``limit`` applies to each column.
+
+        :param column_names: names of the columns to fetch values for
+        :param limit: maximum number of values per column
+        :param denormalize_column: denormalize column names before querying
+        :raises KeyError: if a column does not exist in the datasource
+        """
         # denormalize column name before querying for values
         # unless disabled in the dataset configuration
         db_dialect = self.database.get_dialect()
-        column_name_ = (
-            self.database.db_engine_spec.denormalize_name(db_dialect, column_name)
-            if denormalize_column
-            else column_name
-        )
         cols = {col.column_name: col for col in self.columns}
-        target_col = cols[column_name_]
         tp = self.get_template_processor()
         tbl, cte = self.get_from_clause(tp)
 
-        qry = (
-            sa.select(
-                # The alias (label) here is important because some dialects will
-                # automatically add a random alias to the projection because of the
-                # call to DISTINCT; others will uppercase the column names. This
-                # gives us a deterministic column name in the dataframe.
-                [target_col.get_sqla_col(template_processor=tp).label("column_values")]
+        target_cols = [
+            cols[
+                self.database.db_engine_spec.denormalize_name(db_dialect, column_name)
+                if denormalize_column
+                else column_name
+            ].get_sqla_col(template_processor=tp)
+            for column_name in column_names
+        ]
+
+        if len(target_cols) == 1:
+            qry = (
+                sa.select(
+                    # The alias (label) here is important because some dialects will
+                    # automatically add a random alias to the projection because of
+                    # the call to DISTINCT; others will uppercase the column names.
+                    # This gives us a deterministic column name in the dataframe.
+                    [target_cols[0].label("column_values")]
+                )
+                .select_from(tbl)
+                .distinct()
+            )
+            if limit:
+                qry = qry.limit(limit)
+        else:
+            groupings = [sa.func.grouping(col) for col in target_cols]
+            qry = (
+                sa.select(
+                    [
+                        *(
+                            col.label(f"column_values_{i}")
+                            for i, col in enumerate(target_cols)
+                        ),
+                        *(
+                            grouping.label(f"grouping_{i}")
+                            for i, grouping in enumerate(groupings)
+                        ),
+                        sa.func.row_number()
+                        .over(partition_by=groupings)
+                        .label("row_number"),
+                    ]
+                )
+                .select_from(tbl)
+                .group_by(sa.func.grouping_sets(*target_cols))
             )
-            .select_from(tbl)
-            .distinct()
-        )
-        if limit:
-            qry = qry.limit(limit)
 
         if self.fetch_values_predicate:
             qry = qry.where(self.get_fetch_values_predicate(template_processor=tp))
@@ -1423,6 +1502,14 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         rls_filters = self.get_sqla_row_level_filters(template_processor=tp)
         qry = qry.where(and_(*rls_filters))
 
+        if len(target_cols) > 1:
+            subquery = qry.subquery("column_values")
+            qry = sa.select(
+                [col for col in subquery.c if col.name != "row_number"]
+            ).select_from(subquery)
+            if limit:
+                qry = qry.where(subquery.c.row_number <= limit)
+
         with self.database.get_sqla_engine() as engine:
             sql = str(qry.compile(engine, compile_kwargs={"literal_binds": True}))
             sql = self._apply_cte(sql, cte)
@@ -1432,11 +1519,54 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             if engine.dialect.identifier_preparer._double_percents:
                 sql = sql.replace("%%", "%")
 
+        return sql
+
+    def _fetch_column_values(self, sql: str) -> pd.DataFrame:
+        with self.database.get_sqla_engine() as engine:
             with engine.connect() as con:
                 df = pd.read_sql_query(sql=self.text(sql), con=con)
                 # replace NaN with None to ensure it can be serialized to JSON
-                df = df.replace({np.nan: None})
-                return df["column_values"].to_list()
+                return df.replace({np.nan: None})
+
+    def values_for_column(
+        self,
+        column_name: str,
+        limit: int = 10000,
+        denormalize_column: bool = False,
+    ) -> list[Any]:
+        sql = self.get_values_for_columns_sql([column_name], limit, denormalize_column)
+        return self._fetch_column_values(sql)["column_values"].to_list()
+
+    def values_for_columns(
+        self,
+        column_names: list[str],
+        limit: int = 10000,
+        denormalize_column: bool = False,
+    ) -> dict[str, list[Any]]:
+        """
+        Return the distinct values of multiple columns.
+
+        The values are fetched in a single query when the database supports
+        ``GROUPING SETS``, otherwise with one query per column.
+        """
+        if len(column_names) < 2 or not self.db_engine_spec.supports_grouping_sets:
+            return {
+                column_name: self.values_for_column(
+                    column_name=column_name,
+                    limit=limit,
+                    denormalize_column=denormalize_column,
+                )
+                for column_name in column_names
+            }
+
+        sql = self.get_values_for_columns_sql(column_names, limit, denormalize_column)
+        df = self._fetch_column_values(sql)
+        return {
+            column_name: df.loc[
+                df[f"grouping_{i}"] == 0, f"column_values_{i}"
+            ].to_list()
+            for i, column_name in enumerate(column_names)
+        }
 
     def get_timestamp_expression(
         self,
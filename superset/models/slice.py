@@ -40,7 +40,11 @@ from sqlalchemy.orm.mapper import Mapper
 
 from superset import db, is_feature_enabled, security_manager
 from superset.legacy import update_time_range
-from superset.models.helpers import AuditMixinNullable, ImportExportMixin
+from superset.models.helpers import (
+    AuditMixinNullable,
+    ImportExportMixin,
+    memoized_json_loads,
+)
 from superset.tasks.thumbnails import cache_chart_thumbnail
 from superset.tasks.utils import get_current_user
 from superset.thumbnails.digest import get_chart_digest
@@ -203,7 +207,7 @@ class Slice(  # pylint: disable=too-many-public-methods
 
     @property
     def viz(self) -> BaseViz | None:
-        form_data = json.loads(self.params)
+        form_data = memoized_json_loads(self, "params")
         viz_class = viz_types.get(self.viz_type)
         datasource = self.datasource
         if viz_class and datasource:
@@ -269,7 +273,7 @@ class Slice(  # pylint: disable=too-many-public-methods
     def form_data(self) -> dict[str, Any]:
         form_data: dict[str, Any] = {}
         try:
-            form_data = json.loads(self.params)
+            form_data = memoized_json_loads(self, "params")
         except Exception as ex:  # pylint: disable=broad-except
             logger.error("Malformed json in slice's params", exc_info=True)
             logger.exception(ex)
@@ -290,7 +294,7 @@ class Slice(  # pylint: disable=too-many-public-methods
         if self.query_context:
             try:
                 return self.get_query_context_factory().create(
-                    **json.loads(self.query_context)
+                    **memoized_json_loads(self, "query_context")
                 )
             except json.JSONDecodeError as ex:
                 logger.error("Malformed json in slice's query context", exc_info=True)
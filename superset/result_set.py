@@ -102,18 +102,28 @@ def convert_to_string(value: Any) -> str:
 class SupersetResultSet:
     def __init__(  # pylint: disable=too-many-locals  # noqa: C901
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
         pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
         numpy_dtype: list[tuple[str, ...]] = []
         stringified_arr: NDArray[Any]
 
+        if isinstance(data, pa.Table):
+            # results fetched natively as Arrow, see ``BaseEngineSpec.fetch_arrow``
+            if not cursor_description:
+                cursor_description = [
+                    (name, None, None, None, None, None, None)
+                    for name in data.column_names
+                ]
+            pa_data = self.convert_arrow_columns(data)
+            data = []
+        data = data or []
+
         if cursor_description:
             # get deduped list of column names
             column_names = dedup(
@@ -151,7 +161,7 @@ class SupersetResultSet:
                     stringified_arr = stringify_values(array[column])
                     pa_data.append(pa.array(stringified_arr.tolist()))
 
-        if pa_data:  # pylint: disable=too-many-nested-blocks
+        if array.size > 0:  # pylint: disable=too-many-nested-blocks
             for i, column in enumerate(column_names):
                 if pa.types.is_nested(pa_data[i].type):
                     # TODO: revisit nested column serialization once nested types
@@ -193,6 +203,27 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @staticmethod
+    def convert_arrow_columns(table: pa.Table) -> list[pa.Array]:
+        """
+        Prepare the columns of results fetched as Arrow.
+
+        Dictionary encoded columns are decoded and nested columns are stringified,
+        like the values fetched as tuples.
+        """
+        pa_data: list[pa.Array] = []
+        for column in table.columns:
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            if pa.types.is_nested(column.type):
+                values = column.to_pylist()
+                array = np.empty(len(values), dtype=object)
+                for i, value in enumerate(values):
+                    array[i] = value
+                column = pa.array(stringify_values(array).tolist())
+            pa_data.append(column)
+        return pa_data
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
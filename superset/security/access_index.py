@@ -0,0 +1,204 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+An index of the datasets the roles of users give access to.
+
+Listing dashboards, charts or datasets filters them by the datasets the current user
+can access, which is a function of the permissions of the roles of the user and of
+the permissions of the datasets. Instead of evaluating that permission graph within
+every list query, the ids of the accessible datasets are cached per set of roles,
+until a role, a dataset or a database changes.
+"""
+
+# pylint: disable=import-outside-toplevel
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import sqlalchemy as sqla
+from flask import current_app
+from flask_caching.backends import NullCache, SimpleCache
+from sqlalchemy.engine.base import Connection
+from sqlalchemy.orm import Mapper, Session
+
+from superset.extensions import cache_manager
+from superset.extensions.near_cache import SupersetNearCache
+
+DATASET_ACCESS_INDEX_VERSION_KEY = "dataset_access_index_version"
+
+# cache backends which aren't shared by processes, see `is_cache_shared`
+LOCAL_CACHE_BACKENDS = (NullCache, SimpleCache)
+
+# the columns of datasets their permissions are derived from
+DATASET_PERMISSION_COLUMNS = (
+    "catalog",
+    "catalog_perm",
+    "database_id",
+    "perm",
+    "schema",
+    "schema_perm",
+    "table_name",
+)
+
+
+def _get_version() -> str:
+    if (version := cache_manager.cache.get(DATASET_ACCESS_INDEX_VERSION_KEY)) is None:
+        version = invalidate_dataset_access_index()
+    return version
+
+
+def invalidate_dataset_access_index() -> str:
+    """
+    Invalidate the index for all roles, by moving it to a new version.
+
+    :return: the new version of the index
+    """
+    version = str(uuid.uuid4())
+    cache_manager.cache.set(DATASET_ACCESS_INDEX_VERSION_KEY, version, timeout=0)
+    return version
+
+
+def get_accessible_dataset_ids() -> set[int] | None:
+    """
+    Return the ids of the datasets the roles of the current user give access to,
+    from the index.
+
+    Lists are filtered with an `IN` clause on these ids, so when there are more than
+    `DATASET_ACCESS_INDEX_MAX_IDS` of them the permissions are evaluated instead.
+
+    :return: the ids of the accessible datasets, or `None` if there are too many
+    """
+    from superset import db, security_manager
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+    from superset.utils.cache import generate_cache_key
+    from superset.utils.filters import get_dataset_access_filters
+
+    role_ids = sorted(role.id for role in security_manager.get_user_roles())
+    cache_key = generate_cache_key(
+        {"roles": role_ids, "version": _get_version()},
+        key_prefix="dataset_access_index_",
+    )
+    max_ids = current_app.config["DATASET_ACCESS_INDEX_MAX_IDS"]
+    dataset_ids = cache_manager.cache.get(cache_key)
+    if dataset_ids is None:
+        dataset_ids = {
+            dataset_id
+            for (dataset_id,) in db.session.query(SqlaTable.id)
+            .join(Database, SqlaTable.database_id == Database.id)
+            .filter(get_dataset_access_filters(SqlaTable))
+            .limit(max_ids + 1)
+        }
+        if len(dataset_ids) > max_ids:
+            # too many to be filtered on, which is remembered as `False`
+            dataset_ids = False
+        cache_manager.cache.set(cache_key, dataset_ids)
+    return None if dataset_ids is False else dataset_ids
+
+
+def is_cache_shared() -> bool:
+    """
+    Return whether the cache the index is kept in is shared by all the processes.
+
+    The index is invalidated by changing its version in the cache, so a cache local
+    to each process would keep serving the index from before a change in the other
+    processes until it times out.
+    """
+    backend = cache_manager.cache.cache
+    if isinstance(backend, SupersetNearCache):
+        backend = backend.cache
+    return not isinstance(backend, LOCAL_CACHE_BACKENDS)
+
+
+def can_use_dataset_access_index() -> bool:
+    """
+    Return whether list filters can look up the datasets the current user can access
+    in the index, instead of evaluating the permissions of the user.
+    """
+    from superset import is_feature_enabled, security_manager
+
+    return (
+        is_feature_enabled("DATASET_ACCESS_INDEX")
+        and is_cache_shared()
+        and not security_manager.is_guest_user()
+    )
+
+
+def _mark_stale(session: Session | None) -> None:
+    if session is not None:
+        session.info["dataset_access_index_stale"] = True
+
+
+def _after_dataset_update(
+    _mapper: Mapper, _connection: Connection, target: Any
+) -> None:
+    state = sqla.inspect(target)
+    if any(
+        state.attrs[column].history.has_changes()
+        for column in DATASET_PERMISSION_COLUMNS
+    ):
+        _mark_stale(state.session)
+
+
+def _after_change(_mapper: Mapper, _connection: Connection, target: Any) -> None:
+    _mark_stale(sqla.inspect(target).session)
+
+
+def _after_role_permissions_change(target: Any, *_args: Any) -> None:
+    _mark_stale(sqla.inspect(target).session)
+
+
+def _after_commit(session: Session) -> None:
+    # the index is only invalidated once the changes are visible to other sessions, so
+    # that it doesn't get rebuilt from the state before the changes
+    if session.info.pop("dataset_access_index_stale", False):
+        invalidate_dataset_access_index()
+
+
+def register_sqla_event_listeners() -> None:
+    from superset import security_manager
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+
+    role_model = security_manager.role_model
+
+    sqla.event.listen(SqlaTable, "after_insert", _after_change)
+    sqla.event.listen(SqlaTable, "after_update", _after_dataset_update)
+    sqla.event.listen(SqlaTable, "after_delete", _after_change)
+    sqla.event.listen(Database, "after_update", _after_change)
+    sqla.event.listen(Database, "after_delete", _after_change)
+    sqla.event.listen(role_model.permissions, "append", _after_role_permissions_change)
+    sqla.event.listen(role_model.permissions, "remove", _after_role_permissions_change)
+    sqla.event.listen(Session, "after_commit", _after_commit)
+
+
+def clear_sqla_event_listeners() -> None:
+    from superset import security_manager
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+
+    role_model = security_manager.role_model
+
+    sqla.event.remove(SqlaTable, "after_insert", _after_change)
+    sqla.event.remove(SqlaTable, "after_update", _after_dataset_update)
+    sqla.event.remove(SqlaTable, "after_delete", _after_change)
+    sqla.event.remove(Database, "after_update", _after_change)
+    sqla.event.remove(Database, "after_delete", _after_change)
+    sqla.event.remove(role_model.permissions, "append", _after_role_permissions_change)
+    sqla.event.remove(role_model.permissions, "remove", _after_role_permissions_change)
+    sqla.event.remove(Session, "after_commit", _after_commit)
@@ -0,0 +1,194 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compile SQLAlchemy statements to SQL with the values of their parameters inline.
+
+Charts run the same queries over and over, with different filter values. Statements
+that only differ in the values of their bound parameters share a SQLAlchemy cache
+key, so each of them is compiled once into a template where only the values are left
+to render, and later statements with the same key render their values into it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import BindParameter, ClauseElement
+
+logger = logging.getLogger(__name__)
+
+# delimits the slots where the values of parameters are rendered in a template; it
+# can't be part of the SQL of the statement itself
+SLOT_MARKER = "\x00"
+
+
+@lru_cache(maxsize=None)
+def get_template_compiler(compiler_cls: type[SQLCompiler]) -> type[SQLCompiler]:
+    """
+    Return a compiler for a dialect which, instead of rendering the values of the
+    parameters of a statement, leaves numbered slots to render them later.
+    """
+
+    class TemplateCompiler(compiler_cls):  # type: ignore
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.slots: list[tuple[BindParameter[Any], dict[str, Any]]] = []
+            self.templatable = True
+            super().__init__(*args, **kwargs)
+
+        def render_literal_bindparam(
+            self,
+            bindparam: BindParameter[Any],
+            **kwargs: Any,
+        ) -> str:
+            if "render_literal_value" in kwargs:
+                # the value isn't the one of the parameter
+                self.templatable = False
+                return super().render_literal_bindparam(bindparam, **kwargs)
+
+            self.slots.append((bindparam, kwargs))
+            return f"{SLOT_MARKER}{len(self.slots) - 1}{SLOT_MARKER}"
+
+        def render_slot(self, bindparam: BindParameter[Any], **kwargs: Any) -> str:
+            return super().render_literal_bindparam(bindparam, **kwargs)
+
+    return TemplateCompiler
+
+
+class CompiledQueryTemplate:
+    """
+    The SQL of a statement, with slots to render the values of its parameters.
+    """
+
+    def __init__(self, compiler: Any, bindparams: list[BindParameter[Any]]) -> None:
+        positions = {id(bindparam): i for i, bindparam in enumerate(bindparams)}
+        self.compiler = compiler
+        # the SQL alternates static parts and slots, referencing the parameters of the
+        # cache key by position
+        self.parts: list[str | tuple[int, dict[str, Any]]] = []
+        for i, part in enumerate(compiler.string.split(SLOT_MARKER)):
+            if i % 2 == 0:
+                self.parts.append(part)
+                continue
+            bindparam, kwargs = compiler.slots[int(part)]
+            if (position := positions.get(id(bindparam))) is not None:
+                self.parts.append((position, kwargs))
+            else:
+                # parameters created while compiling, like a default offset, are
+                # part of the structure of the statement
+                self.parts.append(compiler.render_slot(bindparam, **kwargs))
+
+    @classmethod
+    def create(
+        cls,
+        statement: ClauseElement,
+        dialect: Dialect,
+        bindparams: list[BindParameter[Any]],
+    ) -> CompiledQueryTemplate | None:
+        """
+        Compile a statement into a template, if every parameter of its cache key is
+        rendered in a slot.
+        """
+        compiler = get_template_compiler(dialect.statement_compiler)(
+            dialect,
+            statement,
+            compile_kwargs={"literal_binds": True},
+        )
+        rendered = {id(bindparam) for bindparam, _ in compiler.slots}
+        if not compiler.templatable or not rendered >= {id(b) for b in bindparams}:
+            return None
+        return cls(compiler, bindparams)
+
+    def render(self, bindparams: list[BindParameter[Any]]) -> str:
+        """
+        Render the values of the parameters of a statement sharing the cache key of the
+        statement of the template.
+        """
+        return "".join(
+            part
+            if isinstance(part, str)
+            else self.compiler.render_slot(bindparams[part[0]], **part[1])
+            for part in self.parts
+        )
+
+
+class CompiledQueryCache:
+    """
+    A bounded cache of compiled query templates.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._templates: OrderedDict[Hashable, CompiledQueryTemplate | None] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def compile(
+        self,
+        statement: ClauseElement,
+        dialect: Dialect,
+        scope: Hashable,
+    ) -> str:
+        """
+        Compile a statement with the values of its parameters inline.
+
+        :param statement: The statement to compile
+        :param dialect: The dialect to compile the statement for
+        :param scope: What else the compilation depends on, like the database
+        :return: The SQL of the statement
+        """
+        cache_key = statement._generate_cache_key()  # pylint: disable=protected-access
+        if cache_key is None:
+            # some constructs of the statement don't support caching
+            return str(
+                statement.compile(
+                    dialect=dialect, compile_kwargs={"literal_binds": True}
+                )
+            )
+
+        key = (scope, cache_key.key)
+        with self._lock:
+            if key in self._templates:
+                self._templates.move_to_end(key)
+                hit = True
+            else:
+                hit = False
+            template = self._templates.get(key)
+
+        if not hit:
+            template = CompiledQueryTemplate.create(
+                statement, dialect, cache_key.bindparams
+            )
+            with self._lock:
+                self._templates[key] = template
+                while len(self._templates) > self.max_size:
+                    self._templates.popitem(last=False)
+
+        if template is None:
+            return str(
+                statement.compile(
+                    dialect=dialect, compile_kwargs={"literal_binds": True}
+                )
+            )
+        return template.render(cache_key.bindparams)
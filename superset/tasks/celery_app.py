@@ -22,14 +22,15 @@ it needs to call create_app() in order to initialize things properly
 
 from typing import Any
 
-from celery.signals import task_postrun, worker_process_init
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 
 # Superset framework imports
 from superset import create_app
-from superset.extensions import celery_app, db
+from superset.extensions import celery_app, db, event_logger
+from superset.utils.log import BufferedDBEventLogger
 
 # Init the Flask app / configure everything
-flask_app = create_app()
+flask_app = create_app(worker=True)
 
 # Need to import late, as the celery_app will have been setup by "create_app()"
 # ruff: noqa: E402, F401
@@ -47,6 +48,15 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
         db.engine.dispose()
 
 
+@worker_process_shutdown.connect
+def flush_event_logger(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    """
+    Flush the buffered event logs, as pool processes exit without running `atexit`.
+    """
+    if isinstance(event_logger, BufferedDBEventLogger):
+        event_logger.shutdown()
+
+
 @task_postrun.connect
 def teardown(  # pylint: disable=unused-argument
     retval: Any,
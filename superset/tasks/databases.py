@@ -0,0 +1,58 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from datetime import timedelta
+from typing import Optional
+
+from superset import db
+from superset.extensions import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="databases.refresh_catalog_index")
+def refresh_catalog_index(
+    database_ids: Optional[list[int]] = None,
+    max_age_seconds: Optional[int] = None,
+) -> None:
+    """
+    Refresh the catalog index used to search tables across schemas.
+
+    :param database_ids: The databases to index, by default all the databases
+        exposed in SQL Lab
+    :param max_age_seconds: Only re-inspect schemas indexed longer ago than this
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.databases.catalog_index import refresh_catalog_index as refresh
+    from superset.models.core import Database
+
+    query = db.session.query(Database)
+    if database_ids is None:
+        query = query.filter(Database.expose_in_sqllab.is_(True))
+    else:
+        query = query.filter(Database.id.in_(database_ids))
+
+    max_age = timedelta(seconds=max_age_seconds) if max_age_seconds else None
+    for database in query.all():
+        try:
+            refresh(database, max_age=max_age)
+            db.session.commit()  # pylint: disable=consider-using-transaction
+        except Exception:  # pylint: disable=broad-except
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+            logger.exception(
+                "Failed to refresh the catalog index of database %s", database.id
+            )
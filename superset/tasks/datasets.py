@@ -0,0 +1,57 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+
+from celery import Task
+
+from superset import db
+from superset.extensions import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="datasets.sync_metadata", bind=True)
+def sync_metadata(self: Task, dataset_ids: list[int]) -> dict[str, list[int]]:
+    """
+    Sync the columns of several datasets from their source, reporting progress
+    through the task state. Each dataset is committed on its own, so a failure only
+    affects the dataset being synced.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import SqlaTable
+
+    result: dict[str, list[int]] = {"synced": [], "failed": []}
+    for index, dataset_id in enumerate(dataset_ids):
+        self.update_state(
+            state="PROGRESS",
+            meta={"current": index, "total": len(dataset_ids)},
+        )
+        dataset = db.session.query(SqlaTable).filter_by(id=dataset_id).one_or_none()
+        if not dataset:
+            logger.warning("Dataset %s not found, skipping metadata sync", dataset_id)
+            result["failed"].append(dataset_id)
+            continue
+        try:
+            dataset.fetch_metadata()
+            db.session.commit()  # pylint: disable=consider-using-transaction
+            result["synced"].append(dataset_id)
+        except Exception:  # pylint: disable=broad-except
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+            logger.exception("Failed to sync metadata of dataset %s", dataset_id)
+            result["failed"].append(dataset_id)
+
+    return result
@@ -26,6 +26,7 @@ from flask import current_app
 
 from superset import is_feature_enabled
 from superset.commands.exceptions import CommandException
+from superset.commands.key_value.prune import KeyValuePruneCommand
 from superset.commands.logs.prune import LogPruneCommand
 from superset.commands.report.exceptions import ReportScheduleUnexpectedError
 from superset.commands.report.execute import AsyncExecuteReportScheduleCommand
@@ -171,3 +172,14 @@ def prune_logs(
         LogPruneCommand(retention_period_days).run()
     except CommandException as ex:
         logger.exception("An error occurred while pruning logs: %s", ex)
+
+
+@celery_app.task(name="prune_key_value")
+def prune_key_value() -> None:
+    stats_logger: BaseStatsLogger = current_app.config["STATS_LOGGER"]
+    stats_logger.incr("prune_key_value")
+
+    try:
+        KeyValuePruneCommand().run()
+    except CommandException as ex:
+        logger.exception("An error occurred while pruning key-value entries: %s", ex)
@@ -26,6 +26,10 @@ from superset import security_manager, thumbnail_cache
 from superset.extensions import celery_app
 from superset.security.guest_token import GuestToken
 from superset.tasks.utils import get_executor
+from superset.thumbnails.digest import (
+    get_chart_data_digest,
+    get_dashboard_data_digest,
+)
 from superset.utils.core import override_user
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
 from superset.utils.urls import get_url_path
@@ -41,6 +45,7 @@ def cache_chart_thumbnail(
     force: bool,
     window_size: Optional[WindowSize] = None,
     thumb_size: Optional[WindowSize] = None,
+    if_data_changed: bool = False,
 ) -> None:
     # pylint: disable=import-outside-toplevel
     from superset.models.slice import Slice
@@ -67,6 +72,7 @@ def cache_chart_thumbnail(
             window_size=window_size,
             thumb_size=thumb_size,
             force=force,
+            data_digest=get_chart_data_digest(chart) if if_data_changed else None,
         )
     return None
 
@@ -79,6 +85,7 @@ def cache_dashboard_thumbnail(
     thumb_size: Optional[WindowSize] = None,
     window_size: Optional[WindowSize] = None,
     cache_key: str | None = None,
+    if_data_changed: bool = False,
 ) -> None:
     # pylint: disable=import-outside-toplevel
     from superset.models.dashboard import Dashboard
@@ -105,6 +112,9 @@ def cache_dashboard_thumbnail(
             thumb_size=thumb_size,
             force=force,
             cache_key=cache_key,
+            data_digest=(
+                get_dashboard_data_digest(dashboard) if if_data_changed else None
+            ),
         )
 
 
@@ -17,22 +17,27 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
-from flask import current_app as app
+import pandas as pd
+from flask import current_app as app, g, has_app_context
+from flask_appbuilder.security.sqla.models import User
 
 from superset import security_manager
 from superset.tasks.exceptions import ExecutorNotFoundError
 from superset.tasks.types import ExecutorType
 from superset.tasks.utils import get_current_user, get_executor
-from superset.utils.core import override_user
+from superset.utils.core import override_user, QueryStatus
+from superset.utils.decorators import stats_timing
 from superset.utils.hashing import md5_sha_from_str
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource, SqlaTable
     from superset.models.dashboard import Dashboard
     from superset.models.slice import Slice
+    from superset.security.guest_token import GuestUser
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +58,54 @@ def _adjust_string_for_executor(
     return unique_string
 
 
+def _get_memo(name: str) -> dict[Any, Any]:
+    """
+    Get a memo shared by the digests computed in the same app context, so that listing
+    charts or dashboards, which computes the digest of every row, looks up each
+    executor, datasource and set of RLS filters only once for the whole page.
+    """
+    if not has_app_context():
+        return {}
+    memos = g.setdefault("thumbnail_digest_memos", {})
+    return memos.setdefault(name, {})
+
+
+def _get_executor_user(executor: str) -> User | GuestUser | None:
+    users = _get_memo("users")
+    if executor not in users:
+        users[executor] = (
+            security_manager.find_user(executor)
+            or security_manager.get_current_guest_user_if_guest()
+        )
+    return users[executor]
+
+
+def _get_chart_datasource(chart: Slice) -> SqlaTable | None:
+    datasources = _get_memo("datasources")
+    key = (chart.datasource_type, chart.datasource_id)
+    if key not in datasources:
+        datasources[key] = chart.datasource
+    return datasources[key]
+
+
+def _get_stringified_rls(
+    datasource: BaseDatasource,
+    executor: str,
+    user: User | GuestUser,
+) -> str:
+    rls = _get_memo("rls")
+    key = (executor, datasource.uid)
+    if key not in rls:
+        with override_user(user):
+            rls_filters = datasource.get_sqla_row_level_filters()
+        rls[key] = (
+            f"{str(datasource.id)}\t" + "\t".join([str(f) for f in rls_filters]) + "\n"
+            if len(rls_filters) > 0
+            else ""
+        )
+    return rls[key]
+
+
 def _adjust_string_with_rls(
     unique_string: str,
     datasources: list[SqlaTable | None] | set[BaseDatasource],
@@ -61,28 +114,16 @@ def _adjust_string_with_rls(
     """
     Add the RLS filters to the unique string based on current executor.
     """
-    user = (
-        security_manager.find_user(executor)
-        or security_manager.get_current_guest_user_if_guest()
-    )
-
-    if user:
-        stringified_rls = ""
-        with override_user(user):
-            for datasource in datasources:
-                if (
-                    datasource
-                    and hasattr(datasource, "is_rls_supported")
-                    and datasource.is_rls_supported
-                ):
-                    rls_filters = datasource.get_sqla_row_level_filters()
-
-                    if len(rls_filters) > 0:
-                        stringified_rls += (
-                            f"{str(datasource.id)}\t"
-                            + "\t".join([str(f) for f in rls_filters])
-                            + "\n"
-                        )
+    if user := _get_executor_user(executor):
+        stringified_rls = "".join(
+            _get_stringified_rls(datasource, executor, user)
+            for datasource in datasources
+            if (
+                datasource
+                and hasattr(datasource, "is_rls_supported")
+                and datasource.is_rls_supported
+            )
+        )
 
         if stringified_rls:
             unique_string = f"{unique_string}\n{stringified_rls}"
@@ -91,6 +132,11 @@ def _adjust_string_with_rls(
 
 
 def get_dashboard_digest(dashboard: Dashboard) -> str | None:
+    with stats_timing("thumbnail.digest.dashboard", app.config["STATS_LOGGER"]):
+        return _get_dashboard_digest(dashboard)
+
+
+def _get_dashboard_digest(dashboard: Dashboard) -> str | None:
     try:
         executor_type, executor = get_executor(
             executors=app.config["THUMBNAIL_EXECUTORS"],
@@ -117,6 +163,11 @@ def get_dashboard_digest(dashboard: Dashboard) -> str | None:
 
 
 def get_chart_digest(chart: Slice) -> str | None:
+    with stats_timing("thumbnail.digest.chart", app.config["STATS_LOGGER"]):
+        return _get_chart_digest(chart)
+
+
+def _get_chart_digest(chart: Slice) -> str | None:
     try:
         executor_type, executor = get_executor(
             executors=app.config["THUMBNAIL_EXECUTORS"],
@@ -131,6 +182,60 @@ def get_chart_digest(chart: Slice) -> str | None:
 
     unique_string = f"{chart.params or ''}.{executor}"
     unique_string = _adjust_string_for_executor(unique_string, executor_type, executor)
-    unique_string = _adjust_string_with_rls(unique_string, [chart.datasource], executor)
+    unique_string = _adjust_string_with_rls(
+        unique_string, [_get_chart_datasource(chart)], executor
+    )
 
     return md5_sha_from_str(unique_string)
+
+
+def _get_df_digest(df: pd.DataFrame) -> str:
+    digest = hashlib.md5(  # noqa: S324
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    )
+    digest.update("\t".join(map(str, df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_chart_data_digest(chart: Slice) -> str | None:
+    """
+    Return a digest of the results of the queries of a chart, as served from the data
+    cache to the chart when it's rendered. Its thumbnail only needs to be computed
+    again when they change.
+
+    :param chart: The chart
+    :return: The digest, or None if the results can't be fetched or hashed
+    """
+    if not (query_context := chart.get_query_context()):
+        return None
+
+    digests = []
+    try:
+        for query_object in query_context.queries:
+            payload = query_context.get_df_payload(query_object)
+            if payload["status"] != QueryStatus.SUCCESS:
+                return None
+            digests.append(_get_df_digest(payload["df"]))
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Unable to compute the data digest of chart %s", chart.id, exc_info=True
+        )
+        return None
+
+    return md5_sha_from_str("\n".join(digests))
+
+
+def get_dashboard_data_digest(dashboard: Dashboard) -> str | None:
+    """
+    Return a digest of the results of the queries of the charts of a dashboard.
+
+    :param dashboard: The dashboard
+    :return: The digest, or None if the results of any chart can't be fetched
+    """
+    digests = []
+    for chart in sorted(dashboard.slices, key=lambda chart: chart.id):
+        if (digest := get_chart_data_digest(chart)) is None:
+            return None
+        digests.append(f"{chart.id}:{digest}")
+
+    return md5_sha_from_str("\n".join(digests))
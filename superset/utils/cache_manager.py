@@ -86,6 +86,16 @@ class CacheManager:
 
         cache.init_app(app, cache_config)
 
+        if near_cache_config := cache_config.get("NEAR_CACHE_CONFIG"):
+            # pylint: disable=import-outside-toplevel
+            from superset.extensions.near_cache import SupersetNearCache
+
+            app.extensions["cache"][cache] = SupersetNearCache.from_config(
+                app.extensions["cache"][cache],
+                cache_config_key.lower(),
+                near_cache_config,
+            )
+
     def init_app(self, app: Flask) -> None:
         self._init_cache(app, self._cache, "CACHE_CONFIG")
         self._init_cache(app, self._data_cache, "DATA_CACHE_CONFIG")
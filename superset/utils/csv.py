@@ -22,6 +22,8 @@ from urllib.error import URLError
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from superset.utils import json
 from superset.utils.core import GenericDataType
@@ -38,6 +40,9 @@ negative_number_re = re.compile(r"^-[0-9.]+$")
 #
 problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
 
+# types inferred by pandas for object columns which may hold strings
+STRING_INFERRED_TYPES = {"string", "mixed", "mixed-integer"}
+
 
 def escape_value(value: str) -> str:
     """
@@ -64,6 +69,54 @@ def escape_value(value: str) -> str:
     return value
 
 
+def is_string_column(column: pd.Series) -> bool:
+    """
+    Whether a column may hold strings, without looking at each value in Python.
+    """
+    if isinstance(column.dtype, pd.StringDtype):
+        return True
+    return (
+        column.dtype == np.dtype(object)
+        and pd.api.types.infer_dtype(column, skipna=True) in STRING_INFERRED_TYPES
+    )
+
+
+def find_strings(column: pd.Series, pattern: str) -> np.ndarray:
+    """
+    Return the positions of the strings of a column which may match a pattern.
+
+    When the column only holds strings the pattern, in RE2 syntax, is matched in
+    Arrow without calling Python for each value; otherwise the positions of all the
+    strings are returned. Callers still need to check the values at these positions.
+    """
+    try:
+        strings = pa.array(column, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return np.flatnonzero([isinstance(value, str) for value in column])
+
+    matches = pc.fill_null(pc.match_substring_regex(strings, pattern), False)
+    return np.flatnonzero(matches.to_numpy(zero_copy_only=False))
+
+
+def escape_column(column: pd.Series) -> pd.Series:
+    """
+    Escapes the strings of a column, like ``escape_value`` does for a single value.
+
+    Only the strings starting with a character other than a letter or a digit can
+    need escaping, so the others are skipped without calling ``escape_value``.
+    """
+    positions = find_strings(column, r"^[^\p{L}\p{N}]")
+    candidates = column.iloc[positions]
+    escaped = candidates.map(lambda v: escape_value(v) if isinstance(v, str) else v)
+    changed = (escaped != candidates).to_numpy(dtype=bool)
+    if not changed.any():
+        return column
+
+    column = column.copy()
+    column.iloc[positions[changed]] = escaped[changed].to_numpy()
+    return column
+
+
 def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
@@ -71,12 +124,10 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     # Escape csv headers
     df = df.rename(columns=escape_values)
 
-    # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+    # Escape csv values, numeric and temporal columns can't hold strings
+    for i, (_, column) in enumerate(df.items()):
+        if is_string_column(column):
+            df.isetitem(i, escape_column(column))
 
     return df.to_csv(escapechar="\\", **kwargs)
 
@@ -20,22 +20,30 @@ from typing import Any
 import pandas as pd
 
 from superset.utils.core import GenericDataType
+from superset.utils.csv import find_strings, is_string_column
 
 
 def quote_formulas(df: pd.DataFrame) -> pd.DataFrame:
     """
     Make sure to quote any formulas for security reasons.
     """
-    formula_prefixes = {"=", "+", "-", "@"}
+    formula_prefixes = ("=", "+", "-", "@")
 
-    for col in df.select_dtypes(include="object").columns:
-        df[col] = df[col].apply(
-            lambda x: (
-                f"'{x}"
-                if isinstance(x, str) and len(x) and x[0] in formula_prefixes
-                else x
-            )
-        )
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        if not is_string_column(df[col]):
+            continue
+
+        positions = find_strings(df[col], r"^[=+\-@]")
+        candidates = df[col].iloc[positions]
+        is_formula = candidates.map(
+            lambda x: isinstance(x, str) and x.startswith(formula_prefixes)
+        ).to_numpy(dtype=bool)
+        if is_formula.any():
+            column = df[col].copy()
+            column.iloc[positions[is_formula]] = (
+                "'" + candidates[is_formula]
+            ).to_numpy()
+            df[col] = column
 
     return df
 
@@ -69,11 +77,11 @@ def apply_column_types(
                 df[column] = pd.to_numeric(df[column])
                 # if the number is too large, convert it to a string
                 # Excel does not support numbers larger than 10^15
-                df[column] = df[column].apply(
-                    lambda x: str(x)
-                    if isinstance(x, (int, float)) and abs(x) > 10**15
-                    else x
-                )
+                too_large = (df[column].abs() > 10**15).fillna(False)
+                if too_large.any():
+                    values = df[column].astype(object)
+                    values[too_large] = values[too_large].map(str)
+                    df[column] = values
             except ValueError:
                 df[column] = df[column].astype(str)
         elif pd.api.types.is_datetime64tz_dtype(df[column]):
@@ -16,17 +16,22 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
 import textwrap
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Callable, cast, Literal, TYPE_CHECKING
+from typing import Any, Callable, cast, ClassVar, Literal, TYPE_CHECKING
 
-from flask import g, has_request_context, request
+from flask import current_app, Flask, g, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -369,7 +374,7 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
-    def log(  # pylint: disable=too-many-arguments,too-many-locals
+    def log(  # pylint: disable=too-many-arguments
         self,
         user_id: int | None,
         action: str,
@@ -380,34 +385,221 @@ class DBEventLogger(AbstractEventLogger):
         *args: Any,
         **kwargs: Any,
     ) -> None:
-        # pylint: disable=import-outside-toplevel
-        from superset import db
-        from superset.models.core import Log
+        self.save_logs(
+            self.get_log_rows(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
+            )
+        )
 
-        records = kwargs.get("records", [])
-        logs = []
+    @staticmethod
+    def get_log_rows(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Build the column values of the `Log` rows for each record"""
+        rows = []
         for record in records:
             json_string: str | None
             try:
                 json_string = json.dumps(record)
             except Exception:  # pylint: disable=broad-except
                 json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id or record.get("dashboard_id"),
-                slice_id=slice_id or record.get("slice_id"),
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+            rows.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id or record.get("dashboard_id"),
+                    "slice_id": slice_id or record.get("slice_id"),
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                    # set when the event happens rather than when the row is saved,
+                    # which may be later with `BufferedDBEventLogger`
+                    "dttm": datetime.utcnow(),
+                }
             )
-            logs.append(log)
+        return rows
+
+    @staticmethod
+    def save_logs(rows: list[dict[str, Any]]) -> bool:
+        """Insert `Log` rows in the Superset DB, returning whether it succeeded"""
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
         try:
-            db.session.bulk_save_objects(logs)
+            db.session.bulk_save_objects([Log(**row) for row in rows])
             db.session.commit()  # pylint: disable=consider-using-transaction
         except SQLAlchemyError as ex:
             logging.error("DBEventLogger failed to log event(s)")
             logging.exception(ex)
+            return False
+        return True
+
+
+class BufferedDBEventLogger(DBEventLogger):
+    """
+    Event logger that buffers logs in memory and commits them to Superset DB in
+    batches from a background thread, keeping the write out of the request.
+
+    The buffer is flushed when it holds ``batch_size`` logs or every
+    ``flush_interval`` seconds. Once it holds ``max_buffer_size`` logs new ones are
+    dropped and counted in ``dropped``. The remaining logs are flushed when the
+    process exits, see ``shutdown``.
+    """
+
+    # the fork and exit hooks are registered once per process for all instances
+    _instances: ClassVar[weakref.WeakSet[BufferedDBEventLogger]] = weakref.WeakSet()
+    _hooks_registered: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        max_buffer_size: int = 10_000,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self.dropped = 0
+        self.failed = 0
+        self._app: Flask | None = None
+        self._reset()
+        self._register(self)
+
+    @staticmethod
+    def _register(event_logger: BufferedDBEventLogger) -> None:
+        cls = BufferedDBEventLogger
+        cls._instances.add(event_logger)
+        if not cls._hooks_registered:
+            # logs buffered before a fork belong to the parent process
+            os.register_at_fork(after_in_child=cls._reset_all)
+            atexit.register(cls._shutdown_all)
+            cls._hooks_registered = True
+
+    @classmethod
+    def _reset_all(cls) -> None:
+        for event_logger in list(cls._instances):
+            event_logger._reset()  # pylint: disable=protected-access
+
+    @classmethod
+    def _shutdown_all(cls) -> None:
+        for event_logger in list(cls._instances):
+            event_logger.shutdown()
+
+    def _reset(self) -> None:
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        rows = self.get_log_rows(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        if not rows:
+            return
+
+        with self._lock:
+            self._start()
+            available = max(self.max_buffer_size - len(self._buffer), 0)
+            dropped = len(rows) - available
+            if dropped > 0:
+                self.dropped += dropped
+                rows = rows[:available]
+            self._buffer.extend(rows)
+            full = len(self._buffer) >= self.batch_size
+
+        if dropped > 0:
+            stats_logger_manager.instance.incr("event_logger.dropped")
+        if full:
+            self._wakeup.set()
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._app = current_app._get_current_object()  # pylint: disable=protected-access
+        self._thread = threading.Thread(
+            target=self._run,
+            name="BufferedDBEventLogger",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit the buffered logs to Superset DB in batches"""
+        if self._app is None:
+            return
+
+        while True:
+            with self._lock:
+                size = min(self.batch_size, len(self._buffer))
+                batch = [self._buffer.popleft() for _ in range(size)]
+            if not batch:
+                return
+            with self._app.app_context():
+                try:
+                    saved = self.save_logs(batch)
+                except Exception:  # pylint: disable=broad-except
+                    # the background thread must keep flushing the following batches
+                    logger.exception("BufferedDBEventLogger failed to save logs")
+                    self._rollback()
+                    saved = False
+            if not saved:
+                self.failed += len(batch)
+
+    @staticmethod
+    def _rollback() -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
+        try:
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("BufferedDBEventLogger failed to roll back")
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Stop the background thread and flush the remaining logs"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self.flush()
 
 
 class StdOutEventLogger(AbstractEventLogger):
@@ -17,13 +17,180 @@
 from typing import Optional
 
 import geohash as geohash_lib
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from flask_babel import gettext as _
+from geopy import units
 from geopy.point import Point
 from pandas import DataFrame
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing.utils import _append_columns
 
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# number of characters produced by `geohash.encode` by default
+GEOHASH_PRECISION = 12
+# longest geohash that can be decoded using 64-bit integers (30 bits per axis)
+GEOHASH_MAX_VECTORIZED_LENGTH = 12
+
+_GEOHASH_ALPHABET = np.frombuffer(GEOHASH_BASE32.encode(), dtype=np.uint8)
+_GEOHASH_LOOKUP = np.full(128, -1, dtype=np.int64)
+for _index, _char in enumerate(GEOHASH_BASE32):
+    _GEOHASH_LOOKUP[ord(_char)] = _index
+    _GEOHASH_LOOKUP[ord(_char.upper())] = _index
+
+# Plain decimal geodetic points, e.g. `40.7, -74.0` or `40.7 -74.0, 5.5km`. Anything
+# else (directions, arcminutes, etc.) is handed over to geopy. The altitude needs an
+# explicit separator as geopy reads `40.7 -74.0 5m` as 5 arcminutes of longitude.
+GEODETIC_DECIMAL_PATTERN = (
+    r"^[^\S\n]*(?P<latitude>[+-]?\d+(?:\.\d+)?)\s*[,;/\s]\s*"
+    r"(?P<longitude>[+-]?\d+(?:\.\d+)?)"
+    r"(?:\s*[,;/]\s*(?P<altitude>[+-]?\d+(?:\.\d+)?)[ ]*"
+    r"(?P<altitude_units>km|m|mi|ft|nm|nmi))?\s*$"
+)
+# mirrors the unit conversions done by `geopy.point.Point.parse_altitude`
+_ALTITUDE_CONVERTERS = {
+    "km": lambda distance: distance,
+    "m": lambda distance: distance / 1000.0,
+    "mi": lambda distance: distance * 1.609344,
+    "ft": lambda distance: distance / units.ft(1.0),
+    "nm": lambda distance: distance / units.nm(1.0),
+    "nmi": lambda distance: distance / units.nm(1.0),
+}
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """
+    Insert a zero bit in front of each of the lower 32 bits of every value, i.e.
+    the first half of a Morton (Z-order) interleave.
+    """
+    values = values.astype(np.uint64) & np.uint64(0xFFFFFFFF)
+    for shift, mask in (
+        (16, 0x0000FFFF0000FFFF),
+        (8, 0x00FF00FF00FF00FF),
+        (4, 0x0F0F0F0F0F0F0F0F),
+        (2, 0x3333333333333333),
+        (1, 0x5555555555555555),
+    ):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _compact_bits(values: np.ndarray) -> np.ndarray:
+    """
+    Inverse of `_spread_bits`: collect every even bit of each value.
+    """
+    values = values & np.uint64(0x5555555555555555)
+    for shift, mask in (
+        (1, 0x3333333333333333),
+        (2, 0x0F0F0F0F0F0F0F0F),
+        (4, 0x00FF00FF00FF00FF),
+        (8, 0x0000FFFF0000FFFF),
+        (16, 0xFFFFFFFF),
+    ):
+        values = (values | (values >> np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _encode_geohashes(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of `geohash.encode` with the default precision.
+
+    :raises ValueError: if a coordinate is not finite or a latitude is outside
+           the [-90, 90) range
+    """
+    if not (np.isfinite(latitudes).all() and np.isfinite(longitudes).all()):
+        raise ValueError("Coordinates must be finite")
+    if ((latitudes < -90) | (latitudes >= 90)).any():
+        raise ValueError("Invalid latitude")
+
+    # wrap longitudes the same way `geohash.encode` does to get identical results
+    longitudes = longitudes.copy()
+    while (mask := longitudes < -180).any():
+        longitudes[mask] += 360
+    while (mask := longitudes >= 180).any():
+        longitudes[mask] -= 360
+
+    # 30 bits per axis is enough for 12 characters (60 bits)
+    lat_bits = (np.floor(latitudes / 90 * 2.0**29) + 2**29).astype(np.uint64)
+    lon_bits = (np.floor(longitudes / 180 * 2.0**29) + 2**29).astype(np.uint64)
+    codes = (_spread_bits(lon_bits) << np.uint64(1)) | _spread_bits(lat_bits)
+    shifts = np.arange(5 * (GEOHASH_PRECISION - 1), -1, -5, dtype=np.uint64)
+    chars = _GEOHASH_ALPHABET[(codes[:, None] >> shifts) & np.uint64(31)]
+    return chars.view(f"S{GEOHASH_PRECISION}").ravel().astype(str).astype(object)
+
+
+def _decode_geohashes(geohashes: np.ndarray, length: int) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized equivalent of `geohash.decode` for geohashes of the same length.
+
+    :raises ValueError: if a geohash contains characters outside of the alphabet
+    """
+    codepoints = geohashes.astype(f"U{length}").view(np.uint32).reshape(-1, length)
+    indexes = _GEOHASH_LOOKUP[np.minimum(codepoints, 127)]
+    if (codepoints > 127).any() or (indexes < 0).any():
+        raise ValueError("Invalid geohash string")
+
+    codes = np.zeros(len(codepoints), dtype=np.uint64)
+    for position in range(length):
+        codes = (codes << np.uint64(5)) | indexes[:, position].astype(np.uint64)
+    # left-align the code so that the longitude bits are always the odd ones
+    codes <<= np.uint64(5 * (GEOHASH_MAX_VECTORIZED_LENGTH - length))
+
+    lon_length = (5 * length + 1) // 2
+    lat_length = 5 * length // 2
+    max_length = 5 * GEOHASH_MAX_VECTORIZED_LENGTH // 2
+    coordinates = []
+    for bits, axis_length, scale in (
+        (_compact_bits(codes), lat_length, 90.0),
+        (_compact_bits(codes >> np.uint64(1)), lon_length, 180.0),
+    ):
+        half = float(1 << (axis_length - 1))
+        values = (bits >> np.uint64(max_length - axis_length)).astype(np.float64)
+        coordinates.append(
+            ((values - half) / half) * scale + scale / (1 << axis_length)
+        )
+    return tuple(coordinates)
+
+
+def _to_float(values: pa.Array) -> np.ndarray:
+    return values.cast(pa.float64()).to_numpy(zero_copy_only=False)
+
+
+def _parse_decimal_geodetics(parsed: pa.StructArray) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized equivalent of `geopy.point.Point` for locations that were matched by
+    `GEODETIC_DECIMAL_PATTERN`, including its validation and normalization rules.
+
+    :raises ValueError: if a coordinate is not finite or a latitude is outside
+           the [-90, 90] range
+    """
+    # adding zero turns -0.0 into 0.0 like geopy does
+    latitudes = _to_float(parsed.field("latitude")) + 0.0
+    longitudes = _to_float(parsed.field("longitude")) + 0.0
+    altitudes = np.zeros(len(parsed), dtype=np.float64)
+    distances = parsed.field("altitude")
+    altitude_units = parsed.field("altitude_units").to_numpy(zero_copy_only=False)
+    for unit, converter in _ALTITUDE_CONVERTERS.items():
+        if (mask := altitude_units == unit).any():
+            altitudes[mask] = converter(_to_float(distances.filter(mask))) + 0.0
+
+    if not (
+        np.isfinite(latitudes).all()
+        and np.isfinite(longitudes).all()
+        and np.isfinite(altitudes).all()
+    ):
+        raise ValueError("Point coordinates must be finite")
+    if (np.abs(latitudes) > 90).any():
+        raise ValueError("Latitude must be in the [-90; 90] range")
+
+    mask = np.abs(longitudes) > 180
+    longitudes[mask] = np.fmod(longitudes[mask], 360.0) + 0.0
+    longitudes[mask & (longitudes < -180)] += 360.0
+    longitudes[mask & (longitudes >= 180)] -= 360.0
+    return latitudes, longitudes, altitudes
+
 
 def geohash_decode(
     df: DataFrame, geohash: str, longitude: str, latitude: str
@@ -38,9 +205,27 @@ def geohash_decode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        lonlat_df = DataFrame()
-        lonlat_df["latitude"], lonlat_df["longitude"] = zip(
-            *df[geohash].apply(geohash_lib.decode), strict=False
+        geohashes = df[geohash].to_numpy(dtype=object)
+        lengths = np.fromiter(
+            (len(value) if isinstance(value, str) else 0 for value in geohashes),
+            dtype=np.int64,
+            count=len(geohashes),
+        )
+        latitudes = np.empty(len(geohashes), dtype=np.float64)
+        longitudes = np.empty(len(geohashes), dtype=np.float64)
+        for length in np.unique(lengths):
+            mask = lengths == length
+            if 0 < length <= GEOHASH_MAX_VECTORIZED_LENGTH:
+                latitudes[mask], longitudes[mask] = _decode_geohashes(
+                    geohashes[mask], int(length)
+                )
+            else:
+                decoded = [geohash_lib.decode(value) for value in geohashes[mask]]
+                latitudes[mask] = [point[0] for point in decoded]
+                longitudes[mask] = [point[1] for point in decoded]
+
+        lonlat_df = DataFrame(
+            {"latitude": latitudes, "longitude": longitudes}, index=df.index
         )
         return _append_columns(
             df, lonlat_df, {"latitude": latitude, "longitude": longitude}
@@ -65,11 +250,14 @@ def geohash_encode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        encode_df = df[[latitude, longitude]]
-        encode_df.columns = ["latitude", "longitude"]
-        encode_df["geohash"] = encode_df.apply(
-            lambda row: geohash_lib.encode(row["latitude"], row["longitude"]),
-            axis=1,
+        encode_df = DataFrame(
+            {
+                "geohash": _encode_geohashes(
+                    df[latitude].to_numpy(dtype=np.float64),
+                    df[longitude].to_numpy(dtype=np.float64),
+                )
+            },
+            index=df.index,
         )
         return _append_columns(df, encode_df, {"geohash": geohash})
     except ValueError as ex:
@@ -104,12 +292,31 @@ def geodetic_parse(
         return point[0], point[1], point[2]
 
     try:
-        geodetic_df = DataFrame()
-        (
-            geodetic_df["latitude"],
-            geodetic_df["longitude"],
-            geodetic_df["altitude"],
-        ) = zip(*df[geodetic].apply(_parse_location), strict=False)
+        locations = df[geodetic].to_numpy(dtype=object)
+        is_string = np.fromiter(
+            (isinstance(location, str) for location in locations),
+            dtype=bool,
+            count=len(locations),
+        )
+        parsed = pc.extract_regex(
+            pa.array(locations[is_string], type=pa.string()),
+            GEODETIC_DECIMAL_PATTERN,
+        )
+        is_match = parsed.is_valid().to_numpy(zero_copy_only=False)
+        is_decimal = np.zeros(len(locations), dtype=bool)
+        is_decimal[np.flatnonzero(is_string)[is_match]] = True
+
+        points = np.empty((len(locations), 3), dtype=np.float64)
+        points[is_decimal] = np.column_stack(
+            _parse_decimal_geodetics(parsed.filter(is_match))
+        )
+        # less common formats (cardinal directions, arcminutes, ...) go to geopy
+        for position in np.flatnonzero(~is_decimal):
+            points[position] = _parse_location(locations[position])
+
+        geodetic_df = DataFrame(
+            points, columns=["latitude", "longitude", "altitude"], index=df.index
+        )
         columns = {"latitude": latitude, "longitude": longitude}
         if altitude:
             columns["altitude"] = altitude
@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Planning and execution of chains of post processing operations.
+
+A chain is validated as a whole before any operation runs, so that an invalid last
+step doesn't waste the work done by the first ones, and operations that can safely
+work on the DataFrame produced by the previous step do so instead of copying it.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable
+
+from flask_babel import gettext as _
+from pandas import DataFrame
+
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import pandas_postprocessing
+
+logger = logging.getLogger(__name__)
+
+POST_PROCESSING_OPERATIONS: dict[str, Callable[..., DataFrame]] = {
+    operation: getattr(pandas_postprocessing, operation)
+    for operation in pandas_postprocessing.__all__
+    if operation not in {"escape_separator", "unescape_separator"}
+}
+
+# operations that only relabel the DataFrame they are given, and can thus do so in
+# place when that DataFrame was created by a previous step of the chain
+INPLACE_OPERATIONS = {"rename"}
+
+
+@dataclass
+class PostProcessingStep:
+    operation: str
+    function: Callable[..., DataFrame]
+    options: dict[str, Any] = field(default_factory=dict)
+
+    def __call__(self, df: DataFrame, inplace: bool = False) -> DataFrame:
+        options = self.options
+        if inplace and self.operation in INPLACE_OPERATIONS:
+            options = {**options, "inplace": True}
+        return self.function(df, **options)
+
+
+class PostProcessingPipeline:
+    """
+    A validated chain of post processing operations.
+
+    :param post_processing: post processing objects, each with an `operation` name
+           and optional `options`, as found in a query object
+    :raises InvalidPostProcessingError: If an operation or its options are invalid
+    """
+
+    def __init__(self, post_processing: list[dict[str, Any]]) -> None:
+        self.steps = [self._plan_step(post_process) for post_process in post_processing]
+        # time in seconds spent in each step during the last run
+        self.durations: list[tuple[str, float]] = []
+
+    @staticmethod
+    def _plan_step(post_process: dict[str, Any]) -> PostProcessingStep:
+        operation = post_process.get("operation")
+        if not operation:
+            raise InvalidPostProcessingError(
+                _("`operation` property of post processing object undefined")
+            )
+        function = POST_PROCESSING_OPERATIONS.get(operation)
+        if function is None:
+            raise InvalidPostProcessingError(
+                _(
+                    "Unsupported post processing operation: %(operation)s",
+                    operation=operation,
+                )
+            )
+
+        options = post_process.get("options") or {}
+        try:
+            inspect.signature(function).bind(None, **options)
+        except TypeError as ex:
+            raise InvalidPostProcessingError(
+                _(
+                    "Invalid options for %(operation)s: %(options)s",
+                    operation=operation,
+                    options=options,
+                )
+            ) from ex
+        return PostProcessingStep(operation, function, options)
+
+    def __call__(self, df: DataFrame) -> DataFrame:
+        """
+        Apply every step of the chain.
+
+        :param df: DataFrame returned from database model.
+        :return: new DataFrame to which all post processing operations have been
+                 applied
+        """
+        self.durations = []
+        source = df
+        for step in self.steps:
+            start = perf_counter()
+            df = step(df, inplace=df is not source)
+            self.durations.append((step.operation, perf_counter() - start))
+            logger.debug(
+                "post_processing %s: %.4f s", step.operation, self.durations[-1][1]
+            )
+        return df
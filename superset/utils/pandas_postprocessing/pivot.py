@@ -85,7 +85,7 @@ def pivot(  # pylint: disable=too-many-arguments
     # https://github.com/pandas-dev/pandas/issues/18030
     series_set = set()
     if not drop_missing_columns and columns:
-        for row in df[columns].itertuples():
+        for row in df[columns].drop_duplicates().itertuples():
             for metric in aggfunc.keys():
                 series_set.add(tuple([metric]) + tuple(row[1:]))  # noqa: C409
 
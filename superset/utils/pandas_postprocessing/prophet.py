@@ -14,18 +14,31 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import hashlib
 import logging
-from typing import Optional, Union
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Optional, Union
 
 import pandas as pd
+from flask import current_app
 from flask_babel import gettext as _
 from pandas import DataFrame
 
 from superset.exceptions import InvalidPostProcessingError
+from superset.extensions import cache_manager
 from superset.utils.core import DTTM_ALIAS
 from superset.utils.decorators import suppress_logging
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.pandas_postprocessing.utils import PROPHET_TIME_GRAIN_MAP
 
+# pool of processes fitting the models of forecasts, see `_prophet_executor`
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = Lock()
+
 
 def _prophet_parse_seasonality(
     input_value: Optional[Union[bool, int]],
@@ -40,41 +53,169 @@ def _prophet_parse_seasonality(
         return input_value
 
 
-def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
-    df: DataFrame,
-    confidence_interval: float,
-    yearly_seasonality: Union[bool, str, int],
-    weekly_seasonality: Union[bool, str, int],
-    daily_seasonality: Union[bool, str, int],
-    periods: int,
-    freq: str,
-) -> DataFrame:
+def _prophet_import() -> Any:
     """
-    Fit a prophet model and return a DataFrame with predicted results.
+    Import and return the `prophet` package.
     """
     try:
         # `prophet` complains about `plotly` not being installed
         with suppress_logging("prophet.plot"):
             # pylint: disable=import-outside-toplevel
-            from prophet import Prophet
+            import prophet
 
         prophet_logger = logging.getLogger("prophet.plot")
         prophet_logger.setLevel(logging.CRITICAL)
         prophet_logger.setLevel(logging.NOTSET)
     except ModuleNotFoundError as ex:
         raise InvalidPostProcessingError(_("`prophet` package not installed")) from ex
-    model = Prophet(
-        interval_width=confidence_interval,
-        yearly_seasonality=yearly_seasonality,
-        weekly_seasonality=weekly_seasonality,
-        daily_seasonality=daily_seasonality,
+    return prophet
+
+
+def _prophet_fit_df(df: DataFrame, index: str, column: str) -> DataFrame:
+    """
+    Get the DataFrame a model of the series in `column` is fitted on.
+    """
+    fit_df = df[[index, column]].rename(columns={index: "ds", column: "y"})
+    if fit_df["ds"].dt.tz:
+        fit_df["ds"] = fit_df["ds"].dt.tz_convert(None)
+    return fit_df
+
+
+def _prophet_model_cache_key(df: DataFrame, **model_options: Any) -> str:
+    """
+    Cache key of a model fitted on the `ds` and `y` columns of `df` with the given
+    model options.
+    """
+    data = pd.util.hash_pandas_object(df[["ds", "y"]], index=False).to_numpy()
+    return "prophet_model_" + md5_sha_from_dict(
+        {
+            "data": hashlib.md5(data.tobytes()).hexdigest(),  # noqa: S324
+            "options": model_options,
+        }
     )
-    if df["ds"].dt.tz:
-        df["ds"] = df["ds"].dt.tz_convert(None)
-    model.fit(df)
+
+
+def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
+    df: DataFrame,
+    confidence_interval: float,
+    yearly_seasonality: Union[bool, str, int],
+    weekly_seasonality: Union[bool, str, int],
+    daily_seasonality: Union[bool, str, int],
+    periods: int,
+    freq: str,
+    model_json: Optional[str] = None,
+) -> tuple[DataFrame, str]:
+    """
+    Fit a prophet model, unless an already fitted model is given as JSON, and return
+    a DataFrame with predicted results along with the model serialized as JSON.
+    """
+    prophet_lib = _prophet_import()
+    # pylint: disable=import-outside-toplevel
+    from prophet.serialize import model_from_json, model_to_json
+
+    if model_json:
+        model = model_from_json(model_json)
+    else:
+        model = prophet_lib.Prophet(
+            interval_width=confidence_interval,
+            yearly_seasonality=yearly_seasonality,
+            weekly_seasonality=weekly_seasonality,
+            daily_seasonality=daily_seasonality,
+        )
+        model.fit(df)
+        model_json = model_to_json(model)
     future = model.make_future_dataframe(periods=periods, freq=freq)
     forecast = model.predict(future)[["ds", "yhat", "yhat_lower", "yhat_upper"]]
-    return forecast.join(df.set_index("ds"), on="ds").set_index(["ds"])
+    return forecast.join(df.set_index("ds"), on="ds").set_index(["ds"]), model_json
+
+
+def _prophet_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Return the pool of processes shared by all the forecasts of this process,
+    created on first use.
+
+    Its processes are spawned rather than forked, since forking a multi-threaded web
+    worker can deadlock on locks held by other threads.
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _prophet_fit_and_predict_all(
+    fits: list[dict[str, Any]],
+) -> list[tuple[DataFrame, str]]:
+    """
+    Call `_prophet_fit_and_predict` with each of the given arguments, in the shared
+    pool of processes when there is more than one series and both
+    `PROPHET_MAX_WORKERS` and the number of CPUs allow it.
+    Daemonic processes, like Celery workers, can't have children so they always fit
+    the models themselves.
+    """
+    global _executor  # pylint: disable=global-statement
+    max_workers = min(current_app.config["PROPHET_MAX_WORKERS"], os.cpu_count() or 1)
+    if max_workers <= 1 or len(fits) <= 1 or multiprocessing.current_process().daemon:
+        return [_prophet_fit_and_predict(**kwargs) for kwargs in fits]
+
+    executor = _prophet_executor(max_workers)
+    try:
+        futures = [
+            executor.submit(_prophet_fit_and_predict, **kwargs) for kwargs in fits
+        ]
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        # a process of the pool died, so that the next forecast gets a new pool
+        with _executor_lock:
+            if _executor is executor:
+                _executor = None
+        executor.shutdown(wait=False)
+        raise
+
+
+def _prophet_forecast(
+    fit_dfs: list[DataFrame], periods: int, freq: str, **model_options: Any
+) -> list[DataFrame]:
+    """
+    Forecast each of the given series, reusing the models previously fitted on the
+    same data with the same options, and caching the newly fitted ones.
+    """
+    if not fit_dfs:
+        return []
+
+    # fail early rather than in each process of the pool
+    _prophet_import()
+    cache_keys = [
+        _prophet_model_cache_key(fit_df, **model_options) for fit_df in fit_dfs
+    ]
+    cached_models = cache_manager.data_cache.get_many(*cache_keys)
+    results = _prophet_fit_and_predict_all(
+        [
+            {
+                "df": fit_df,
+                "periods": periods,
+                "freq": freq,
+                "model_json": model_json,
+                **model_options,
+            }
+            for fit_df, model_json in zip(fit_dfs, cached_models, strict=True)
+        ]
+    )
+    if fitted_models := {
+        cache_key: model_json
+        for cache_key, cached_model, (_forecast_df, model_json) in zip(
+            cache_keys, cached_models, results, strict=True
+        )
+        if cached_model is None
+    }:
+        cache_manager.data_cache.set_many(
+            fitted_models, timeout=current_app.config["PROPHET_MODEL_CACHE_TIMEOUT"]
+        )
+    return [forecast_df for forecast_df, _model_json in results]
 
 
 def prophet(  # pylint: disable=too-many-arguments
@@ -139,21 +280,25 @@ def prophet(  # pylint: disable=too-many-arguments
 
     target_df = DataFrame()
 
-    for column in [
+    model_options = {
+        "confidence_interval": confidence_interval,
+        "yearly_seasonality": _prophet_parse_seasonality(yearly_seasonality),
+        "weekly_seasonality": _prophet_parse_seasonality(weekly_seasonality),
+        "daily_seasonality": _prophet_parse_seasonality(daily_seasonality),
+    }
+    columns = [
         column
         for column in df.columns
         if column != index
         and pd.to_numeric(df[column], errors="coerce").notnull().all()
-    ]:
-        fit_df = _prophet_fit_and_predict(
-            df=df[[index, column]].rename(columns={index: "ds", column: "y"}),
-            confidence_interval=confidence_interval,
-            yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
-            weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
-            daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
-            periods=periods,
-            freq=freq,
-        )
+    ]
+    forecasts = _prophet_forecast(
+        [_prophet_fit_df(df, index, column) for column in columns],
+        periods,
+        freq,
+        **model_options,
+    )
+    for column, fit_df in zip(columns, forecasts, strict=True):
         new_columns = [
             f"{column}__yhat",
             f"{column}__yhat_lower",
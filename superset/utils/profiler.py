@@ -15,6 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
 from typing import Any, Callable
 from unittest import mock
 
@@ -61,3 +70,120 @@ class SupersetProfiler:  # pylint: disable=too-few-public-methods
 
         # return HTML profiling information
         return Response(profiler.output_html(), mimetype="text/html")
+
+
+class _TimedLoader(Loader):
+    """
+    Loader proxy timing the execution of the module it loads.
+    """
+
+    def __init__(self, loader: Loader, profiler: StartupProfiler) -> None:
+        self.loader = loader
+        self.profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        with self.profiler.time_import(module.__name__):
+            self.loader.exec_module(module)
+
+
+class _TimingFinder(MetaPathFinder):
+    """
+    Meta path finder wrapping the loaders found by the other finders.
+    """
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self.profiler = profiler
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self.profiler)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Profiler of the initialization of the app.
+
+    Times each initialization step, and the modules imported while profiling. The
+    time of a module excludes the time spent importing the modules it imports, so
+    that the report points at the modules which are slow to import themselves.
+
+        profiler = StartupProfiler()
+        with profiler:
+            with profiler.step("init_views"):
+                ...
+        logger.info(profiler.report())
+    """
+
+    def __init__(self) -> None:
+        self.steps: list[tuple[str, float]] = []
+        self.imports: dict[str, float] = {}
+        self._finder = _TimingFinder(self)
+        self._children: list[float] = []
+
+    def __enter__(self) -> StartupProfiler:
+        sys.meta_path.insert(0, self._finder)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        sys.meta_path.remove(self._finder)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.perf_counter() - start))
+
+    @contextmanager
+    def time_import(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        self._children.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            self.imports[name] = elapsed - children
+            if self._children:
+                self._children[-1] += elapsed
+
+    def report(self, limit: int = 20) -> str:
+        """
+        Return the time of each step, and of the slowest modules to import.
+        """
+        lines = ["Startup profile:"]
+        lines.extend(
+            f"{elapsed * 1000:10.1f} ms  {name}" for name, elapsed in self.steps
+        )
+        lines.append(
+            f"{sum(self.imports.values()) * 1000:10.1f} ms  "
+            f"importing {len(self.imports)} modules, slowest:"
+        )
+        lines.extend(
+            f"{elapsed * 1000:10.1f} ms  {name}"
+            for name, elapsed in sorted(
+                self.imports.items(),
+                key=lambda item: item[1],
+                reverse=True,
+            )[:limit]
+        )
+        return "\n".join(lines)
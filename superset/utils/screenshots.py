@@ -24,6 +24,7 @@ from io import BytesIO
 from typing import cast, TYPE_CHECKING, TypedDict
 
 from flask import current_app as app
+from typing_extensions import NotRequired
 
 from superset import feature_flag_manager, thumbnail_cache
 from superset.extensions import event_logger
@@ -67,6 +68,7 @@ class ScreenshotCachePayloadType(TypedDict):
     image: str | None
     timestamp: str
     status: str
+    data_digest: NotRequired[str | None]
 
 
 class ScreenshotCachePayload:
@@ -75,10 +77,13 @@ class ScreenshotCachePayload:
         image: bytes | None = None,
         status: StatusValues = StatusValues.PENDING,
         timestamp: str = "",
+        data_digest: str | None = None,
     ):
         self._image = image
         self._timestamp = timestamp or datetime.now().isoformat()
         self.status = StatusValues.UPDATED if image else status
+        # digest of the query results rendered in the image
+        self.data_digest = data_digest
 
     @classmethod
     def from_dict(cls, payload: ScreenshotCachePayloadType) -> ScreenshotCachePayload:
@@ -86,6 +91,7 @@ class ScreenshotCachePayload:
             image=base64.b64decode(payload["image"]) if payload["image"] else None,
             status=StatusValues(payload["status"]),
             timestamp=payload["timestamp"],
+            data_digest=payload.get("data_digest"),
         )
 
     def to_dict(self) -> ScreenshotCachePayloadType:
@@ -95,6 +101,7 @@ class ScreenshotCachePayload:
             else None,
             "timestamp": self._timestamp,
             "status": self.status.value,
+            "data_digest": self.data_digest,
         }
 
     def update_timestamp(self) -> None:
@@ -138,11 +145,22 @@ class ScreenshotCachePayload:
             datetime.now() - datetime.fromisoformat(self.get_timestamp())
         ).total_seconds() > error_cache_ttl
 
+    def is_computing_stale(self) -> bool:
+        lease_ttl = app.config["THUMBNAIL_COMPUTE_LEASE_TTL"]
+        return (
+            self.status == StatusValues.COMPUTING
+            and (
+                datetime.now() - datetime.fromisoformat(self.get_timestamp())
+            ).total_seconds()
+            > lease_ttl
+        )
+
     def should_trigger_task(self, force: bool = False) -> bool:
         return (
             force
             or self.status == StatusValues.PENDING
             or (self.status == StatusValues.ERROR and self.is_error_cache_ttl_expired())
+            or self.is_computing_stale()
         )
 
 
@@ -227,6 +245,7 @@ class BaseScreenshot:
         window_size: WindowSize | None = None,
         thumb_size: WindowSize | None = None,
         cache_key: str | None = None,
+        data_digest: str | None = None,
     ) -> None:
         """
         Computes the thumbnail and caches the result
@@ -236,21 +255,66 @@ class BaseScreenshot:
         :param window_size: The window size from which will process the thumb
         :param thumb_size: The final thumbnail size
         :param force: Will force the computation even if it's already cached
-        :return: Image payload
+        :param data_digest: The digest of the query results to render, the thumbnail
+            isn't computed again if it already renders them, even if forced
         """
         cache_key = cache_key or self.get_cache_key(window_size, thumb_size)
         cache_payload = self.get_from_cache_key(cache_key) or ScreenshotCachePayload()
-        if (
+        stats_logger = app.config["STATS_LOGGER"]
+        if cache_payload.is_computing_stale():
+            logger.info("Recovering abandoned thumbnail computation: %s", cache_key)
+            stats_logger.incr("screenshot.lease.stale")
+        elif (
+            cache_payload.status == StatusValues.UPDATED
+            and data_digest is not None
+            and cache_payload.data_digest == data_digest
+        ):
+            logger.info(
+                "Skipping compute - data unchanged for thumbnail: %s", cache_key
+            )
+            stats_logger.incr("screenshot.data_unchanged")
+            return
+        elif (
             cache_payload.status in [StatusValues.COMPUTING, StatusValues.UPDATED]
             and not force
         ):
             logger.info(
                 "Skipping compute - already processed for thumbnail: %s", cache_key
             )
+            if cache_payload.status == StatusValues.COMPUTING:
+                stats_logger.incr("screenshot.lease.duplicate_suppressed")
             return
 
-        window_size = window_size or self.window_size
-        thumb_size = thumb_size or self.thumb_size
+        # only one worker computes a given thumbnail at a time, the others leave it to
+        # it, even when forced
+        lease_ttl = app.config["THUMBNAIL_COMPUTE_LEASE_TTL"]
+        lease_key = self.get_lease_key(cache_key)
+        if not self.cache.add(lease_key, datetime.now().isoformat(), timeout=lease_ttl):
+            logger.info("Thumbnail is being computed by another worker: %s", cache_key)
+            stats_logger.incr("screenshot.lease.duplicate_suppressed")
+            return
+
+        stats_logger.incr("screenshot.lease.acquired")
+        cache_payload.data_digest = data_digest
+        try:
+            self._compute_and_cache(
+                cache_key,
+                cache_payload,
+                user,
+                window_size or self.window_size,
+                thumb_size or self.thumb_size,
+            )
+        finally:
+            self.cache.delete(lease_key)
+
+    def _compute_and_cache(  # pylint: disable=too-many-arguments
+        self,
+        cache_key: str,
+        cache_payload: ScreenshotCachePayload,
+        user: User | None,
+        window_size: WindowSize,
+        thumb_size: WindowSize,
+    ) -> None:
         logger.info("Processing url for thumbnail: %s", cache_key)
         cache_payload.computing()
         self.cache.set(cache_key, cache_payload.to_dict())
@@ -277,7 +341,10 @@ class BaseScreenshot:
                 cache_payload.update(image)
         self.cache.set(cache_key, cache_payload.to_dict())
         logger.info("Updated thumbnail cache; Status: %s", cache_payload.get_status())
-        return
+
+    @staticmethod
+    def get_lease_key(cache_key: str) -> str:
+        return f"{cache_key}_lease"
 
     @classmethod
     def resize_image(
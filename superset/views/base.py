@@ -60,6 +60,10 @@ from superset.db_engine_specs import get_available_engine_specs
 from superset.db_engine_specs.gsheets import GSheetsEngineSpec
 from superset.extensions import cache_manager
 from superset.reports.models import ReportRecipientType
+from superset.security.access_index import (
+    can_use_dataset_access_index,
+    get_accessible_dataset_ids,
+)
 from superset.superset_typing import FlaskResponse
 from superset.themes.utils import (
     is_valid_theme,
@@ -527,6 +531,10 @@ class DatasourceFilter(BaseFilter):  # pylint: disable=too-few-public-methods
     def apply(self, query: Query, value: Any) -> Query:
         if security_manager.can_access_all_datasources():
             return query
+        if can_use_dataset_access_index() and (
+            dataset_ids := get_accessible_dataset_ids()
+        ) is not None:
+            return query.filter(self.model.id.in_(dataset_ids))
         query = query.join(
             models.Database,
             models.Database.id == self.model.database_id,
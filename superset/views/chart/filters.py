@@ -19,6 +19,10 @@ from typing import Any
 from sqlalchemy.orm.query import Query
 
 from superset import security_manager
+from superset.security.access_index import (
+    can_use_dataset_access_index,
+    get_accessible_dataset_ids,
+)
 from superset.utils.filters import get_dataset_access_filters
 from superset.views.base import BaseFilter
 
@@ -28,4 +32,9 @@ class SliceFilter(BaseFilter):  # pylint: disable=too-few-public-methods
         if security_manager.can_access_all_datasources():
             return query
 
+        if can_use_dataset_access_index() and (
+            dataset_ids := get_accessible_dataset_ids()
+        ) is not None:
+            return query.filter(self.model.datasource_id.in_(dataset_ids))
+
         return query.filter(get_dataset_access_filters(self.model))
@@ -396,6 +396,32 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         assert rv.status_code == 200
         assert rv.mimetype == mimetype
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_post_processed_csv_result_format(self):
+        """
+        Chart data API: Test post-processed chart data with CSV result format
+        """
+        self.query_context_payload["result_format"] = "csv"
+        self.query_context_payload["result_type"] = ChartDataResultType.POST_PROCESSED
+        self.query_context_payload["form_data"] = {"viz_type": "table"}
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/csv"
+        assert rv.data.decode().splitlines()[0] == "name,sum__num"
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_post_processed_json_result_format_no_viz_type(self):
+        """
+        Chart data API: Test post-processed chart data without a post-processor
+        """
+        self.query_context_payload["result_type"] = ChartDataResultType.POST_PROCESSED
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        result = rv.json["result"][0]
+        assert "df" not in result
+        assert result["colnames"] == ["name", "sum__num"]
+        assert result["data"][0].keys() == {"name", "sum__num"}
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_multi_query_csv_result_format(self):
         """
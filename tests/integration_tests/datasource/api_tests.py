@@ -204,3 +204,27 @@ class TestDatasourceApi(SupersetTestCase):
             assert rv.status_code == 200
             response = json.loads(rv.data.decode("utf-8"))
             assert response["result"] == []
+
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    def test_get_columns_values(self):
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        rv = self.client.get(
+            f"api/v1/datasource/table/{table.id}/column_values/"
+            "?q=(columns:!(col1,col2),search:a)"
+        )
+        assert rv.status_code == 200
+        response = json.loads(rv.data.decode("utf-8"))
+        assert response["result"] == {"col1": [], "col2": ["a"]}
+
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    def test_get_columns_values_invalid_column(self):
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        rv = self.client.get(
+            f"api/v1/datasource/table/{table.id}/column_values/"
+            "?q=(columns:!(col1,invalid))"
+        )
+        assert rv.status_code == 400
+        response = json.loads(rv.data.decode("utf-8"))
+        assert response["message"] == "Column name invalid does not exist"
@@ -152,3 +152,41 @@ def test_codec(
 
     # Clean up after test as well for good measure
     cache.delete(FIRST_KEY)
+
+
+def test_bulk_operations(
+    app_context: AppContext, cache: SupersetMetastoreCache
+) -> None:
+    # Clean up any existing keys first to ensure idempotency
+    cache.delete_many(FIRST_KEY, SECOND_KEY)
+
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, None]
+    assert cache.set(FIRST_KEY, FIRST_KEY_INITIAL_VALUE) is True
+    assert cache.set_many(
+        {FIRST_KEY: FIRST_KEY_UPDATED_VALUE, SECOND_KEY: SECOND_VALUE}
+    ) == [FIRST_KEY, SECOND_KEY]
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [
+        FIRST_KEY_UPDATED_VALUE,
+        SECOND_VALUE,
+    ]
+    assert cache.get_dict(SECOND_KEY) == {SECOND_KEY: SECOND_VALUE}
+
+    assert cache.delete_many(FIRST_KEY, "missing") == [FIRST_KEY]
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, SECOND_VALUE]
+
+    # Clean up after test as well for good measure
+    cache.delete_many(SECOND_KEY)
+
+
+def test_bulk_expiry(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
+    cache.delete_many(FIRST_KEY, SECOND_KEY)
+
+    dttm = datetime(2022, 3, 18, 0, 0, 0)
+    with freeze_time(dttm):
+        cache.set_many({FIRST_KEY: FIRST_KEY_INITIAL_VALUE}, timeout=60)
+        cache.set_many({SECOND_KEY: SECOND_VALUE}, timeout=0)
+
+    with freeze_time(dttm + timedelta(seconds=61)):
+        assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, SECOND_VALUE]
+
+    cache.delete_many(FIRST_KEY, SECOND_KEY)
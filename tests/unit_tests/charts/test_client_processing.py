@@ -15,13 +15,23 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from io import BytesIO
+from typing import Any
 
 import pandas as pd
 import pytest
 from flask_babel import lazy_gettext as _
+from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
 
-from superset.charts.client_processing import apply_client_processing, pivot_df, table
+from superset.charts.client_processing import (
+    add_column_subtotals,
+    add_row_subtotals,
+    apply_client_processing,
+    get_rollup_groups,
+    pivot_df,
+    table,
+)
 from superset.common.chart_data import ChartDataResultFormat
 from superset.utils.core import GenericDataType
 
@@ -2562,3 +2572,328 @@ def test_pivot_multi_level_index():
 | ('Total (Sum)', '', '')           |            210 |            105 |              0 |
     """.strip()
     )
+
+
+def test_apply_client_processing_dataframe() -> None:
+    """
+    Test that deferred results are post-processed from the dataframe directly.
+
+    Values are not parsed back from CSV, so their types are preserved.
+    """
+    df = pd.DataFrame(
+        {
+            "zip": ["0123", "0123", "4567"],
+            "SUM(num)": [1.5, 2.5, 3],
+        }
+    )
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.CSV,
+                "df": df,
+                "coltypes": [GenericDataType.STRING, GenericDataType.NUMERIC],
+            }
+        ]
+    }
+    form_data = {
+        "viz_type": "pivot_table_v2",
+        "groupbyColumns": [],
+        "groupbyRows": ["zip"],
+        "metrics": ["SUM(num)"],
+        "metricsLayout": "COLUMNS",
+        "aggregateFunction": "Sum",
+    }
+
+    assert apply_client_processing(result, form_data) == {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.CSV,
+                "data": ",SUM(num)\n0123,4.0\n4567,3.0\n",
+                "colnames": [("SUM(num)",)],
+                "indexnames": [("0123",), ("4567",)],
+                "coltypes": [GenericDataType.NUMERIC],
+                "rowcount": 2,
+            }
+        ]
+    }
+
+
+def test_apply_client_processing_dataframe_csv_escaped() -> None:
+    """
+    Test that formulas are escaped in post-processed CSV exports.
+
+    Both the values and the pivot labels made from dimension values are escaped.
+    """
+    df = pd.DataFrame(
+        {
+            "dim": ["=1+1", "=1+1", "a"],
+            "value": ["=1+1", "b", "c"],
+            "COUNT(*)": [1, 2, 3],
+        }
+    )
+    coltypes = [
+        GenericDataType.STRING,
+        GenericDataType.STRING,
+        GenericDataType.NUMERIC,
+    ]
+
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.CSV,
+                "df": df.copy(),
+                "coltypes": coltypes,
+            }
+        ]
+    }
+    form_data = {"viz_type": "table"}
+
+    data = apply_client_processing(result, form_data)["queries"][0]["data"]
+    assert data == "dim,value,COUNT(*)\n'=1+1,'=1+1,1\n'=1+1,b,2\na,c,3\n"
+
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.CSV,
+                "df": df.copy(),
+                "coltypes": coltypes,
+            }
+        ]
+    }
+    form_data = {
+        "viz_type": "pivot_table_v2",
+        "groupbyColumns": ["value"],
+        "groupbyRows": ["dim"],
+        "metrics": ["COUNT(*)"],
+        "metricsLayout": "COLUMNS",
+        "aggregateFunction": "Sum",
+    }
+
+    data = apply_client_processing(result, form_data)["queries"][0]["data"]
+    fields = [field for line in data.splitlines() for field in line.split(",")]
+    assert "'=1+1" in fields
+    assert not any(field.startswith("=") for field in fields)
+
+
+def test_apply_client_processing_dataframe_csv_temporal() -> None:
+    """
+    Test that temporal pivot labels are formatted like in the CSV query results.
+
+    Dates at midnight are written without their time, as they were when the pivot
+    was computed from the CSV data.
+    """
+    df = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-01"]),
+            "dim": ["a", "a", "b"],
+            "SUM(num)": [1, 2, 3],
+        }
+    )
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.CSV,
+                "df": df,
+                "coltypes": [
+                    GenericDataType.TEMPORAL,
+                    GenericDataType.STRING,
+                    GenericDataType.NUMERIC,
+                ],
+            }
+        ]
+    }
+    form_data = {
+        "viz_type": "pivot_table_v2",
+        "groupbyColumns": ["ds"],
+        "groupbyRows": ["dim"],
+        "metrics": ["SUM(num)"],
+        "metricsLayout": "COLUMNS",
+        "aggregateFunction": "Sum",
+    }
+
+    data = apply_client_processing(result, form_data)["queries"][0]["data"]
+
+    assert data.splitlines()[0] == ",SUM(num) 2020-01-01,SUM(num) 2020-01-02"
+
+
+def test_apply_client_processing_dataframe_xlsx() -> None:
+    """
+    Test that deferred results can be post-processed into Excel files.
+    """
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.XLSX,
+                "df": pd.DataFrame({"SUM(num)": [1, 2]}),
+                "coltypes": [GenericDataType.NUMERIC],
+            }
+        ]
+    }
+    form_data = {"viz_type": "table"}
+
+    data = apply_client_processing(result, form_data)["queries"][0]["data"]
+
+    assert pd.read_excel(BytesIO(data)).to_dict(orient="list") == {"SUM(num)": [1, 2]}
+
+
+def test_apply_client_processing_dataframe_xlsx_timezone() -> None:
+    """
+    Test that timezone aware columns, not supported by Excel, are exported.
+    """
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.XLSX,
+                "df": pd.DataFrame(
+                    {"ds": pd.to_datetime(["2020-01-01 12:00:00"]).tz_localize("UTC")}
+                ),
+                "coltypes": [GenericDataType.TEMPORAL],
+            }
+        ]
+    }
+    form_data = {"viz_type": "table"}
+
+    data = apply_client_processing(result, form_data)["queries"][0]["data"]
+
+    assert pd.read_excel(BytesIO(data)).to_dict(orient="list") == {
+        "ds": ["2020-01-01 12:00:00+00:00"]
+    }
+
+
+@pytest.mark.parametrize(
+    "form_data,df",
+    [
+        ({"viz_type": "line"}, pd.DataFrame({"a": [1]})),
+        ({"viz_type": "pivot_table_v2"}, pd.DataFrame({"a": []})),
+    ],
+)
+def test_apply_client_processing_dataframe_unprocessed(
+    mocker: MockerFixture,
+    form_data: dict[str, Any],
+    df: pd.DataFrame,
+) -> None:
+    """
+    Test that deferred results are formatted as is when not post-processed.
+    """
+    query_context = mocker.MagicMock()
+    query_context.get_data.return_value = "a\n1\n"
+    result = {
+        "query_context": query_context,
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.CSV,
+                "df": df,
+                "coltypes": [GenericDataType.NUMERIC],
+            }
+        ],
+    }
+
+    assert apply_client_processing(result, form_data)["queries"] == [
+        {
+            "result_format": ChartDataResultFormat.CSV,
+            "data": "a\n1\n",
+            "coltypes": [GenericDataType.NUMERIC],
+        }
+    ]
+    query_context.get_data.assert_called_once_with(df, [GenericDataType.NUMERIC])
+
+
+def test_get_rollup_groups() -> None:
+    """
+    Test grouping the labels of an index by each of their prefixes.
+    """
+    index = pd.MultiIndex.from_tuples(
+        [("a", "x", 1), ("a", "x", 2), ("a", "y", 1), ("b", "x", 1)]
+    )
+
+    groups = get_rollup_groups(index)
+
+    assert [group.tolist() for group in groups] == [
+        [0, 0, 0, 0],
+        [0, 0, 0, 1],
+        [0, 0, 1, 2],
+    ]
+
+
+def test_add_column_subtotals_mixed_types() -> None:
+    """
+    Test that subtotals of integer columns stay integers in mixed dataframes.
+    """
+    df = pd.DataFrame(
+        [[1, 2, 0.5, 1.5]],
+        columns=pd.MultiIndex.from_tuples(
+            [("COUNT", "a"), ("COUNT", "b"), ("SUM", "a"), ("SUM", "b")]
+        ),
+    )
+
+    result = add_column_subtotals(df, "Sum", "Total (Sum)")
+
+    assert result.columns.tolist() == [
+        ("COUNT", "a"),
+        ("COUNT", "b"),
+        ("COUNT", "Subtotal"),
+        ("SUM", "a"),
+        ("SUM", "b"),
+        ("SUM", "Subtotal"),
+        ("Total (Sum)", ""),
+    ]
+    assert result.iloc[0].tolist() == [1, 2, 3, 0.5, 1.5, 2.0, 5.0]
+    assert result[("COUNT", "Subtotal")].dtype == "int64"
+    assert result[("Total (Sum)", "")].dtype == "float64"
+
+
+def test_add_row_subtotals() -> None:
+    """
+    Test that row subtotals go after their group, deeper ones first.
+    """
+    df = pd.DataFrame(
+        {"SUM(num)": [1, 2, 3, 4]},
+        index=pd.MultiIndex.from_tuples(
+            [("a", "x"), ("a", "y"), ("b", "x"), ("b", "y")]
+        ),
+    )
+
+    result = add_row_subtotals(df, "Sum", "Total (Sum)")
+
+    assert result.to_dict(orient="index") == {
+        ("a", "x"): {"SUM(num)": 1},
+        ("a", "y"): {"SUM(num)": 2},
+        ("a", "Subtotal"): {"SUM(num)": 3},
+        ("b", "x"): {"SUM(num)": 3},
+        ("b", "y"): {"SUM(num)": 4},
+        ("b", "Subtotal"): {"SUM(num)": 7},
+        ("Total (Sum)", ""): {"SUM(num)": 10},
+    }
+    assert result.index.tolist()[-1] == ("Total (Sum)", "")
+
+
+def test_pivot_df_count_subtotals() -> None:
+    """
+    Test subtotals of aggregations that can't be applied to dataframes directly.
+    """
+    df = pd.DataFrame(
+        {
+            "state": ["CA", "CA", "NY"],
+            "city": ["LA", "SF", "NYC"],
+            "SUM(num)": [1, 2, 3],
+        }
+    )
+
+    pivoted = pivot_df(
+        df,
+        rows=["state", "city"],
+        columns=[],
+        metrics=["SUM(num)"],
+        aggfunc="Count",
+        show_rows_total=True,
+        show_columns_total=True,
+    )
+
+    assert pivoted.to_dict(orient="index") == {
+        ("CA", "LA"): {("SUM(num)",): 1, ("Total (Count)",): 1},
+        ("CA", "SF"): {("SUM(num)",): 1, ("Total (Count)",): 1},
+        ("CA", "Subtotal"): {("SUM(num)",): 2, ("Total (Count)",): 2},
+        ("NY", "NYC"): {("SUM(num)",): 1, ("Total (Count)",): 1},
+        ("NY", "Subtotal"): {("SUM(num)",): 1, ("Total (Count)",): 1},
+        ("Total (Count)", ""): {("SUM(num)",): 3, ("Total (Count)",): 3},
+    }
@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name, unused-argument
+
+from pathlib import Path
+
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.cli.thumbnails import compute_thumbnails
+from superset.models.slice import Slice
+
+
+@pytest.fixture
+def charts(session: Session) -> list[Slice]:
+    Slice.metadata.create_all(session.get_bind())
+    charts = [
+        Slice(slice_name=f"chart {i}", datasource_type="table", datasource_id=1)
+        for i in range(5)
+    ]
+    session.add_all(charts)
+    session.commit()
+    return charts
+
+
+def test_compute_thumbnails_in_waves(
+    mocker: MockerFixture, charts: list[Slice], tmp_path: Path
+) -> None:
+    """
+    Test that thumbnails are computed in waves, recording the processed ones so that
+    an interrupted backfill can be resumed.
+    """
+    cache_chart_thumbnail = mocker.patch(
+        "superset.tasks.thumbnails.cache_chart_thumbnail"
+    )
+    cache_chart_thumbnail.side_effect = [None, None, None, RuntimeError("crash")]
+    state_file = tmp_path / "state"
+    runner = current_app.test_cli_runner()
+    args = ["-c", "-f", "-n", "2", "-s", str(state_file)]
+
+    response = runner.invoke(compute_thumbnails, args)
+    assert isinstance(response.exception, RuntimeError)
+    assert state_file.read_text().split() == [
+        f"chart:{charts[0].id}",
+        f"chart:{charts[1].id}",
+    ]
+
+    cache_chart_thumbnail.reset_mock(side_effect=True)
+    response = runner.invoke(compute_thumbnails, args)
+    assert response.exit_code == 0
+    assert sorted(call.args[1] for call in cache_chart_thumbnail.call_args_list) == [
+        chart.id for chart in charts[2:]
+    ]
+    cache_chart_thumbnail.assert_called_with(None, charts[4].id, force=True)
+    assert len(state_file.read_text().split()) == 5
+
+
+def test_compute_thumbnails_skips_fresh(
+    mocker: MockerFixture, charts: list[Slice]
+) -> None:
+    """
+    Test that thumbnails cached for the current digest of their chart are skipped,
+    unless they are forced, and that the rate limit spaces out the computations.
+    """
+    cache_chart_thumbnail = mocker.patch(
+        "superset.tasks.thumbnails.cache_chart_thumbnail"
+    )
+    mocker.patch(
+        "superset.cli.thumbnails._is_fresh",
+        side_effect=lambda friendly_type, model: model.id != charts[0].id,
+    )
+    sleep = mocker.patch("superset.cli.thumbnails.time.sleep")
+    runner = current_app.test_cli_runner()
+
+    response = runner.invoke(compute_thumbnails, ["-c", "-r", "60"])
+    assert response.exit_code == 0
+    cache_chart_thumbnail.assert_called_once_with(None, charts[0].id, force=False)
+    assert "5/5 charts, 4 up to date" in response.output
+    sleep.assert_called_once()
+
+    response = runner.invoke(compute_thumbnails, ["-c", "-u"])
+    assert response.exit_code == 0
+    assert cache_chart_thumbnail.call_count == 6
+    cache_chart_thumbnail.assert_called_with(
+        None, charts[4].id, force=True, if_data_changed=True
+    )
@@ -251,3 +251,32 @@ def test_columnar_reader_metadata_invalid_file():
         "Parsing error: Parquet file size is 2 bytes, "
         "smaller than the minimum file footer (8 bytes)"
     )
+
+
+def test_columnar_reader_file_to_dataframe_chunks(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.columnar_reader.STREAMING_CHUNK_SIZE", 2
+    )
+    reader = ColumnarReader(
+        options=ColumnarReaderOptions(columns_read=["Name", "Age"]),
+    )
+    chunks = list(
+        reader.file_to_dataframe_chunks(create_columnar_file(COLUMNAR_WITH_NULLS))
+    )
+    assert [chunk.columns.tolist() for chunk in chunks] == [["Name", "Age"]] * 2
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert np.isnan(chunks[0]["Age"][0])
+    assert chunks[1].values.tolist() == [["name3", 20.0]]
+
+
+def test_columnar_reader_file_to_dataframe_chunks_invalid_file():
+    reader = ColumnarReader(
+        options=ColumnarReaderOptions(),
+    )
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        list(
+            reader.file_to_dataframe_chunks(
+                FileStorage(io.BytesIO(b"c1"), "test.parquet")
+            )
+        )
+    assert str(ex.value).startswith("Parsing error: ")
@@ -371,3 +371,94 @@ def test_csv_reader_file_metadata_invalid_file():
         "Parsing error: Error tokenizing data. C error:"
         " Expected 3 fields in line 3, saw 7\n"
     )
+
+
+def test_csv_reader_file_to_dataframe_chunks(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.STREAMING_CHUNK_SIZE", 2
+    )
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(column_dates=["Birth"]),
+    )
+    chunks = list(csv_reader.file_to_dataframe_chunks(create_csv_file(CSV_DATA)))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[1].values.tolist() == [["name3", 20, "city3", datetime(2000, 2, 1)]]
+
+
+def test_csv_reader_file_to_dataframe_chunks_invalid_file():
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(index_column="wrong"),
+    )
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        list(csv_reader.file_to_dataframe_chunks(create_csv_file(CSV_DATA)))
+    assert str(ex.value) == "Parsing error: Index wrong invalid"
+
+
+def test_csv_reader_read_streams_chunks(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.STREAMING_CHUNK_SIZE", 2
+    )
+    database = mocker.MagicMock()
+    database.db_engine_spec.supports_streaming_upload = True
+    chunks = []
+    database.db_engine_spec.df_chunks_to_sql.side_effect = (
+        lambda database, table, dfs, to_sql_kwargs: chunks.extend(dfs)
+    )
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(already_exists="replace"),
+    )
+    csv_reader.read(
+        create_csv_file(
+            [
+                ["Name", "Age"],
+                ["name1", "30"],
+                ["name2", "25"],
+                ["name3", "N/A"],
+            ]
+        ),
+        database,
+        "table",
+        None,
+    )
+
+    database.db_engine_spec.df_to_sql.assert_not_called()
+    call = database.db_engine_spec.df_chunks_to_sql.call_args
+    assert call.kwargs["to_sql_kwargs"]["if_exists"] == "replace"
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    # the first chunk is cast to the dtype of the whole file
+    assert [chunk["Age"].dtype for chunk in chunks] == [np.float64, np.float64]
+
+
+def test_csv_reader_read_invalid_file_not_written(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.STREAMING_CHUNK_SIZE", 2
+    )
+    database = mocker.MagicMock()
+    database.db_engine_spec.supports_streaming_upload = True
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(already_exists="replace"),
+    )
+    with pytest.raises(DatabaseUploadFailed):
+        csv_reader.read(
+            create_csv_file(CSV_DATA + [["name4", "10", "city4", "2000-02-01", "x"]]),
+            database,
+            "table",
+            None,
+        )
+
+    database.db_engine_spec.df_chunks_to_sql.assert_not_called()
+
+
+def test_csv_reader_read_no_streaming_support(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.STREAMING_CHUNK_SIZE", 2
+    )
+    database = mocker.MagicMock()
+    database.db_engine_spec.supports_streaming_upload = False
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    csv_reader.read(create_csv_file(CSV_DATA), database, "table", None)
+
+    database.db_engine_spec.df_to_sql.assert_called_once()
+    assert len(database.db_engine_spec.df_to_sql.call_args.args[2]) == 3
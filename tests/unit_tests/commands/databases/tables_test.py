@@ -203,3 +203,76 @@ def test_tables_without_catalog(
         cache=database_without_catalog.table_cache_enabled,
         cache_timeout=database_without_catalog.table_cache_timeout,
     )
+
+
+def test_search_tables(mocker: MockerFixture) -> None:
+    """
+    Test that search results are filtered by access and limited.
+    """
+    from superset.commands.database.tables import SearchTablesDatabaseCommand
+
+    database = mocker.MagicMock()
+    DatabaseDAO = mocker.patch("superset.commands.database.tables.DatabaseDAO")  # noqa: N806
+    DatabaseDAO.find_by_id.return_value = database
+    mocker.patch(
+        "superset.commands.database.tables.get_catalog_index",
+        return_value={
+            "refreshed_at": 123.0,
+            "schemas": [
+                {
+                    "catalog": None,
+                    "schema": "private",
+                    "refreshed_at": 123.0,
+                    "tables": ["orders_secret"],
+                    "views": [],
+                },
+                {
+                    "catalog": None,
+                    "schema": "public",
+                    "refreshed_at": 123.0,
+                    "tables": ["orders", "fact_orders"],
+                    "views": ["v_orders"],
+                },
+            ],
+        },
+    )
+    mocker.patch.object(
+        security_manager,
+        "get_datasources_accessible_by_user",
+        side_effect=lambda database, catalog, schema, datasource_names: (
+            datasource_names if schema == "public" else []
+        ),
+    )
+
+    payload = SearchTablesDatabaseCommand(1, "orders", 2).run()
+    assert payload == {
+        "count": 3,
+        "refreshed_at": 123.0,
+        "result": [
+            {"catalog": None, "schema": "public", "name": "orders", "type": "table"},
+            {
+                "catalog": None,
+                "schema": "public",
+                "name": "fact_orders",
+                "type": "table",
+            },
+        ],
+    }
+
+
+def test_search_tables_not_indexed(mocker: MockerFixture) -> None:
+    """
+    Test the response when the database hasn't been indexed yet.
+    """
+    from superset.commands.database.tables import SearchTablesDatabaseCommand
+
+    mocker.patch("superset.commands.database.tables.DatabaseDAO")
+    mocker.patch(
+        "superset.commands.database.tables.get_catalog_index", return_value=None
+    )
+
+    assert SearchTablesDatabaseCommand(1, "orders", 10).run() == {
+        "count": 0,
+        "result": [],
+        "refreshed_at": None,
+    }
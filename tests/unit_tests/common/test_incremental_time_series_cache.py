@@ -0,0 +1,246 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from freezegun import freeze_time
+from pandas.testing import assert_frame_equal
+from pytest_mock import MockerFixture
+
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_object import QueryObject
+from superset.common.utils import query_cache_manager
+from superset.common.utils.time_range_utils import get_since_until_from_time_range
+from superset.constants import CacheRegion
+from superset.extensions import security_manager
+from superset.models.helpers import QueryResult
+from tests.unit_tests.conftest import with_feature_flags
+
+NOW = "2024-01-03 12:30:00"
+
+
+class EventsDatasource:
+    """
+    A datasource summing the values of events by hour, as a database would.
+    """
+
+    uid = "1__table"
+    offset = 0
+    changed_on = datetime(2023, 1, 1)
+    is_rls_supported = False
+    column_names = ["ts", "value"]
+
+    def __init__(self, events: pd.DataFrame) -> None:
+        self.events = events
+        self.queried_ranges: list[tuple[datetime, datetime]] = []
+
+    def get_column(self, column_name: str | None) -> None:
+        return None
+
+    def get_extra_cache_keys(self, query_obj: dict[str, Any]) -> list[str]:
+        return []
+
+    def query(self, query_obj: dict[str, Any]) -> QueryResult:
+        # the time range of the x-axis is applied from its temporal filter
+        since, until = get_since_until_from_time_range(query_obj["filter"][0]["val"])
+        self.queried_ranges.append((since, until))
+        events = self.events[(self.events["ts"] >= since) & (self.events["ts"] < until)]
+        df = (
+            events.groupby(events["ts"].dt.floor("h"))["value"]
+            .sum()
+            .rename("sum__value")
+            .reset_index()
+        )
+        if query_obj["row_limit"]:
+            df = df.head(query_obj["row_limit"])
+        return QueryResult(
+            df=df,
+            query=f"SELECT ... WHERE ts >= '{since}' AND ts < '{until}'",
+            duration=timedelta(seconds=1),
+        )
+
+
+@pytest.fixture
+def events() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ts": pd.date_range("2024-01-01", "2024-01-03 12:00", freq="15min"),
+            "value": 1,
+        }
+    )
+
+
+@pytest.fixture
+def processor(mocker: MockerFixture, events: pd.DataFrame) -> QueryContextProcessor:
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: cache})
+    mocker.patch(
+        "superset.common.query_context_processor.cache_manager",
+        data_cache=cache,
+    )
+    mocker.patch.object(security_manager, "get_rls_cache_key", return_value=[])
+    query_context = MagicMock(force=False, datasource=EventsDatasource(events))
+    query_context.get_cache_timeout.return_value = 3600
+    return QueryContextProcessor(query_context)
+
+
+def make_query_object(**kwargs: Any) -> QueryObject:
+    kwargs.setdefault("row_limit", 10000)
+    return QueryObject(
+        columns=[
+            {
+                "columnType": "BASE_AXIS",
+                "expressionType": "SQL",
+                "label": "ts",
+                "sqlExpression": "ts",
+                "timeGrain": "PT1H",
+            }
+        ],
+        metrics=["sum__value"],
+        filters=[
+            {
+                "col": "ts",
+                "op": "TEMPORAL_RANGE",
+                "val": "2024-01-01T00:00:00 : 2024-01-03T13:00:00",
+            }
+        ],
+        from_dttm=datetime(2024, 1, 1),
+        to_dttm=datetime(2024, 1, 3, 13),
+        **kwargs,
+    )
+
+
+@freeze_time(NOW)
+@with_feature_flags(INCREMENTAL_TIME_SERIES_CACHE=True)
+def test_incremental_query_result(processor: QueryContextProcessor) -> None:
+    datasource = processor._qc_datasource
+    df = processor.get_query_result(make_query_object()).df
+    # the whole range is queried at once the first time
+    assert datasource.queried_ranges == [
+        (datetime(2024, 1, 1), datetime(2024, 1, 3, 13))
+    ]
+    assert len(df) == 61
+    assert df["sum__value"].sum() == len(datasource.events)
+
+    datasource.queried_ranges.clear()
+    assert_frame_equal(processor.get_query_result(make_query_object()).df, df)
+    # the closed buckets of the first two days are cached, today is still open
+    assert datasource.queried_ranges == [
+        (datetime(2024, 1, 3), datetime(2024, 1, 3, 13))
+    ]
+
+
+@freeze_time(NOW)
+@with_feature_flags(INCREMENTAL_TIME_SERIES_CACHE=True)
+def test_incremental_query_result_matches_full_query(
+    processor: QueryContextProcessor,
+) -> None:
+    # starting halfway through a day
+    query_object = make_query_object(orderby=[("sum__value", False)])
+    query_object.filter[0]["val"] = "2023-12-31T06:00:00 : 2024-01-03T13:00:00"
+    query_object.from_dttm = datetime(2023, 12, 31, 6)
+    with patch.object(processor, "can_query_incrementally", return_value=False):
+        expected = processor.get_query_result(query_object).df
+
+    datasource = processor._qc_datasource
+    for _ in range(2):
+        df = processor.get_query_result(query_object).df
+        assert_frame_equal(
+            df.sort_values("ts", ignore_index=True),
+            expected.sort_values("ts", ignore_index=True),
+        )
+        assert df["sum__value"].is_monotonic_decreasing
+    assert datasource.queried_ranges[-1] == (
+        datetime(2024, 1, 3),
+        datetime(2024, 1, 3, 13),
+    )
+
+
+@freeze_time(NOW)
+@with_feature_flags(INCREMENTAL_TIME_SERIES_CACHE=True)
+def test_incremental_query_result_late_arriving_data(
+    processor: QueryContextProcessor,
+) -> None:
+    datasource = processor._qc_datasource
+    processor.get_query_result(make_query_object())
+
+    late_events = pd.DataFrame(
+        {
+            # within the late data window of the open bucket, and long after the
+            # closed bucket of the first day
+            "ts": [datetime(2024, 1, 3, 11, 59), datetime(2024, 1, 1, 5)],
+            "value": [10, 100],
+        }
+    )
+    datasource.events = pd.concat([datasource.events, late_events])
+
+    df = processor.get_query_result(make_query_object()).df.set_index("ts")
+    assert df.loc[datetime(2024, 1, 3, 11), "sum__value"] == 14
+    assert df.loc[datetime(2024, 1, 1, 5), "sum__value"] == 4
+
+    # forcing a refresh picks up rows arriving after a bucket was closed
+    processor._query_context.force = True
+    df = processor.get_query_result(make_query_object()).df.set_index("ts")
+    assert df.loc[datetime(2024, 1, 1, 5), "sum__value"] == 104
+
+    # a day later, the bucket of the 3rd is closed and cached
+    processor._query_context.force = False
+    with freeze_time("2024-01-04 12:00:00"):
+        processor.get_query_result(make_query_object())
+        datasource.queried_ranges.clear()
+        processor.get_query_result(make_query_object())
+        assert datasource.queried_ranges == []
+
+
+@freeze_time(NOW)
+@with_feature_flags(INCREMENTAL_TIME_SERIES_CACHE=True)
+def test_incremental_query_result_row_limit(processor: QueryContextProcessor) -> None:
+    datasource = processor._qc_datasource
+    df = processor.get_query_result(make_query_object(row_limit=50)).df
+    # the buckets may have been cut by the row limit, so the query is run as a whole
+    assert datasource.queried_ranges == [
+        (datetime(2024, 1, 1), datetime(2024, 1, 3, 13)),
+        (datetime(2024, 1, 1), datetime(2024, 1, 3, 13)),
+    ]
+    assert len(df) == 50
+
+
+@freeze_time(NOW)
+@with_feature_flags(INCREMENTAL_TIME_SERIES_CACHE=True)
+def test_incremental_query_result_not_eligible(
+    processor: QueryContextProcessor,
+) -> None:
+    assert processor.can_query_incrementally(make_query_object())
+    assert not processor.can_query_incrementally(
+        make_query_object(time_offsets=["1 week ago"])
+    )
+    assert not processor.can_query_incrementally(make_query_object(series_limit=5))
+    assert not processor.can_query_incrementally(make_query_object(row_offset=10))
+
+    query_object = make_query_object()
+    query_object.columns[0]["timeGrain"] = "P1W"
+    assert not processor.can_query_incrementally(query_object)
+
+
+@with_feature_flags(INCREMENTAL_TIME_SERIES_CACHE=False)
+def test_incremental_query_result_disabled(processor: QueryContextProcessor) -> None:
+    assert not processor.can_query_incrementally(make_query_object())
@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.db_query_status import QueryStatus
+from superset.common.query_actions import get_query_results
+
+
+@pytest.fixture
+def query_context(mocker: MockerFixture) -> MagicMock:
+    mocker.patch(
+        "superset.common.query_actions.get_time_filter_status",
+        return_value=([], []),
+    )
+    mocker.patch(
+        "superset.common.query_actions.extract_dataframe_dtypes",
+        return_value=[],
+    )
+    query_context = MagicMock()
+    query_context.result_format = ChartDataResultFormat.CSV
+    query_context.get_data.return_value = "a\n1\n"
+    return query_context
+
+
+def get_df_payload(df: pd.DataFrame, status: QueryStatus) -> dict[str, object]:
+    return {
+        "df": df,
+        "status": status,
+        "applied_filter_columns": [],
+        "rejected_filter_columns": [],
+    }
+
+
+def test_get_full_formats_data(query_context: MagicMock) -> None:
+    """
+    Test that full results are formatted right away.
+    """
+    df = pd.DataFrame({"a": [1]})
+    query_context.get_df_payload.return_value = get_df_payload(df, QueryStatus.SUCCESS)
+    query_obj = MagicMock(result_type=None)
+
+    payload = get_query_results(
+        ChartDataResultType.FULL,
+        query_context,
+        query_obj,
+        False,
+    )
+
+    assert "df" not in payload
+    assert payload["data"] == "a\n1\n"
+
+
+def test_get_post_processed_defers_formatting(query_context: MagicMock) -> None:
+    """
+    Test that post-processed results keep the dataframe, unformatted.
+    """
+    df = pd.DataFrame({"a": [1]})
+    query_context.get_df_payload.return_value = get_df_payload(df, QueryStatus.SUCCESS)
+    query_obj = MagicMock(result_type=ChartDataResultType.POST_PROCESSED)
+
+    payload = get_query_results(
+        ChartDataResultType.POST_PROCESSED,
+        query_context,
+        query_obj,
+        False,
+    )
+
+    assert payload["df"] is df
+    assert "data" not in payload
+    assert payload["result_format"] == ChartDataResultFormat.CSV
+    query_context.get_data.assert_not_called()
+
+
+def test_get_post_processed_failed(query_context: MagicMock) -> None:
+    """
+    Test that failed post-processed results do not keep the dataframe.
+    """
+    query_context.get_df_payload.return_value = get_df_payload(
+        pd.DataFrame(), QueryStatus.FAILED
+    )
+    query_obj = MagicMock(result_type=ChartDataResultType.POST_PROCESSED)
+
+    payload = get_query_results(
+        ChartDataResultType.POST_PROCESSED,
+        query_context,
+        query_obj,
+        False,
+    )
+
+    assert "df" not in payload
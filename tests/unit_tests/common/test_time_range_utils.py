@@ -22,6 +22,8 @@ import pytest
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
+    get_time_buckets,
+    TimeBucket,
 )
 
 
@@ -92,3 +94,35 @@ def test__since_until_from_adhoc_filters(dummy_query_object):
         datetime(2001, 1, 1, 0, 0, 0),
         datetime(2002, 1, 1, 0, 0, 0),
     )
+
+
+def test__get_time_buckets():
+    assert get_time_buckets(
+        datetime(2024, 1, 30, 12),
+        datetime(2024, 2, 2),
+        "PT1H",
+        closed_before=datetime(2024, 2, 1, 6),
+    ) == [
+        TimeBucket(datetime(2024, 1, 30, 12), datetime(2024, 1, 31), True),
+        TimeBucket(datetime(2024, 1, 31), datetime(2024, 2, 1), True),
+        TimeBucket(datetime(2024, 2, 1), datetime(2024, 2, 2), False),
+    ]
+    assert get_time_buckets(
+        datetime(2023, 12, 1),
+        datetime(2024, 2, 15),
+        "P1D",
+        closed_before=datetime(2024, 3, 1),
+    ) == [
+        TimeBucket(datetime(2023, 12, 1), datetime(2024, 1, 1), True),
+        TimeBucket(datetime(2024, 1, 1), datetime(2024, 2, 1), True),
+        TimeBucket(datetime(2024, 2, 1), datetime(2024, 2, 15), True),
+    ]
+    assert get_time_buckets(
+        datetime(2020, 1, 1),
+        datetime(2022, 1, 1),
+        "P3M",
+        closed_before=datetime(2021, 6, 1),
+    ) == [
+        TimeBucket(datetime(2020, 1, 1), datetime(2021, 1, 1), True),
+        TimeBucket(datetime(2021, 1, 1), datetime(2022, 1, 1), False),
+    ]
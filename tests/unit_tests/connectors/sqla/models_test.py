@@ -696,3 +696,60 @@ def test_get_sqla_table_with_catalog(
     # Verify expected table name and schema
     assert sqla_table.name == expected_name
     assert sqla_table.schema == expected_schema
+
+
+def test_fetch_metadata_added_removed_modified(mocker: MockerFixture) -> None:
+    """
+    Test that fetch_metadata diffs old and new columns, keeps calculated columns and
+    flags new temporal columns using the engine spec.
+    """
+    from superset.utils.core import ColumnSpec, GenericDataType
+
+    database = mocker.MagicMock()
+    database.get_metrics.return_value = []
+    database.db_engine_spec.get_column_spec.side_effect = lambda type_, **kwargs: (
+        ColumnSpec(
+            sqla_type=None,
+            generic_type=GenericDataType.TEMPORAL,
+            is_dttm=True,
+        )
+        if type_ == "TIMESTAMP"
+        else None
+    )
+
+    table = SqlaTable(table_name="test_table_diff", database=database)
+    table.id = 1
+    old_columns = [
+        TableColumn(column_name="kept", type="INTEGER", is_dttm=False, table=table),
+        TableColumn(column_name="changed", type="INTEGER", is_dttm=False, table=table),
+        TableColumn(column_name="dropped", type="INTEGER", is_dttm=False, table=table),
+        TableColumn(column_name="calculated", expression="kept + 1", table=table),
+    ]
+    mock_session = mocker.patch("superset.connectors.sqla.models.db.session")
+    mock_session.query.return_value.filter.return_value.all.return_value = old_columns
+    mocker.patch.object(
+        table,
+        "external_metadata",
+        return_value=[
+            {"column_name": "kept", "type": "INTEGER"},
+            {"column_name": "changed", "type": "VARCHAR"},
+            {"column_name": "ts", "type": "TIMESTAMP"},
+        ],
+    )
+    mocker.patch(
+        "superset.connectors.sqla.models.config", {"SQLA_TABLE_MUTATOR": lambda x: None}
+    )
+
+    result = table.fetch_metadata()
+
+    assert result.added == ["ts"]
+    assert result.removed == ["dropped", "calculated"]
+    assert result.modified == ["changed"]
+    assert [col.column_name for col in table.columns] == [
+        "kept",
+        "changed",
+        "ts",
+        "calculated",
+    ]
+    assert table.main_dttm_col == "ts"
+    database.get_extra.assert_called_once()
@@ -393,3 +393,114 @@ def test_delete_entry_missing(
     from superset.daos.key_value import KeyValueDAO
 
     assert KeyValueDAO.delete_entry(resource=RESOURCE, key=12345678) is False
+
+
+def test_upsert_entries(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    admin_user: User,  # noqa: F811
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+    from superset.key_value.models import KeyValueEntry
+
+    other_key = UUID("b2c5ea59-55a5-4a0c-8f6e-6a4e53f2ab6c")
+    expires_on = datetime.now() + timedelta(days=1)
+    with override_user(admin_user):
+        KeyValueDAO.upsert_entries(
+            resource=RESOURCE,
+            values={UUID_KEY: NEW_VALUE, other_key: JSON_VALUE},
+            codec=JSON_CODEC,
+            expires_on=expires_on,
+        )
+    db.session.expire_all()
+
+    updated_entry = db.session.query(KeyValueEntry).filter_by(uuid=UUID_KEY).one()
+    assert updated_entry.id == ID_KEY
+    assert json.loads(updated_entry.value) == NEW_VALUE
+    assert updated_entry.changed_by_fk == admin_user.id
+    created_entry = db.session.query(KeyValueEntry).filter_by(uuid=other_key).one()
+    assert json.loads(created_entry.value) == JSON_VALUE
+    assert created_entry.created_by_fk == admin_user.id
+    assert updated_entry.expires_on == created_entry.expires_on == expires_on
+
+
+def test_upsert_entries_fail_encode(
+    app_context: AppContext,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    with pytest.raises(KeyValueCreateFailedError):
+        KeyValueDAO.upsert_entries(
+            resource=RESOURCE,
+            values={UUID_KEY: PICKLE_VALUE},
+            codec=JSON_CODEC,
+        )
+
+
+def test_get_values(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    expired_key = UUID("b2c5ea59-55a5-4a0c-8f6e-6a4e53f2ab6c")
+    KeyValueDAO.create_entry(
+        resource=RESOURCE,
+        value=JSON_VALUE,
+        codec=JSON_CODEC,
+        key=expired_key,
+        expires_on=datetime.now() - timedelta(days=1),
+    )
+    missing_key = UUID("0a5ac2c8-1de1-4b3a-8d4b-0d6e8b3c2f11")
+
+    values = KeyValueDAO.get_values(
+        resource=RESOURCE,
+        keys=[UUID_KEY, expired_key, missing_key],
+        codec=JSON_CODEC,
+    )
+
+    assert values == {UUID_KEY: JSON_VALUE}
+
+
+def test_delete_entries(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    missing_key = UUID("0a5ac2c8-1de1-4b3a-8d4b-0d6e8b3c2f11")
+
+    assert KeyValueDAO.delete_entries(RESOURCE, [UUID_KEY, missing_key]) == [UUID_KEY]
+    assert KeyValueDAO.get_entry(RESOURCE, UUID_KEY) is None
+    assert KeyValueDAO.delete_entries(RESOURCE, [UUID_KEY]) == []
+
+
+def test_delete_expired_entries(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    for key, resource in (
+        (456, RESOURCE),
+        (789, KeyValueResource.METASTORE_CACHE),
+    ):
+        KeyValueDAO.create_entry(
+            resource=resource,
+            value=JSON_VALUE,
+            codec=JSON_CODEC,
+            key=key,
+            expires_on=datetime.now() - timedelta(days=1),
+        )
+    db.session.flush()
+
+    assert KeyValueDAO.delete_expired_entries(RESOURCE) == 1
+    assert KeyValueDAO.get_entry(RESOURCE, 456) is None
+    assert KeyValueDAO.delete_expired_entries() == 1
+    assert KeyValueDAO.get_entry(KeyValueResource.METASTORE_CACHE, 789) is None
+    assert KeyValueDAO.get_entry(RESOURCE, ID_KEY) is not None
@@ -2291,6 +2291,38 @@ def test_catalogs(
     )
 
 
+def test_table_search(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test the `table_search` endpoint.
+    """
+    SearchTablesDatabaseCommand = mocker.patch(  # noqa: N806
+        "superset.databases.api.SearchTablesDatabaseCommand"
+    )
+    SearchTablesDatabaseCommand.return_value.run.return_value = {
+        "count": 1,
+        "refreshed_at": 123.0,
+        "result": [
+            {"catalog": None, "schema": "public", "name": "orders", "type": "table"}
+        ],
+    }
+
+    response = client.get("/api/v1/database/1/table_search/?q=(query:ord,limit:5)")
+    assert response.status_code == 200
+    assert response.json["count"] == 1
+    assert response.json["result"][0]["name"] == "orders"
+    SearchTablesDatabaseCommand.assert_called_with(1, "ord", 5)
+
+    response = client.get("/api/v1/database/1/table_search/?q=(query:ord)")
+    SearchTablesDatabaseCommand.assert_called_with(1, "ord", 100)
+
+    response = client.get("/api/v1/database/1/table_search/?q=(limit:5)")
+    assert response.status_code == 400
+
+
 def test_catalogs_with_oauth2(
     mocker: MockerFixture,
     client: Any,
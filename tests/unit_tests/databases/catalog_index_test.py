@@ -0,0 +1,151 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.databases.catalog_index import (
+    CatalogIndex,
+    refresh_catalog_index,
+    search_catalog_index,
+)
+
+INDEX: CatalogIndex = {
+    "refreshed_at": 0,
+    "schemas": [
+        {
+            "catalog": None,
+            "schema": "public",
+            "refreshed_at": 0,
+            "tables": ["fact_orders", "orders", "Orders_archive"],
+            "views": ["v_orders"],
+        },
+        {
+            "catalog": None,
+            "schema": "staging",
+            "refreshed_at": 0,
+            "tables": ["customers", "orders"],
+            "views": [],
+        },
+    ],
+}
+
+
+def test_search_catalog_index() -> None:
+    """
+    Test that prefix matches come before substring matches.
+    """
+    assert [
+        (match["schema"], match["name"], match["type"])
+        for match in search_catalog_index(INDEX, "ORDERS")
+    ] == [
+        ("public", "orders", "table"),
+        ("staging", "orders", "table"),
+        ("public", "Orders_archive", "table"),
+        ("public", "fact_orders", "table"),
+        ("public", "v_orders", "view"),
+    ]
+    assert search_catalog_index(INDEX, "nope") == []
+
+
+@freeze_time("2024-01-02 00:00:00")
+def test_refresh_catalog_index(mocker: MockerFixture) -> None:
+    """
+    Test that only stale and new schemas are inspected, that missing schemas are
+    dropped, and that schemas failing to be inspected keep their previous entry.
+    """
+    now = datetime.now()
+    fresh = (now - timedelta(minutes=5)).timestamp()
+    stale = (now - timedelta(days=2)).timestamp()
+    previous: CatalogIndex = {
+        "refreshed_at": stale,
+        "schemas": [
+            {
+                "catalog": None,
+                "schema": "fresh",
+                "refreshed_at": fresh,
+                "tables": ["a"],
+                "views": [],
+            },
+            {
+                "catalog": None,
+                "schema": "stale",
+                "refreshed_at": stale,
+                "tables": ["b"],
+                "views": [],
+            },
+            {
+                "catalog": None,
+                "schema": "broken",
+                "refreshed_at": stale,
+                "tables": ["c"],
+                "views": [],
+            },
+            {
+                "catalog": None,
+                "schema": "dropped",
+                "refreshed_at": stale,
+                "tables": ["d"],
+                "views": [],
+            },
+        ],
+    }
+    KeyValueDAO = mocker.patch("superset.databases.catalog_index.KeyValueDAO")  # noqa: N806
+    KeyValueDAO.get_value.return_value = previous
+
+    def get_tables(catalog: str | None, schema: str, force: bool) -> set[tuple]:
+        if schema == "broken":
+            raise Exception("boom")
+        return {("t2", schema, catalog), ("t1", schema, catalog)}
+
+    database = mocker.MagicMock()
+    database.id = 1
+    database.allow_multi_catalog = False
+    database.get_default_catalog.return_value = None
+    database.get_all_schema_names.return_value = {"fresh", "stale", "broken", "new"}
+    database.get_all_table_names_in_schema.side_effect = get_tables
+    database.get_all_view_names_in_schema.return_value = set()
+
+    index = refresh_catalog_index(database, max_age=timedelta(days=1))
+
+    assert index == {
+        "refreshed_at": now.timestamp(),
+        "schemas": [
+            previous["schemas"][2],
+            previous["schemas"][0],
+            {
+                "catalog": None,
+                "schema": "new",
+                "refreshed_at": now.timestamp(),
+                "tables": ["t1", "t2"],
+                "views": [],
+            },
+            {
+                "catalog": None,
+                "schema": "stale",
+                "refreshed_at": now.timestamp(),
+                "tables": ["t1", "t2"],
+                "views": [],
+            },
+        ],
+    }
+    assert {
+        call.kwargs["schema"]
+        for call in database.get_all_table_names_in_schema.call_args_list
+    } == {"stale", "broken", "new"}
+    KeyValueDAO.upsert_entry.assert_called_once()
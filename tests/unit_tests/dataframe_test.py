@@ -203,3 +203,56 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    ["int64", "uint64", "Int64", "object"],
+)
+def test_df_to_records_big_integers(dtype: str) -> None:
+    import pandas as pd
+
+    from superset.utils.core import JS_MAX_INTEGER
+
+    big = JS_MAX_INTEGER + 1
+    if dtype == "uint64":
+        values = [1, big]
+    else:
+        values = [-big, 1, big]
+    df = pd.DataFrame({"a": pd.Series(values, dtype=dtype)})
+
+    assert df_to_records(df) == [
+        {"a": str(value) if abs(value) > JS_MAX_INTEGER else value} for value in values
+    ]
+
+
+def test_df_to_records_big_integers_nullable() -> None:
+    import pandas as pd
+
+    from superset.utils.core import JS_MAX_INTEGER
+
+    big = JS_MAX_INTEGER + 1
+    df = pd.DataFrame(
+        {
+            "a": pd.Series([big, None], dtype="Int64"),
+            "b": pd.Series([big, "foo", 1.5, None], dtype="object").iloc[:2],
+            "c": [True, False],
+        }
+    )
+
+    records = df_to_records(df)
+
+    assert records[0] == {"a": str(big), "b": str(big), "c": True}
+    assert records[1]["a"] is None
+    assert records[1]["b"] == "foo"
+
+
+def test_df_to_records_big_integers_duplicate_columns() -> None:
+    import pandas as pd
+
+    from superset.utils.core import JS_MAX_INTEGER
+
+    big = JS_MAX_INTEGER + 1
+    df = pd.DataFrame([[big, 1], [1, big]], columns=["a", "a"])
+
+    assert df_to_records(df) == [{"a": 1}, {"a": str(big)}]
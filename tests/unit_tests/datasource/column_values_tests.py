@@ -0,0 +1,141 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, redefined-outer-name
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.elements import TextClause
+
+from superset.datasource.column_values import get_column_values
+from tests.unit_tests.conftest import with_feature_flags
+
+if TYPE_CHECKING:
+    from superset.connectors.sqla.models import SqlaTable
+
+
+@pytest.fixture
+def table(mocker: MockerFixture, session: Session) -> SqlaTable:
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+
+    SqlaTable.metadata.create_all(session.get_bind())
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+
+    connection = engine.raw_connection()
+    connection.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+    connection.execute("INSERT INTO t VALUES (1, 'Alice')")
+    connection.execute("INSERT INTO t VALUES (2, 'Bob')")
+    connection.execute("INSERT INTO t VALUES (NULL, 'alex')")
+    connection.commit()
+
+    @contextmanager
+    def mock_get_sqla_engine():
+        yield engine
+
+    mocker.patch.object(database, "get_sqla_engine", new=mock_get_sqla_engine)
+
+    return SqlaTable(
+        id=1,
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture, app_context: None) -> Cache:
+    cache_manager = mocker.patch("superset.datasource.column_values.cache_manager")
+    cache_manager.data_cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    return cache_manager.data_cache
+
+
+def test_get_column_values(table: SqlaTable) -> None:
+    """
+    Test that the values of each requested column are returned, once.
+    """
+    assert get_column_values(table, ["b", "a", "b"], limit=100) == {
+        "b": ["Alice", "Bob", "alex"],
+        "a": [1, 2, None],
+    }
+    assert get_column_values(table, ["a"], limit=1) == {"a": [1]}
+
+
+def test_get_column_values_search(table: SqlaTable) -> None:
+    """
+    Test that values can be searched by a case-insensitive prefix.
+    """
+    assert get_column_values(table, ["a", "b"], limit=100, search="AL") == {
+        "a": [],
+        "b": ["Alice", "alex"],
+    }
+
+
+@with_feature_flags(COLUMN_VALUES_CACHE=True)
+def test_get_column_values_cache(
+    mocker: MockerFixture,
+    table: SqlaTable,
+    cache: Cache,
+) -> None:
+    """
+    Test that the values of columns are cached per column and RLS filters, and that
+    only the columns missing from the cache are fetched.
+    """
+    values_for_columns = mocker.spy(table, "values_for_columns")
+
+    assert get_column_values(table, ["a"], limit=100) == {"a": [1, 2, None]}
+    assert get_column_values(table, ["a", "b"], limit=100) == {
+        "a": [1, 2, None],
+        "b": ["Alice", "Bob", "alex"],
+    }
+    assert [call.args[0] for call in values_for_columns.call_args_list] == [
+        ["a"],
+        ["b"],
+    ]
+
+    # searching filters the cached values
+    assert get_column_values(table, ["b"], limit=100, search="b") == {"b": ["Bob"]}
+    assert values_for_columns.call_count == 2
+
+    # users with other RLS filters don't share the cached values
+    with patch.object(
+        table,
+        "get_sqla_row_level_filters",
+        return_value=[TextClause("a = 1")],
+    ):
+        assert get_column_values(table, ["a"], limit=100) == {"a": [1]}
+    assert values_for_columns.call_count == 3
+
+    get_column_values(table, ["a"], limit=100, force=True)
+    assert values_for_columns.call_count == 4
@@ -539,3 +539,74 @@ def test_use_equality_for_boolean_filters_property() -> None:
 
     # Default should be False (use IS operators)
     assert BaseEngineSpec.use_equality_for_boolean_filters is False
+
+
+def test_fetch_arrow_not_supported(mocker: MockerFixture) -> None:
+    """
+    Test that `fetch_arrow` returns `None` without consuming the cursor by default.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    cursor = mocker.MagicMock()
+
+    assert BaseEngineSpec.fetch_arrow(cursor) is None
+    cursor.fetchall.assert_not_called()
+    cursor.fetchmany.assert_not_called()
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that `fetch_arrow` limits the results and applies the column mutators.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ArrowEngineSpec(BaseEngineSpec):
+        column_type_mutators = {
+            types.String: lambda value: value.upper(),
+            types.Integer: lambda value: value + 1,
+        }
+        arrow_column_type_mutators = {
+            types.Integer: lambda column: pc.multiply(column, 10),
+        }
+
+        @classmethod
+        def fetch_native_arrow(cls, cursor: Any, limit: int | None = None) -> Any:
+            return cursor.fetch_arrow_table()
+
+    cursor = mocker.MagicMock()
+    cursor.description = [
+        ("a", "VARCHAR", None, None, None, None, True),
+        ("b", "INTEGER", None, None, None, None, True),
+        ("c", "FLOAT", None, None, None, None, True),
+    ]
+    cursor.fetch_arrow_table.return_value = pa.table(
+        {"a": ["x", "y", "z"], "b": [1, 2, 3], "c": [0.5, 1.5, 2.5]}
+    )
+
+    table = ArrowEngineSpec.fetch_arrow(cursor, limit=2)
+
+    assert table.to_pydict() == {"a": ["X", "Y"], "b": [10, 20], "c": [0.5, 1.5]}
+
+
+def test_fetch_arrow_error(mocker: MockerFixture) -> None:
+    """
+    Test that driver errors in `fetch_arrow` are mapped like in `fetch_data`.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ArrowEngineSpec(BaseEngineSpec):
+        @classmethod
+        def fetch_native_arrow(cls, cursor: Any, limit: int | None = None) -> Any:
+            raise ValueError("boom")
+
+    mocker.patch.object(
+        ArrowEngineSpec,
+        "get_dbapi_mapped_exception",
+        side_effect=lambda ex: RuntimeError(str(ex)),
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        ArrowEngineSpec.fetch_arrow(mocker.MagicMock())
@@ -284,3 +284,27 @@ def test_get_prequeries(mocker: MockerFixture) -> None:
         "USE CATALOG `escaped-hyphen`",
         "USE SCHEMA `hyphen-escaped`",
     ]
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as Arrow from the Databricks SQL connector.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.databricks import DatabricksNativeEngineSpec
+
+    cursor = mocker.MagicMock(
+        spec=["description", "fetchall_arrow", "fetchmany_arrow", "fetchall"]
+    )
+    cursor.description = [("a", "int", None, None, None, None, True)]
+    cursor.fetchall_arrow.return_value = pa.table({"a": [1, 2, 3]})
+    cursor.fetchmany_arrow.return_value = pa.table({"a": [1, 2]})
+
+    assert DatabricksNativeEngineSpec.fetch_arrow(cursor).num_rows == 3
+    assert DatabricksNativeEngineSpec.fetch_arrow(cursor, limit=2).num_rows == 2
+    cursor.fetchmany_arrow.assert_called_with(2)
+
+    cursor = mocker.MagicMock(spec=["description", "fetchall"])
+    cursor.description = [("a", "int", None, None, None, None, True)]
+    assert DatabricksNativeEngineSpec.fetch_arrow(cursor) is None
@@ -124,3 +124,25 @@ def test_get_parameters_from_uri() -> None:
 
     assert parameters["database"] == "md:my_db"
     assert parameters["access_token"] == "token"  # noqa: S105
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as Arrow from the DuckDB cursor.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    cursor = mocker.MagicMock(spec=["description", "fetch_arrow_table", "fetchall"])
+    cursor.description = [("a", "INTEGER", None, None, None, None, True)]
+    cursor.fetch_arrow_table.return_value = pa.table({"a": [1, 2, 3]})
+
+    table = DuckDBEngineSpec.fetch_arrow(cursor, limit=2)
+
+    assert table.to_pydict() == {"a": [1, 2]}
+    cursor.fetchall.assert_not_called()
+
+    cursor = mocker.MagicMock(spec=["description", "fetchall"])
+    cursor.description = [("a", "INTEGER", None, None, None, None, True)]
+    assert DuckDBEngineSpec.fetch_arrow(cursor) is None
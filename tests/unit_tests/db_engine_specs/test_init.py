@@ -19,7 +19,12 @@
 import pytest
 from pytest_mock import MockerFixture
 
-from superset.db_engine_specs import get_available_engine_specs
+from superset.db_engine_specs import (
+    EngineSpecRegistry,
+    get_available_engine_specs,
+    get_engine_spec,
+)
+from superset.db_engine_specs.base import BaseEngineSpec
 
 
 def test_get_available_engine_specs(mocker: MockerFixture) -> None:
@@ -77,3 +82,51 @@ def test_get_available_engine_specs_with_denylist(mocker: MockerFixture) -> None
     )
     available = get_available_engine_specs()
     assert list(available.keys()) == [DatabricksNativeEngineSpec]
+
+
+def test_engine_spec_registry() -> None:
+    """
+    The registry resolves specs by backend and driver, in the order they were loaded
+    """
+    from superset.db_engine_specs.databricks import (
+        DatabricksHiveEngineSpec,
+        DatabricksNativeEngineSpec,
+        DatabricksODBCEngineSpec,
+    )
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+
+    registry = EngineSpecRegistry(
+        [
+            DatabricksHiveEngineSpec,
+            DatabricksNativeEngineSpec,
+            DatabricksODBCEngineSpec,
+            PostgresEngineSpec,
+        ]
+    )
+
+    assert registry.get("databricks", "pyhive") == DatabricksHiveEngineSpec
+    assert registry.get("databricks", "connector") == DatabricksNativeEngineSpec
+    assert registry.get("databricks", "pyodbc") == DatabricksODBCEngineSpec
+    assert registry.get("databricks", "fancynewdriver") == DatabricksHiveEngineSpec
+    assert registry.get("databricks") == DatabricksHiveEngineSpec
+    assert registry.get("postgres") == PostgresEngineSpec
+    assert registry.get("postgresql", "psycopg2") == PostgresEngineSpec
+    assert registry.get("mysql") == BaseEngineSpec
+
+
+def test_get_engine_spec_loads_once(mocker: MockerFixture) -> None:
+    """
+    The engine specs are only loaded the first time a spec is looked up
+    """
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+
+    mocker.patch("superset.db_engine_specs._registry", None)
+    load_engine_specs = mocker.patch(
+        "superset.db_engine_specs.load_engine_specs",
+        return_value=[PostgresEngineSpec],
+    )
+
+    assert get_engine_spec("postgresql", "psycopg2") == PostgresEngineSpec
+    assert get_engine_spec("postgresql", "psycopg2") == PostgresEngineSpec
+    assert get_engine_spec("mysql") == BaseEngineSpec
+    load_engine_specs.assert_called_once()
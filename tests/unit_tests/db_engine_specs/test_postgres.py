@@ -280,3 +280,50 @@ SELECT * \nFROM my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+def test_get_df_to_sql_method(mocker: MockerFixture) -> None:
+    """
+    Test that ``COPY FROM STDIN`` is only used with psycopg2.
+    """
+    from superset.db_engine_specs.postgres import copy_from_stdin
+
+    engine = mocker.MagicMock()
+    engine.dialect.driver = "psycopg2"
+    assert spec.get_df_to_sql_method(engine) is copy_from_stdin
+
+    engine.dialect.driver = "pg8000"
+    engine.dialect.supports_multivalues_insert = True
+    assert spec.get_df_to_sql_method(engine) == "multi"
+
+
+def test_copy_from_stdin(mocker: MockerFixture) -> None:
+    """
+    Test that rows are serialized in the ``COPY`` text format.
+    """
+    from sqlalchemy.dialects.postgresql import dialect
+
+    from superset.db_engine_specs.postgres import copy_from_stdin
+
+    conn = mocker.MagicMock()
+    conn.dialect = dialect()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    buffers: list[str] = []
+    cursor.copy_expert.side_effect = lambda sql, file: buffers.append(file.read())
+    pd_table = mocker.MagicMock()
+    pd_table.name = "my table"
+    pd_table.schema = "public"
+
+    rowcount = copy_from_stdin(
+        pd_table,
+        conn,
+        ["id", "name"],
+        [(1, "a\tb"), (2, None), (3, "back\\slash\nnewline")],
+    )
+
+    assert rowcount == 3
+    cursor.copy_expert.assert_called_once()
+    assert cursor.copy_expert.call_args[0][0] == (
+        'COPY public."my table" (id, name) FROM STDIN'
+    )
+    assert buffers == ["1\ta\\tb\n2\t\\N\n3\tback\\\\slash\\nnewline\n"]
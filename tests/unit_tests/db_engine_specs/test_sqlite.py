@@ -18,7 +18,9 @@
 from datetime import datetime
 from typing import Optional
 
+import pandas as pd
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy.engine import create_engine
 
 from superset.constants import TimeGrain
@@ -129,3 +131,65 @@ def test_time_grain_expressions(dttm: str, grain: str, expected: str) -> None:
     sql = f"SELECT {expression} FROM t"  # noqa: S608
     result = connection.execute(sql).scalar()
     assert result == expected
+
+
+def test_df_to_sql(mocker: MockerFixture) -> None:
+    """
+    Test that uploads to SQLite use ``executemany`` instead of multi-row inserts.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.sql.parse import Table
+
+    engine = create_engine("sqlite://")
+    mocker.patch.object(SqliteEngineSpec, "get_engine").return_value.__enter__ = (
+        lambda _: engine
+    )
+    assert SqliteEngineSpec.get_df_to_sql_method(engine) is None
+
+    df = pd.DataFrame({"a": range(2000), "b": ["x"] * 2000})
+    SqliteEngineSpec.df_to_sql(
+        mocker.MagicMock(),
+        Table("t"),
+        df,
+        {"chunksize": 1000, "if_exists": "fail", "index": False},
+    )
+    assert engine.execute("SELECT COUNT(*), SUM(a) FROM t").fetchone() == (
+        2000,
+        1999000,
+    )
+
+
+def test_df_chunks_to_sql(mocker: MockerFixture) -> None:
+    """
+    Test that chunks are written in a single transaction, rolled back on failure.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.sql.parse import Table
+
+    engine = create_engine("sqlite://")
+    mocker.patch.object(SqliteEngineSpec, "get_engine").return_value.__enter__ = (
+        lambda _: engine
+    )
+
+    def chunks(fail: bool):
+        yield pd.DataFrame({"a": [1, 2]})
+        yield pd.DataFrame({"a": [3]})
+        if fail:
+            raise ValueError("bad chunk")
+
+    SqliteEngineSpec.df_chunks_to_sql(
+        mocker.MagicMock(),
+        Table("t"),
+        chunks(fail=False),
+        {"if_exists": "fail", "index": False},
+    )
+    assert engine.execute("SELECT COUNT(*), SUM(a) FROM t").fetchone() == (3, 6)
+
+    with pytest.raises(ValueError):
+        SqliteEngineSpec.df_chunks_to_sql(
+            mocker.MagicMock(),
+            Table("t"),
+            chunks(fail=True),
+            {"if_exists": "append", "index": False},
+        )
+    assert engine.execute("SELECT COUNT(*), SUM(a) FROM t").fetchone() == (3, 6)
@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from flask import Flask
+from flask_caching import Cache
+from flask_caching.backends import SimpleCache
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.extensions.near_cache import SupersetNearCache
+from superset.utils.cache_manager import CacheManager
+
+
+def make_caches() -> tuple[SimpleCache, SupersetNearCache, SupersetNearCache]:
+    """
+    Return a shared cache and two near caches in front of it, as used by two
+    processes.
+    """
+    shared = SimpleCache()
+    return (
+        shared,
+        SupersetNearCache(shared, "first", generation_check_interval=0),
+        SupersetNearCache(shared, "second", generation_check_interval=0),
+    )
+
+
+def test_get_set() -> None:
+    shared, cache, _ = make_caches()
+
+    assert cache.get("foo") is None
+    assert cache.set("foo", {"bar": 1})
+    shared.set("foo", "changed behind the near cache")
+
+    value = cache.get("foo")
+    assert value == {"bar": 1}
+    value["bar"] = 2
+    assert cache.get("foo") == {"bar": 1}
+    assert cache.has("foo")
+    assert cache.stats == {"l1_miss": 1, "l2_miss": 1, "l1_hit": 2}
+
+
+def test_get_many() -> None:
+    shared, cache, _ = make_caches()
+    shared.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.get_many("a", "b", "c") == [1, 2, None]
+    assert cache.get_many("a", "b") == [1, 2]
+    assert cache.stats == {"l1_hit": 3, "l1_miss": 2, "l2_hit": 1, "l2_miss": 1}
+
+
+def test_writes_invalidate_other_processes() -> None:
+    _, first, second = make_caches()
+
+    first.set("foo", "bar")
+    assert second.get("foo") == "bar"
+
+    first.set("foo", "baz")
+    assert second.get("foo") == "baz"
+
+    first.delete("foo")
+    assert second.get("foo") is None
+
+
+def test_writes_only_invalidate_their_bucket(mocker: MockerFixture) -> None:
+    shared, first, second = make_caches()
+    keys = [f"key{i}" for i in range(100)]
+    other = next(key for key in keys if first._bucket(key) != first._bucket("foo"))
+
+    first.set("foo", "bar")
+    first.set(other, "value")
+    assert second.get_many("foo", other) == ["bar", "value"]
+
+    # the value and the generation of its bucket are written in a single call
+    set_many = mocker.spy(shared, "set_many")
+    inc = mocker.spy(shared, "inc")
+    first.set("foo", "baz")
+    set_many.assert_called_once()
+    inc.assert_not_called()
+
+    second.stats.clear()
+    assert second.get_many("foo", other) == ["baz", "value"]
+    assert second.stats == {"l1_hit": 1, "l1_miss": 1, "l2_hit": 1}
+
+
+def test_generation_check_interval() -> None:
+    shared = SimpleCache()
+    first = SupersetNearCache(shared, "first")
+    second = SupersetNearCache(shared, "second", generation_check_interval=10)
+
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        first.set("foo", "bar")
+        assert second.get("foo") == "bar"
+        first.set("foo", "baz")
+        assert second.get("foo") == "bar"
+
+        frozen.tick(11)
+        assert second.get("foo") == "baz"
+
+
+def test_expiry_and_threshold() -> None:
+    shared = SimpleCache()
+    cache = SupersetNearCache(shared, "cache", threshold=2, default_timeout=10)
+
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        cache.set("a", 1)
+        cache.set("b", 2, timeout=5)
+        cache.get("a")
+        cache.set("c", 3)
+
+        # "b" was the least recently used entry
+        shared.set("b", 20)
+        assert cache.get("b") == 20
+
+        shared.set("a", 10)
+        frozen.tick(11)
+        assert cache.get("a") == 10
+
+
+def test_cache_manager_near_cache() -> None:
+    app = Flask(__name__)
+    app.config["CACHE_DEFAULT_TIMEOUT"] = 60
+    app.config["TEST_CACHE_CONFIG"] = {
+        "CACHE_TYPE": "SimpleCache",
+        "NEAR_CACHE_CONFIG": {"CACHE_THRESHOLD": 10, "CACHE_DEFAULT_TIMEOUT": 5},
+    }
+    cache = Cache()
+
+    CacheManager._init_cache(app, cache, "TEST_CACHE_CONFIG")
+
+    with app.app_context():
+        assert isinstance(cache.cache, SupersetNearCache)
+        assert isinstance(cache.cache.cache, SimpleCache)
+        assert cache.cache.name == "test_cache_config"
+        assert cache.cache.threshold == 10
+        assert cache.cache.default_timeout == 5
+
+        cache.set("foo", "bar")
+        assert cache.get("foo") == "bar"
@@ -0,0 +1,81 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import url_for
+from pytest_mock import MockerFixture
+
+from superset.app import SupersetApp
+from superset.initialization import SupersetAppInitializer
+
+
+def test_init_lazy_views(mocker: MockerFixture) -> None:
+    """
+    Test that lazily registered views are registered when the URL of one of them is
+    first built.
+    """
+    app = SupersetApp(__name__)
+    app.config["SERVER_NAME"] = "example.com"
+    initializer = SupersetAppInitializer(app)
+    init_views = mocker.patch.object(
+        initializer,
+        "init_views",
+        side_effect=lambda: app.add_url_rule("/chart/<int:pk>/", "Chart.show"),
+    )
+    app.url_build_error_handlers.append(initializer._init_lazy_views)
+
+    with app.app_context():
+        assert url_for("Chart.show", pk=1) == "http://example.com/chart/1/"
+        assert url_for("Chart.show", pk=2) == "http://example.com/chart/2/"
+
+    init_views.assert_called_once()
+    assert app.url_build_error_handlers == []
+
+
+def test_init_lazy_views_threads(mocker: MockerFixture) -> None:
+    """
+    Test that the views are registered once when several threads build their first
+    URL at the same time.
+    """
+    app = SupersetApp(__name__)
+    app.config["SERVER_NAME"] = "example.com"
+    initializer = SupersetAppInitializer(app)
+    barrier = threading.Barrier(4)
+
+    def init_views() -> None:
+        time.sleep(0.1)
+        app.add_url_rule("/chart/<int:pk>/", "Chart.show")
+
+    init_views_mock = mocker.patch.object(
+        initializer, "init_views", side_effect=init_views
+    )
+    app.url_build_error_handlers.append(initializer._init_lazy_views)
+
+    def build_url(pk: int) -> str:
+        with app.app_context():
+            barrier.wait()
+            return url_for("Chart.show", pk=pk)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        urls = list(executor.map(build_url, range(4)))
+
+    assert urls == [f"http://example.com/chart/{pk}/" for pk in range(4)]
+    init_views_mock.assert_called_once()
+    assert app.url_build_error_handlers == []
@@ -156,6 +156,7 @@ def test_get_db_engine_spec(mocker: MockerFixture) -> None:
         PostgresDBEngineSpec,
         OldDBEngineSpec,
     ]
+    mocker.patch("superset.db_engine_specs._registry", None)
 
     assert (
         Database(database_name="db", sqlalchemy_uri="postgresql://").db_engine_spec
@@ -197,6 +198,31 @@ def test_get_db_engine_spec(mocker: MockerFixture) -> None:
     )
 
 
+def test_db_engine_spec_cached(mocker: MockerFixture) -> None:
+    """
+    Test that the URI of a database is only parsed again when it changes.
+    """
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+
+    make_url_safe = mocker.patch(
+        "superset.models.core.make_url_safe",
+        side_effect=make_url,
+    )
+    database = Database(
+        database_name="db", sqlalchemy_uri="postgresql://localhost/examples"
+    )
+
+    assert database.db_engine_spec == PostgresEngineSpec
+    call_count = make_url_safe.call_count
+    assert database.db_engine_spec == PostgresEngineSpec
+    assert make_url_safe.call_count == call_count
+
+    database.sqlalchemy_uri = "sqlite:////tmp/examples.db"
+    assert database.db_engine_spec == SqliteEngineSpec
+    assert make_url_safe.call_count > call_count
+
+
 @pytest.mark.parametrize(
     "dttm,col,database,result",
     [
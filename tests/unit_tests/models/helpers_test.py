@@ -524,3 +524,112 @@ def test_apply_series_others_grouping_no_label_in_groupby(database: Database) ->
         assert "category" in result_groupby_columns
         # The GROUP BY expression should be different from the SELECT expression
         # because only SELECT gets make_sqla_column_compatible applied
+
+
+def test_memoized_json_loads(mocker: MockerFixture) -> None:
+    """
+    Test that JSON attributes are parsed once until they're set again.
+    """
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+    from superset.utils import json
+
+    loads = mocker.spy(json.simplejson, "loads")
+    chart = Slice(
+        params='{"viz_type": "table", "adhoc_filters": []}',
+        viz_type="table",
+        datasource_id=1,
+        datasource_type="table",
+    )
+
+    form_data = chart.form_data
+    form_data["adhoc_filters"].append({"clause": "WHERE"})
+    assert chart.form_data["adhoc_filters"] == []
+    assert loads.call_count == 1
+
+    chart.params = '{"viz_type": "table", "row_limit": 10}'
+    assert chart.form_data["row_limit"] == 10
+    assert loads.call_count == 2
+
+    dashboard = Dashboard(
+        position_json='{"ROOT_ID": {"type": "ROOT", "id": "ROOT_ID", "children": []}}',
+        json_metadata='{"color_scheme": "d3Category10"}',
+    )
+    assert dashboard.tabs == {"all_tabs": {}, "tab_tree": []}
+    assert dashboard.position["ROOT_ID"]["type"] == "ROOT"
+    assert dashboard.params_dict == {"color_scheme": "d3Category10"}
+    assert dashboard.params_dict == {"color_scheme": "d3Category10"}
+    assert loads.call_count == 4
+
+
+def test_values_for_columns(database: Database) -> None:
+    """
+    Test that `values_for_columns` falls back to one query per column when the
+    database doesn't support grouping sets.
+    """
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    assert table.values_for_columns(["a", "b"]) == {
+        "a": [1, None],
+        "b": ["Alice", "Bob"],
+    }
+
+
+def test_values_for_columns_grouping_sets(mocker: MockerFixture) -> None:
+    """
+    Test that the values of multiple columns are fetched in a single query with
+    grouping sets, limiting the number of values of each column.
+    """
+    import pandas as pd
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+
+    database = Database(
+        database_name="db", sqlalchemy_uri="postgresql://localhost/values"
+    )
+    engine = create_engine("postgresql://localhost/values")
+
+    @contextmanager
+    def mock_get_sqla_engine():
+        yield engine
+
+    mocker.patch.object(database, "get_sqla_engine", new=mock_get_sqla_engine)
+    read_sql_query = mocker.patch(
+        "superset.models.helpers.pd.read_sql_query",
+        return_value=pd.DataFrame(
+            {
+                "column_values_0": [1, 2, None],
+                "column_values_1": [None, None, "Alice"],
+                "grouping_0": [0, 0, 1],
+                "grouping_1": [1, 1, 0],
+            }
+        ),
+    )
+    mocker.patch.object(engine, "connect")
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    assert table.values_for_columns(["a", "b"], limit=100) == {
+        "a": [1, 2],
+        "b": ["Alice"],
+    }
+    assert str(read_sql_query.call_args.kwargs["sql"]) == (
+        "SELECT column_values.column_values_0, column_values.column_values_1, "
+        "column_values.grouping_0, column_values.grouping_1 \n"
+        "FROM (SELECT a AS column_values_0, b AS column_values_1, "
+        "grouping(a) AS grouping_0, grouping(b) AS grouping_1, "
+        "row_number() OVER (PARTITION BY grouping(a), grouping(b)) AS row_number \n"
+        "FROM t GROUP BY GROUPING SETS(a, b)) AS column_values \n"
+        "WHERE column_values.row_number <= 100"
+    )
@@ -14,6 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import geohash as geohash_lib
+import pytest
+from geopy.point import Point
+from pandas import DataFrame
+
+from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing import (
     geodetic_parse,
     geohash_decode,
@@ -88,3 +94,93 @@ def test_geodetic_parse():
         lonlat_df["longitude"]
     )
     assert series_to_list(post_df["latitude"]), series_to_list(lonlat_df["latitude"])
+
+
+def test_geohash_decode_matches_geohash_lib():
+    # mixed lengths and case, including geohashes too long to be vectorized
+    geohashes = ["", "d", "dr5", "DR5REGW3PG6F", "r3gx2u9qdevk", "dr5regw3pg6fdr5r"]
+    post_df = geohash_decode(
+        df=DataFrame({"geohash": geohashes}),
+        geohash="geohash",
+        latitude="latitude",
+        longitude="longitude",
+    )
+    assert list(zip(post_df["latitude"], post_df["longitude"], strict=False)) == [
+        geohash_lib.decode(geohash) for geohash in geohashes
+    ]
+
+    with pytest.raises(InvalidPostProcessingError):
+        geohash_decode(
+            df=DataFrame({"geohash": ["dr5", "dra"]}),
+            geohash="geohash",
+            latitude="latitude",
+            longitude="longitude",
+        )
+
+
+def test_geohash_encode_matches_geohash_lib():
+    df = DataFrame(
+        {
+            "latitude": [-90.0, -0.0, 45.5, 89.999999],
+            "longitude": [-180.0, 180.0, -900.5, 541.25],
+        }
+    )
+    post_df = geohash_encode(
+        df=df, latitude="latitude", longitude="longitude", geohash="geohash"
+    )
+    assert series_to_list(post_df["geohash"]) == [
+        geohash_lib.encode(lat, lon)
+        for lat, lon in zip(df["latitude"], df["longitude"], strict=False)
+    ]
+
+    for lat, lon in ((90.0, 0.0), (float("nan"), 0.0), (0.0, float("inf"))):
+        with pytest.raises(InvalidPostProcessingError):
+            geohash_encode(
+                df=DataFrame({"latitude": [lat], "longitude": [lon]}),
+                latitude="latitude",
+                longitude="longitude",
+                geohash="geohash",
+            )
+
+
+@pytest.mark.parametrize(
+    "geodetic",
+    [
+        "41.5,-81.0",
+        "41.5;-81.0",
+        "41.5 -81.0",
+        " -0 , 190.5 ",
+        "41.5/-81.0; 712m",
+        "41.5, -81.0, 3 ft",
+        "41.5, -81.0, 1.5nmi",
+        "41.5 -81.0 5m",
+        "41.5 N -81.0 W",
+        "23 26m 22s N 23 27m 30s E",
+        "UT: N 39°20' 0'' / W 74°35' 0''",
+    ],
+)
+def test_geodetic_parse_matches_geopy(geodetic: str):
+    post_df = geodetic_parse(
+        df=DataFrame({"geodetic": [geodetic]}),
+        geodetic="geodetic",
+        latitude="latitude",
+        longitude="longitude",
+        altitude="altitude",
+    )
+    point = Point(geodetic)
+    assert post_df[["latitude", "longitude", "altitude"]].iloc[0].tolist() == [
+        point[0],
+        point[1],
+        point[2],
+    ]
+
+
+@pytest.mark.parametrize("geodetic", ["91, 0", "-90.5, 0", "foo"])
+def test_geodetic_parse_invalid(geodetic: str):
+    with pytest.raises(InvalidPostProcessingError):
+        geodetic_parse(
+            df=DataFrame({"geodetic": ["40.7, -74.0", geodetic]}),
+            geodetic="geodetic",
+            latitude="latitude",
+            longitude="longitude",
+        )
@@ -0,0 +1,85 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pytest
+
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import pandas_postprocessing as pp
+from superset.utils.pandas_postprocessing.pipeline import PostProcessingPipeline
+from tests.unit_tests.fixtures.dataframes import multiple_metrics_df
+
+POST_PROCESSING = [
+    {
+        "operation": "pivot",
+        "options": {
+            "index": ["dttm"],
+            "columns": ["country"],
+            "aggregates": {"sum_metric": {"operator": "mean"}},
+        },
+    },
+    {
+        "operation": "cum",
+        "options": {"operator": "sum", "columns": {"sum_metric": "sum_metric"}},
+    },
+    {"operation": "rename", "options": {"columns": {"sum_metric": None}, "level": 0}},
+    {"operation": "sort", "options": {"is_sort_index": True, "ascending": False}},
+    {"operation": "flatten"},
+]
+
+
+def test_pipeline():
+    df = multiple_metrics_df.copy()
+    pipeline = PostProcessingPipeline(POST_PROCESSING)
+    post_df = pipeline(df)
+
+    expected_df = df
+    for post_process in POST_PROCESSING:
+        expected_df = getattr(pp, post_process["operation"])(
+            expected_df, **post_process.get("options", {})
+        )
+    assert post_df.equals(expected_df)
+    assert post_df.columns.tolist() == ["dttm", "UK", "US"]
+    assert df.equals(multiple_metrics_df)
+    assert [operation for operation, _ in pipeline.durations] == [
+        post_process["operation"] for post_process in POST_PROCESSING
+    ]
+
+
+def test_pipeline_rename_first_step_is_not_inplace():
+    df = multiple_metrics_df.copy()
+    post_df = PostProcessingPipeline(
+        [{"operation": "rename", "options": {"columns": {"country": "region"}}}]
+    )(df)
+    assert "region" in post_df.columns
+    assert df.equals(multiple_metrics_df)
+
+
+@pytest.mark.parametrize(
+    "post_processing",
+    [
+        [{"options": {}}],
+        [{"operation": "foo"}],
+        [{"operation": "pipeline"}],
+        [{"operation": "escape_separator"}],
+        [{"operation": "sort", "options": {"foo": "bar"}}],
+        [{"operation": "rolling"}],
+    ],
+)
+def test_pipeline_invalid(post_processing):
+    with pytest.raises(InvalidPostProcessingError):
+        PostProcessingPipeline(
+            [{"operation": "flatten"}, *post_processing],
+        )
@@ -14,17 +14,25 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from importlib import import_module
 from importlib.util import find_spec
 
 import pandas as pd
 import pytest
+from flask import current_app
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.core import DTTM_ALIAS
 from superset.utils.pandas_postprocessing import prophet
 from tests.unit_tests.fixtures.dataframes import prophet_df
 
+# the `prophet` function shadows its module in `superset.utils.pandas_postprocessing`
+prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+
 
 def test_prophet_valid():
     df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
@@ -184,3 +192,48 @@ def test_prophet_incorrect_time_grain():
             periods=10,
             confidence_interval=0.8,
         )
+
+
+def test_prophet_cached_models(mocker: MockerFixture):
+    mocker.patch.dict(current_app.config, {"PROPHET_MAX_WORKERS": 1})
+    cache_manager = mocker.patch.object(prophet_module, "cache_manager")
+    cache_manager.data_cache = SimpleCache()
+    fit = mocker.spy(pytest.importorskip("prophet").Prophet, "fit")
+
+    df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    assert fit.call_count == 2
+
+    # same data and options: only predict using the cached models
+    cached_df = prophet(
+        df=prophet_df, time_grain="P1M", periods=5, confidence_interval=0.9
+    )
+    assert fit.call_count == 2
+    assert cached_df["a__yhat"].iloc[:7].tolist() == df["a__yhat"].tolist()
+
+    # different options: fit new models
+    prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.8)
+    assert fit.call_count == 4
+
+
+def test_prophet_process_pool(mocker: MockerFixture):
+    mocker.patch.dict(current_app.config, {"PROPHET_MAX_WORKERS": 1})
+    df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+
+    mocker.patch.dict(current_app.config, {"PROPHET_MAX_WORKERS": 2})
+    mocker.patch("os.cpu_count", return_value=2)
+    mocker.patch.object(prophet_module, "_executor", None)
+    pool = mocker.patch.object(
+        prophet_module, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+    )
+    pooled_df = prophet(
+        df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+    )
+    # the pool is created once, with spawned processes, and shared by forecasts
+    prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    pool.assert_called_once()
+    assert pool.call_args.kwargs["max_workers"] == 2
+    assert pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+    prophet_module._executor.shutdown()
+
+    assert pooled_df.columns.tolist() == df.columns.tolist()
+    assert pooled_df["b__yhat"].tolist() == pytest.approx(df["b__yhat"].tolist())
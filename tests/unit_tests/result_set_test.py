@@ -26,6 +26,7 @@ from pytest_mock import MockerFixture
 
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.result_set import stringify_values, SupersetResultSet
+from superset.utils.core import GenericDataType
 
 
 def test_column_names_as_bytes() -> None:
@@ -164,3 +165,58 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_arrow_table() -> None:
+    """
+    Test building a result set from results fetched as Arrow.
+    """
+    import pyarrow as pa
+
+    table = pa.table(
+        {
+            "a": pa.array(["x", "y", None]).dictionary_encode(),
+            "b": [[1, 2], None, [3]],
+            "c": [1, 2, None],
+        }
+    )
+    description = [
+        ("a", "string", None, None, None, None, False),
+        ("a", "array", None, None, None, None, False),
+        ("c", "int", None, None, None, None, False),
+    ]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.size == 3
+    assert result_set.table.column_names == ["a", "a__1", "c"]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "a": ["x", "y", None],
+        "a__1": ["[1, 2]", None, "[3]"],
+        "c": [1, 2, None],
+    }
+    assert [column["type"] for column in result_set.columns] == [
+        "STRING",
+        "ARRAY",
+        "INT",
+    ]
+
+
+def test_arrow_table_without_description() -> None:
+    """
+    Test that the column names of the Arrow table are used without a description.
+    """
+    import pyarrow as pa
+
+    table = pa.table({"a": pa.array([], type=pa.int64())})
+    result_set = SupersetResultSet(table, None, BaseEngineSpec)  # type: ignore
+
+    assert result_set.size == 0
+    assert result_set.columns == [
+        {
+            "column_name": "a",
+            "name": "a",
+            "type": "INT",
+            "type_generic": GenericDataType.NUMERIC,
+            "is_dttm": False,
+        }
+    ]
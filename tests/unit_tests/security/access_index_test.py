@@ -0,0 +1,235 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name, unused-argument
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from flask_appbuilder.models.sqla.interface import SQLAInterface
+from flask_appbuilder.security.sqla.models import (
+    Permission,
+    PermissionView,
+    Role,
+    ViewMenu,
+)
+from flask import current_app
+from flask_caching import BaseCache
+from flask_caching.backends import NullCache, RedisCache, SimpleCache
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.connectors.sqla.models import Database, SqlaTable
+from superset.extensions.near_cache import SupersetNearCache
+from superset.models.slice import Slice
+from superset.security import access_index
+from superset.views.chart.filters import SliceFilter
+from tests.unit_tests.conftest import with_feature_flags
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture) -> SimpleCache:
+    cache_manager = mocker.patch.object(access_index, "cache_manager")
+    cache_manager.cache = SimpleCache()
+    return cache_manager.cache
+
+
+@pytest.fixture
+def listeners(app_context: None) -> Iterator[None]:
+    access_index.register_sqla_event_listeners()
+    yield
+    access_index.clear_sqla_event_listeners()
+
+
+@pytest.fixture
+def datasets(session: Session) -> list[SqlaTable]:
+    SqlaTable.metadata.create_all(session.get_bind())
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    datasets = [
+        SqlaTable(table_name="a", database=database),
+        SqlaTable(table_name="b", database=database),
+    ]
+    session.add_all(datasets)
+    session.commit()
+    return datasets
+
+
+def mock_permissions(
+    mocker: MockerFixture, roles: list[Role], table_names: set[str]
+) -> MagicMock:
+    mocker.patch(
+        "superset.security_manager.get_user_roles",
+        return_value=roles,
+    )
+    return mocker.patch(
+        "superset.utils.filters.get_dataset_access_filters",
+        side_effect=lambda base_model: SqlaTable.table_name.in_(table_names),
+    )
+
+
+def test_get_accessible_dataset_ids(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    datasets: list[SqlaTable],
+) -> None:
+    """
+    Test that the accessible datasets are computed once per set of roles.
+    """
+    filters = mock_permissions(mocker, [Role(id=1)], {"a"})
+
+    assert access_index.get_accessible_dataset_ids() == {datasets[0].id}
+    assert access_index.get_accessible_dataset_ids() == {datasets[0].id}
+    assert filters.call_count == 1
+
+    mock_permissions(mocker, [Role(id=2), Role(id=1)], {"b"})
+    assert access_index.get_accessible_dataset_ids() == {datasets[1].id}
+
+    access_index.invalidate_dataset_access_index()
+    filters = mock_permissions(mocker, [Role(id=1)], {"b"})
+    assert access_index.get_accessible_dataset_ids() == {datasets[1].id}
+    assert filters.call_count == 1
+
+
+def test_get_accessible_dataset_ids_too_many(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    datasets: list[SqlaTable],
+) -> None:
+    """
+    Test that the index isn't used when there are too many ids to filter on.
+    """
+    mock_permissions(mocker, [Role(id=1)], {"a", "b"})
+    mocker.patch.dict(current_app.config, {"DATASET_ACCESS_INDEX_MAX_IDS": 1})
+
+    assert access_index.get_accessible_dataset_ids() is None
+    assert access_index.get_accessible_dataset_ids() is None
+
+
+@pytest.mark.parametrize(
+    "backend,shared",
+    [
+        (SimpleCache(), False),
+        (NullCache(), False),
+        (SupersetNearCache(SimpleCache(), "cache"), False),
+        (RedisCache(), True),
+        (SupersetNearCache(RedisCache(), "cache"), True),
+    ],
+)
+def test_is_cache_shared(
+    mocker: MockerFixture,
+    backend: BaseCache,
+    shared: bool,
+) -> None:
+    """
+    Test that the index is only used with a cache shared by processes.
+    """
+    cache_manager = mocker.patch.object(access_index, "cache_manager")
+    cache_manager.cache.cache = backend
+
+    assert access_index.is_cache_shared() is shared
+
+
+def test_dataset_change_invalidates_index(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    listeners: None,
+    session: Session,
+    datasets: list[SqlaTable],
+) -> None:
+    """
+    Test that the index is invalidated once changes to the permissions of datasets
+    are committed.
+    """
+    version = access_index._get_version()
+
+    datasets[0].description = "A dataset"
+    session.commit()
+    assert access_index._get_version() == version
+
+    datasets[0].table_name = "c"
+    session.flush()
+    assert access_index._get_version() == version
+    session.commit()
+    assert access_index._get_version() != version
+
+    version = access_index._get_version()
+    session.delete(datasets[1])
+    session.commit()
+    assert access_index._get_version() != version
+
+
+def test_role_change_invalidates_index(
+    cache: SimpleCache,
+    listeners: None,
+    session: Session,
+) -> None:
+    """
+    Test that the index is invalidated once changes to the permissions of roles are
+    committed.
+    """
+    Role.metadata.create_all(session.get_bind())
+    role = Role(name="Viewer")
+    session.add(role)
+    session.commit()
+    version = access_index._get_version()
+
+    role.permissions.append(
+        PermissionView(
+            permission=Permission(name="datasource_access"),
+            view_menu=ViewMenu(name="[my_database].[a]"),
+        )
+    )
+    session.commit()
+    assert access_index._get_version() != version
+
+    version = access_index._get_version()
+    role.permissions = []
+    session.commit()
+    assert access_index._get_version() != version
+
+
+@with_feature_flags(DATASET_ACCESS_INDEX=True)
+def test_slice_filter_uses_index(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    session: Session,
+    datasets: list[SqlaTable],
+) -> None:
+    """
+    Test that listing charts filters them by the datasets in the index.
+    """
+    mock_permissions(mocker, [Role(id=1)], {"b"})
+    mocker.patch(
+        "superset.security_manager.can_access_all_datasources",
+        return_value=False,
+    )
+    mocker.patch("superset.security_manager.is_guest_user", return_value=False)
+    mocker.patch.object(access_index, "is_cache_shared", return_value=True)
+    session.add_all(
+        [
+            Slice(
+                slice_name="a", datasource_type="table", datasource_id=datasets[0].id
+            ),
+            Slice(
+                slice_name="b", datasource_type="table", datasource_id=datasets[1].id
+            ),
+        ]
+    )
+    session.commit()
+
+    query = SliceFilter("id", SQLAInterface(Slice)).apply(session.query(Slice), None)
+    assert [chart.slice_name for chart in query] == ["b"]
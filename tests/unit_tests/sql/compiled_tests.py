@@ -0,0 +1,126 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from pytest_mock import MockerFixture
+from sqlalchemy.dialects import mssql, mysql, oracle, postgresql, sqlite
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql import Select
+
+from superset.sql.compiled import CompiledQueryCache, CompiledQueryTemplate
+
+table = sa.table(
+    "t",
+    sa.column("a", sa.Integer),
+    sa.column("b", sa.String),
+)
+
+
+def make_query(value: int, values: list[Any], pattern: str, limit: int) -> Select:
+    return (
+        sa.select(table.c.a, sa.func.count().label("count"))
+        .where(table.c.a == value)
+        .where(sa.or_(table.c.b.in_(values), table.c.b.is_(None)))
+        .where(table.c.b.like(pattern))
+        .where(sa.text("b != 'x'"))
+        .group_by(table.c.a)
+        .order_by(table.c.a)
+        .limit(limit)
+    )
+
+
+@pytest.mark.parametrize(
+    "dialect",
+    [
+        sqlite.dialect(),
+        postgresql.dialect(),
+        mysql.dialect(),
+        mssql.dialect(),
+        oracle.dialect(),
+    ],
+)
+def test_compiled_query_cache(mocker: MockerFixture, dialect: Dialect) -> None:
+    """
+    Test that queries which only differ in their values render the same SQL from the
+    template of the first one.
+    """
+    cache = CompiledQueryCache(max_size=10)
+    compile_ = mocker.spy(Select, "compile")
+
+    for args in [
+        (1, ["x", "y"], "%a%", 10),
+        (2, ["it's"], "b%", 20),
+        (3, [], "c", 30),
+    ]:
+        query = make_query(*args)
+        expected = str(
+            make_query(*args).compile(
+                dialect=dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        assert cache.compile(query, dialect, scope=dialect.name) == expected
+
+    # only the queries of dialects which can't be compiled into templates, like
+    # Oracle's ROWNUM based limit, are compiled again
+    assert compile_.call_count == 3 + (3 if dialect.name == "oracle" else 0)
+    assert len(cache._templates) == 1
+
+
+def test_compiled_query_cache_size() -> None:
+    """
+    Test that the least recently used templates are evicted.
+    """
+    cache = CompiledQueryCache(max_size=2)
+    dialect = sqlite.dialect()
+
+    cache.compile(sa.select(table.c.a), dialect, scope=1)
+    cache.compile(sa.select(table.c.b), dialect, scope=1)
+    cache.compile(sa.select(table.c.a), dialect, scope=2)
+    assert [key[0] for key in cache._templates] == [1, 2]
+
+
+def test_compiled_query_cache_timestamp_expression(mocker: MockerFixture) -> None:
+    """
+    Test that queries with a time grain are cached, keyed on their target column.
+    """
+    from superset.db_engine_specs.base import TimestampExpression
+
+    cache = CompiledQueryCache(max_size=10)
+    dialect = sqlite.dialect()
+    create = mocker.spy(CompiledQueryTemplate, "create")
+
+    def make_time_grain_query(col: sa.sql.ColumnClause, value: int) -> Select:
+        expression = TimestampExpression("DATETIME({col}, 'start of day')", col)
+        return sa.select(expression.label("__timestamp")).where(table.c.a == value)
+
+    assert make_time_grain_query(table.c.a, 1)._generate_cache_key() is not None
+
+    sql_a = cache.compile(make_time_grain_query(table.c.a, 1), dialect, scope=1)
+    sql_b = cache.compile(make_time_grain_query(table.c.b, 1), dialect, scope=1)
+    assert sql_a != sql_b
+    assert "DATETIME(t.a, 'start of day')" in sql_a
+    assert "DATETIME(t.b, 'start of day')" in sql_b
+    assert create.call_count == 2
+
+    sql = cache.compile(make_time_grain_query(table.c.a, 2), dialect, scope=1)
+    assert sql == sql_a.replace("t.a = 1", "t.a = 2")
+    assert create.call_count == 2
+    assert len(cache._templates) == 2
@@ -0,0 +1,45 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import timedelta
+
+from pytest_mock import MockerFixture
+
+
+def test_refresh_catalog_index(mocker: MockerFixture) -> None:
+    """
+    Test that a failing database doesn't prevent indexing the others.
+    """
+    from superset.tasks.databases import refresh_catalog_index
+
+    databases = [mocker.MagicMock(id=1), mocker.MagicMock(id=2)]
+    db = mocker.patch("superset.tasks.databases.db")
+    db.session.query.return_value.filter.return_value.all.return_value = databases
+    refresh = mocker.patch(
+        "superset.databases.catalog_index.refresh_catalog_index",
+        side_effect=[Exception("boom"), None],
+    )
+
+    refresh_catalog_index(max_age_seconds=60)
+
+    refresh.assert_has_calls(
+        [
+            mocker.call(databases[0], max_age=timedelta(seconds=60)),
+            mocker.call(databases[1], max_age=timedelta(seconds=60)),
+        ]
+    )
+    db.session.rollback.assert_called_once()
+    db.session.commit.assert_called_once()
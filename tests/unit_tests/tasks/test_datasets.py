@@ -0,0 +1,47 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pytest_mock import MockerFixture
+
+
+def test_sync_metadata(mocker: MockerFixture) -> None:
+    """
+    Test that datasets are synced and committed one by one, and failures don't
+    stop the sync of the remaining datasets.
+    """
+    from superset.tasks.datasets import sync_metadata
+
+    ok_dataset = mocker.MagicMock()
+    failing_dataset = mocker.MagicMock()
+    failing_dataset.fetch_metadata.side_effect = Exception("boom")
+    db = mocker.patch("superset.tasks.datasets.db")
+    db.session.query.return_value.filter_by.return_value.one_or_none.side_effect = [
+        ok_dataset,
+        None,
+        failing_dataset,
+    ]
+    update_state = mocker.patch.object(sync_metadata, "update_state")
+
+    assert sync_metadata([1, 2, 3]) == {"synced": [1], "failed": [2, 3]}
+
+    ok_dataset.fetch_metadata.assert_called_once()
+    db.session.commit.assert_called_once()
+    db.session.rollback.assert_called_once()
+    assert [call.kwargs["meta"] for call in update_state.call_args_list] == [
+        {"current": 0, "total": 3},
+        {"current": 1, "total": 3},
+        {"current": 2, "total": 3},
+    ]
@@ -422,3 +422,92 @@ def test_chart_digest(
         )
         with cm:
             assert get_chart_digest(chart=chart) == expected_result
+
+
+def test_chart_digests_share_lookups(app_context: None) -> None:
+    """
+    Test that the digests of the charts of a list page look up the executor, the
+    datasource and its RLS filters only once.
+    """
+    from superset import security_manager
+    from superset.models.slice import Slice
+    from superset.thumbnails.digest import get_chart_digest
+
+    get_sqla_row_level_filters = MagicMock(return_value=["a = 1"])
+    datasource = prepare_datasource_mock(
+        {
+            "is_rls_supported": True,
+            "get_sqla_row_level_filters": get_sqla_row_level_filters,
+        },
+        SqlaTable,
+    )
+    charts = [
+        Slice(
+            id=id_, params=f'{{"id": {id_}}}', datasource_id=1, datasource_type="table"
+        )
+        for id_ in range(10)
+    ]
+    user = User(id=1, username="1")
+
+    with (
+        patch.dict(
+            current_app.config,
+            {
+                "THUMBNAIL_EXECUTORS": [ExecutorType.CURRENT_USER],
+                "THUMBNAIL_CHART_DIGEST_FUNC": None,
+            },
+        ),
+        patch.object(
+            Slice, "datasource", new_callable=PropertyMock, return_value=datasource
+        ) as chart_datasource,
+        patch.object(security_manager, "find_user", return_value=user) as find_user,
+        override_user(user),
+    ):
+        digests = {get_chart_digest(chart=chart) for chart in charts}
+
+    assert len(digests) == 10
+    assert chart_datasource.call_count == 1
+    assert find_user.call_count == 1
+    assert get_sqla_row_level_filters.call_count == 1
+
+
+def test_chart_data_digest(app_context: None) -> None:
+    """
+    Test that the data digest of a chart changes along with its query results.
+    """
+    import pandas as pd
+
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+    from superset.thumbnails.digest import (
+        get_chart_data_digest,
+        get_dashboard_data_digest,
+    )
+    from superset.utils.core import QueryStatus
+
+    query_context = MagicMock(queries=[MagicMock()])
+    query_context.get_df_payload.return_value = {
+        "status": QueryStatus.SUCCESS,
+        "df": pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+    }
+    chart = Slice(id=1)
+    dashboard = Dashboard(id=1, slices=[chart])
+
+    with patch.object(Slice, "get_query_context", return_value=query_context):
+        digest = get_chart_data_digest(chart)
+        dashboard_digest = get_dashboard_data_digest(dashboard)
+        assert digest is not None
+        assert get_chart_data_digest(chart) == digest
+
+        query_context.get_df_payload.return_value["df"] = pd.DataFrame(
+            {"a": [1, 3], "b": ["x", "y"]}
+        )
+        assert get_chart_data_digest(chart) != digest
+        assert get_dashboard_data_digest(dashboard) != dashboard_digest
+
+        query_context.get_df_payload.return_value["status"] = QueryStatus.FAILED
+        assert get_chart_data_digest(chart) is None
+        assert get_dashboard_data_digest(dashboard) is None
+
+    with patch.object(Slice, "get_query_context", return_value=None):
+        assert get_chart_data_digest(chart) is None
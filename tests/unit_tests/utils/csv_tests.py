@@ -95,3 +95,29 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_column_types():
+    """
+    Test that only the strings of columns are escaped, whatever the index and the
+    type of the other values of their columns.
+    """
+    df = pd.DataFrame(
+        data={
+            "mixed": ["=a", 1, None, "-1", "|b"],
+            "string": pd.array(["=a", "b", None, "-c", "d"], dtype="string"),
+            "numeric": [-1, 2, 3, 4, 5],
+        },
+        index=[5, 4, 3, 2, 1],
+    )
+
+    assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == (
+        "mixed,string,numeric\n"
+        "'=a,'=a,-1\n"
+        "1,b,2\n"
+        ",,3\n"
+        "-1,'-c,4\n"
+        "'\\\\|b,d,5\n"
+    )
+    # the dataframe is left untouched
+    assert df["mixed"].tolist() == ["=a", 1, None, "-1", "|b"]
@@ -21,7 +21,7 @@ import pandas as pd
 from pandas.api.types import is_numeric_dtype
 
 from superset.utils.core import GenericDataType
-from superset.utils.excel import apply_column_types, df_to_excel
+from superset.utils.excel import apply_column_types, df_to_excel, quote_formulas
 
 
 def test_timezone_conversion() -> None:
@@ -47,6 +47,24 @@ def test_quote_formulas() -> None:
     ]
 
 
+def test_quote_formulas_column_types() -> None:
+    """
+    Test that formulas are quoted in columns of strings and of mixed types.
+    """
+    df = pd.DataFrame(
+        {
+            "mixed": ["=SUM(A1:A2)", 1, None],
+            "string": pd.array(["+1", "normal", None], dtype="string"),
+            "numeric": [-1, 2, 3],
+        }
+    )
+    assert quote_formulas(df).to_dict(orient="list") == {
+        "mixed": ["'=SUM(A1:A2)", 1, None],
+        "string": ["'+1", "normal", None],
+        "numeric": [-1, 2, 3],
+    }
+
+
 def test_column_data_types_with_one_numeric_column():
     df = pd.DataFrame(
         {
@@ -15,8 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from datetime import datetime
+from typing import Any
 
-from superset.utils.log import get_logger_from_status
+from flask import Flask
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.utils.log import (
+    BufferedDBEventLogger,
+    DBEventLogger,
+    get_logger_from_status,
+)
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +46,154 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_db_event_logger_rows() -> None:
+    rows = DBEventLogger.get_log_rows(
+        1,
+        "action",
+        None,
+        10,
+        None,
+        "referrer",
+        [{"dashboard_id": 2, "slice_id": 3}, {"path": object()}],
+    )
+
+    assert rows == [
+        {
+            "action": "action",
+            "json": '{"dashboard_id": 2, "slice_id": 3}',
+            "dashboard_id": 2,
+            "slice_id": 3,
+            "duration_ms": 10,
+            "referrer": "referrer",
+            "user_id": 1,
+            "dttm": datetime(2024, 1, 1),
+        },
+        {
+            "action": "action",
+            "json": None,
+            "dashboard_id": None,
+            "slice_id": None,
+            "duration_ms": 10,
+            "referrer": "referrer",
+            "user_id": 1,
+            "dttm": datetime(2024, 1, 1),
+        },
+    ]
+
+
+def log_records(event_logger: BufferedDBEventLogger, count: int) -> None:
+    records: list[dict[str, Any]] = [{"i": i} for i in range(count)]
+    event_logger.log(1, "action", None, None, None, None, records=records)
+
+
+def test_buffered_db_event_logger(mocker: MockerFixture, app: Flask) -> None:
+    save_logs = mocker.patch.object(
+        BufferedDBEventLogger,
+        "save_logs",
+        return_value=True,
+    )
+    event_logger = BufferedDBEventLogger(batch_size=2, flush_interval=3600)
+
+    with app.app_context():
+        log_records(event_logger, 1)
+    save_logs.assert_not_called()
+
+    event_logger.flush()
+    event_logger.flush()
+    save_logs.assert_called_once()
+    assert len(save_logs.call_args[0][0]) == 1
+
+    save_logs.reset_mock()
+    with app.app_context():
+        log_records(event_logger, 3)
+    event_logger.shutdown()
+
+    # the background thread may flush the first batch
+    assert sorted(len(call[0][0]) for call in save_logs.call_args_list) == [1, 2]
+    assert event_logger.dropped == event_logger.failed == 0
+
+
+def test_buffered_db_event_logger_dropped(mocker: MockerFixture, app: Flask) -> None:
+    save_logs = mocker.patch.object(
+        BufferedDBEventLogger,
+        "save_logs",
+        return_value=False,
+    )
+    incr = mocker.patch("superset.utils.log.stats_logger_manager.instance.incr")
+    event_logger = BufferedDBEventLogger(
+        batch_size=10,
+        flush_interval=3600,
+        max_buffer_size=3,
+    )
+    event_logger._stopped.set()  # pylint: disable=protected-access
+
+    with app.app_context():
+        log_records(event_logger, 2)
+        log_records(event_logger, 4)
+    event_logger.shutdown()
+
+    assert event_logger.dropped == 3
+    incr.assert_called_once_with("event_logger.dropped")
+    save_logs.assert_called_once()
+    assert len(save_logs.call_args[0][0]) == 3
+    assert event_logger.failed == 3
+
+
+def test_buffered_db_event_logger_hooks(mocker: MockerFixture) -> None:
+    """
+    Test that the fork and exit hooks are registered once for all instances.
+    """
+    mocker.patch.object(BufferedDBEventLogger, "_hooks_registered", False)
+    register_at_fork = mocker.patch("superset.utils.log.os.register_at_fork")
+    atexit_register = mocker.patch("superset.utils.log.atexit.register")
+    shutdown = mocker.patch.object(BufferedDBEventLogger, "shutdown")
+
+    event_loggers = [BufferedDBEventLogger(), BufferedDBEventLogger()]
+
+    register_at_fork.assert_called_once()
+    atexit_register.assert_called_once()
+    atexit_register.call_args[0][0]()
+    assert shutdown.call_count >= len(event_loggers)
+
+
+def test_buffered_db_event_logger_failed(mocker: MockerFixture, app: Flask) -> None:
+    """
+    Test that an unexpected error saving a batch doesn't stop the following ones.
+    """
+    save_logs = mocker.patch.object(
+        BufferedDBEventLogger,
+        "save_logs",
+        side_effect=[TypeError("bad row"), True],
+    )
+    event_logger = BufferedDBEventLogger(batch_size=2, flush_interval=3600)
+    event_logger._stopped.set()  # pylint: disable=protected-access
+
+    with app.app_context():
+        log_records(event_logger, 3)
+    event_logger.flush()
+
+    assert save_logs.call_count == 2
+    assert event_logger.failed == 2
+
+
+def test_buffered_db_event_logger_dttm(app: Flask, session: Session) -> None:
+    """
+    Test that buffered logs are stored with the time of the event, not of the flush.
+    """
+    from superset.models.core import Log
+
+    Log.metadata.create_all(session.get_bind())
+    event_logger = BufferedDBEventLogger(flush_interval=3600)
+    event_logger._stopped.set()  # pylint: disable=protected-access
+
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        with app.app_context():
+            log_records(event_logger, 2)
+        frozen.tick(60)
+        event_logger.flush()
+
+    assert [log.dttm for log in session.query(Log)] == [datetime(2024, 1, 1)] * 2
+    assert event_logger.failed == 0
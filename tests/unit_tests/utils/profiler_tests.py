@@ -0,0 +1,67 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from superset.utils.profiler import StartupProfiler
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Iterator[str]:
+    root = tmp_path / "startup_package"
+    root.mkdir()
+    (root / "__init__.py").write_text("from . import first\n")
+    (root / "first.py").write_text(
+        "import time\ntime.sleep(0.02)\nfrom . import second\n"
+    )
+    (root / "second.py").write_text("import time\ntime.sleep(0.05)\n")
+
+    sys.path.insert(0, str(tmp_path))
+    yield "startup_package"
+    sys.path.remove(str(tmp_path))
+    for name in list(sys.modules):
+        if name.startswith("startup_package"):
+            del sys.modules[name]
+
+
+def test_startup_profiler(package: str) -> None:
+    """
+    Test that the steps and the imported modules are timed, excluding the time spent
+    importing other modules from the time of a module.
+    """
+    profiler = StartupProfiler()
+    with profiler:
+        with profiler.step("import_package"):
+            __import__(package)
+
+    assert [name for name, _ in profiler.steps] == ["import_package"]
+    assert profiler.steps[0][1] >= 0.07
+    assert 0.02 <= profiler.imports["startup_package.first"] < 0.05
+    assert profiler.imports["startup_package.second"] >= 0.05
+    assert profiler.imports["startup_package"] < 0.02
+    assert profiler._finder not in sys.meta_path
+
+    report = profiler.report(limit=1).splitlines()
+    assert report[0] == "Startup profile:"
+    assert report[1].endswith("ms  import_package")
+    assert report[2].endswith("ms  importing 3 modules, slowest:")
+    assert report[3].endswith("ms  startup_package.second")
+    assert len(report) == 4
@@ -17,9 +17,12 @@
 
 # pylint: disable=import-outside-toplevel, unused-argument
 
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
+from flask import current_app
+from flask_caching.backends import SimpleCache
 from pytest_mock import MockerFixture
 
 from superset.utils.hashing import md5_sha_from_dict
@@ -27,6 +30,7 @@ from superset.utils.screenshots import (
     BaseScreenshot,
     ScreenshotCachePayload,
     ScreenshotCachePayloadType,
+    StatusValues,
 )
 
 BASE_SCREENSHOT_PATH = "superset.utils.screenshots.BaseScreenshot"
@@ -46,6 +50,13 @@ class MockCache:
         """Get the cached value."""
         return self._cache
 
+    def add(self, _key, _value, timeout=None):
+        """Add a value to the cache, as if the key didn't exist."""
+        return True
+
+    def delete(self, _key):
+        """Delete a value from the cache."""
+
 
 @pytest.fixture
 def mock_user():
@@ -192,3 +203,89 @@ class TestComputeAndCache:
             force=False, window_size=(1, 1), thumb_size=thumb_size
         )
         resize_image.assert_called_once()
+
+
+class TestComputeLease:
+    @pytest.fixture
+    def stats_logger(self, mocker: MockerFixture) -> MagicMock:
+        stats_logger = MagicMock()
+        mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+        mocker.patch.object(BaseScreenshot, "cache", SimpleCache())
+        mocker.patch(BASE_SCREENSHOT_PATH + ".resize_image", return_value=b"image")
+        return stats_logger
+
+    def test_concurrent_compute_is_suppressed(
+        self, mocker: MockerFixture, screenshot_obj, stats_logger
+    ):
+        other_screenshot = BaseScreenshot(screenshot_obj.url, screenshot_obj.digest)
+
+        def get_screenshot(**kwargs):
+            # another worker is asked for the thumbnail while it's being computed
+            other_screenshot.compute_and_cache(force=False)
+            return b"image"
+
+        get_screenshot = mocker.patch(
+            BASE_SCREENSHOT_PATH + ".get_screenshot", side_effect=get_screenshot
+        )
+        screenshot_obj.compute_and_cache(force=False)
+
+        get_screenshot.assert_called_once()
+        stats_logger.incr.assert_any_call("screenshot.lease.acquired")
+        stats_logger.incr.assert_any_call("screenshot.lease.duplicate_suppressed")
+        cache_key = screenshot_obj.get_cache_key()
+        assert screenshot_obj.cache.get(cache_key)["status"] == "Updated"
+        assert screenshot_obj.cache.get(f"{cache_key}_lease") is None
+
+    def test_forced_compute_is_suppressed(
+        self, mocker: MockerFixture, screenshot_obj, stats_logger
+    ):
+        cache_key = screenshot_obj.get_cache_key()
+        screenshot_obj.cache.add(f"{cache_key}_lease", "other worker")
+
+        get_screenshot = mocker.patch(BASE_SCREENSHOT_PATH + ".get_screenshot")
+        screenshot_obj.compute_and_cache(force=True)
+
+        get_screenshot.assert_not_called()
+        stats_logger.incr.assert_called_once_with(
+            "screenshot.lease.duplicate_suppressed"
+        )
+
+    def test_stale_compute_is_recovered(
+        self, mocker: MockerFixture, screenshot_obj, stats_logger
+    ):
+        cache_key = screenshot_obj.get_cache_key()
+        lease_ttl = current_app.config["THUMBNAIL_COMPUTE_LEASE_TTL"]
+        cache_payload = ScreenshotCachePayload(
+            status=StatusValues.COMPUTING,
+            timestamp=(datetime.now() - timedelta(seconds=lease_ttl + 1)).isoformat(),
+        )
+        screenshot_obj.cache.set(cache_key, cache_payload.to_dict())
+        assert cache_payload.should_trigger_task()
+
+        get_screenshot = mocker.patch(
+            BASE_SCREENSHOT_PATH + ".get_screenshot", return_value=b"image"
+        )
+        screenshot_obj.compute_and_cache(force=False)
+
+        get_screenshot.assert_called_once()
+        stats_logger.incr.assert_any_call("screenshot.lease.stale")
+        assert screenshot_obj.cache.get(cache_key)["status"] == "Updated"
+
+    def test_unchanged_data_is_not_computed_again(
+        self, mocker: MockerFixture, screenshot_obj, stats_logger
+    ):
+        get_screenshot = mocker.patch(
+            BASE_SCREENSHOT_PATH + ".get_screenshot", return_value=b"image"
+        )
+        screenshot_obj.compute_and_cache(force=True, data_digest="digest")
+        cache_payload = screenshot_obj.get_from_cache(screenshot_obj.window_size)
+        assert cache_payload.data_digest == "digest"
+
+        screenshot_obj.compute_and_cache(force=True, data_digest="digest")
+        get_screenshot.assert_called_once()
+        stats_logger.incr.assert_any_call("screenshot.data_unchanged")
+
+        screenshot_obj.compute_and_cache(force=True, data_digest="new_digest")
+        assert get_screenshot.call_count == 2
+        cache_payload = screenshot_obj.get_from_cache(screenshot_obj.window_size)
+        assert cache_payload.data_digest == "new_digest"